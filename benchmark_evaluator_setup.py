@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Evaluator Setup Benchmark for CF Name Evaluation System.
+
+This script measures the per-name setup overhead of the KO-EN evaluator
+without calling the OpenAI API. It compares building a new evaluator for
+every name (creating the ChatOpenAI client, rendering the verification
+process and resource text, compiling the prompt) with fetching the shared
+evaluator from the process-wide registry.
+
+Usage:
+    python benchmark_evaluator_setup.py --iterations 200
+"""
+
+import argparse
+import os
+import time
+
+from evaluator_registry import _load_factory, clear_evaluators, get_evaluator
+
+
+def time_per_call(func, iterations: int) -> float:
+    """
+    Time a function over several iterations.
+
+    Args:
+        func: Function to call
+        iterations: Number of calls
+
+    Returns:
+        Average seconds per call
+    """
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    """Run the setup benchmark and print the results."""
+    parser = argparse.ArgumentParser(description="Benchmark evaluator setup cost")
+    parser.add_argument(
+        "--direction", default="KO-EN", help="Evaluator direction to benchmark"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=100, help="Number of simulated names"
+    )
+    args = parser.parse_args()
+
+    # No request is sent, but the client refuses to build without a key
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-placeholder")
+
+    factory = _load_factory(args.direction)
+
+    before = time_per_call(factory, args.iterations)
+
+    clear_evaluators()
+    after = time_per_call(lambda: get_evaluator(args.direction), args.iterations)
+
+    print(f"Evaluator setup for {args.direction} over {args.iterations} names:")
+    print(f"- Build per name (before): {before * 1000:.3f} ms/name")
+    print(f"- Shared from registry (after): {after * 1000:.3f} ms/name")
+    if after > 0:
+        print(f"- Speedup: {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Concurrent Evaluation Engine for CF Name Evaluation System.
+
+This module runs many LLM name evaluations at the same time instead of one
+after another. Evaluations run on a bounded thread pool, request starts are
+limited to a requests-per-minute budget, an estimated token cost is charged
+against a tokens-per-minute budget before each call, and results are
+collected in the same order as the input regardless of completion order.
+
+The module includes:
+- Environment-configurable concurrency and OpenAI rate limit budgets
+- An ordered, rate-limited thread pool runner for evaluation functions
+- Per-item error capture so one failed name does not stop a batch
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from rate_limiting import RateLimiter, TokenBucketLimiter
+
+# Load environment variables
+load_dotenv()
+
+# Concurrency and OpenAI account limits (0 disables a limit)
+MAX_CONCURRENCY = int(os.environ.get("OPENAI_MAX_CONCURRENCY", "4"))
+REQUESTS_PER_MINUTE = float(os.environ.get("OPENAI_REQUESTS_PER_MINUTE", "500"))
+TOKENS_PER_MINUTE = float(os.environ.get("OPENAI_TOKENS_PER_MINUTE", "200000"))
+# Rough token cost of one evaluation (prompt plus structured response)
+TOKENS_PER_EVALUATION = int(os.environ.get("OPENAI_TOKENS_PER_EVALUATION", "2500"))
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    max_concurrency: int = MAX_CONCURRENCY,
+    requests_per_minute: float = REQUESTS_PER_MINUTE,
+    tokens_per_minute: float = TOKENS_PER_MINUTE,
+    estimate_tokens: Optional[Callable[[Any], int]] = None,
+    on_error: Optional[Callable[[Any, Exception], Any]] = None,
+    on_result: Optional[Callable[[int, Any], None]] = None,
+) -> List[Any]:
+    """
+    Apply a function to many items concurrently under rate limits.
+
+    Args:
+        func: Function called once per item (typically one LLM evaluation)
+        items: Items to process
+        max_concurrency: Maximum number of calls in flight at once
+        requests_per_minute: Maximum calls started per minute (0 for unlimited)
+        tokens_per_minute: Maximum estimated tokens spent per minute (0 for unlimited)
+        estimate_tokens: Function estimating an item's token cost
+                         (defaults to TOKENS_PER_EVALUATION per item)
+        on_error: Function building a result for an item whose call raised;
+                  if omitted the exception is re-raised
+        on_result: Function called with (index, result) as soon as each item
+                   finishes, in completion order (e.g. to stream results)
+
+    Returns:
+        Results in the same order as items
+    """
+    if not items:
+        return []
+
+    request_limiter = RateLimiter(requests_per_minute, period=60.0)
+    token_limiter = TokenBucketLimiter(tokens_per_minute, period=60.0)
+
+    def call(index, item):
+        tokens = estimate_tokens(item) if estimate_tokens else TOKENS_PER_EVALUATION
+        token_limiter.acquire(tokens)
+        request_limiter.acquire()
+        try:
+            result = func(item)
+        except Exception as e:
+            if on_error is None:
+                raise
+            result = on_error(item, e)
+        if on_result is not None:
+            on_result(index, result)
+        return result
+
+    workers = max(1, min(max_concurrency, len(items)))
+    if workers == 1:
+        return [call(index, item) for index, item in enumerate(items)]
+
+    # executor.map yields results in input order
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, range(len(items)), items))
+
+
+def print_throughput(count: int, started: float, label: str = "names"):
+    """
+    Print how many items were processed and the resulting throughput.
+
+    Args:
+        count: Number of items processed
+        started: time.perf_counter() value taken before processing
+        label: Noun describing the items
+    """
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"Processed {count} {label} in {elapsed:.1f}s ({rate:.2f} {label}/s)")
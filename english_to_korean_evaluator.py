@@ -10,6 +10,10 @@ transliteration, Korean orthography, and consistency with previous translations.
 The module includes:
 - Functions to evaluate single English names or batches of names
 - Integration with Teamwork for previous translation verification
+- Offline candidate notations (english_transliteration) for the model to choose from
+- Prior notations of similar names from the local termbase index
+- Spelling variants of the name found in the termbase and Teamwork records
+- Consistency checks of the notation against near-identical earlier notations
 - Compliance checking against terminology guidelines
 - Report generation in multiple formats (JSON, HTML, text)
 
@@ -18,9 +22,8 @@ comprehensive evaluation reports that can be used by terminologists and translat
 to ensure compliance with CF naming standards.
 """
 
-import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 from langchain.chains.openai_functions import create_structured_output_chain
@@ -29,9 +32,24 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
+from concurrent_evaluation import MAX_CONCURRENCY, run_concurrently
+from english_transliteration import dictionary_notation, transliteration_candidates
+from evaluator_registry import get_evaluator
+from hangul_phonetic_index import apply_notation_consistency
+from jsonl_stream import ResultStream, rebuild_json, stream_path_for
+from llm_response_cache import cached_llm_call, prompt_fingerprint
+from name_normalization import comparison_key, normalize_name
+from name_similarity import (
+    find_similar_names,
+    find_similar_names_batch,
+    format_similar_names,
+)
+from termbase_index import format_prior_notations, retrieve_prior_notations
+from tiered_evaluation import exact_hit
+
 # Import Teamwork integration if available
 try:
-    from teamwork_integration import verify_name_in_teamwork
+    from teamwork_integration import verify_name_in_teamwork, verify_names_in_teamwork
 
     TEAMWORK_AVAILABLE = True
 except ImportError:
@@ -164,118 +182,141 @@ def create_en_to_ko_evaluator():
     return evaluate_en_to_ko
 
 
-def evaluate_english_name(name: str, check_teamwork: bool = True) -> Dict[str, Any]:
+def format_teamwork_info(teamwork_verification: Optional[Dict[str, Any]]) -> str:
     """
-    Evaluate an English name for Korean notation.
+    Format Teamwork verification results for the evaluation prompt.
 
     Args:
-        name: The English name to evaluate
-        check_teamwork: Whether to check Teamwork for previous translations
+        teamwork_verification: Result of verify_name_in_teamwork
+
+    Returns:
+        Prompt text describing previous Teamwork records
+    """
+    teamwork_info = ""
+    if teamwork_verification["found_in_teamwork"]:
+        teamwork_info = "TEAMWORK VERIFICATION RESULTS:\n"
+
+        # Add previous evaluations if found
+        if teamwork_verification["previous_evaluations"]:
+            teamwork_info += f"- Found {len(teamwork_verification['previous_evaluations'])} previous evaluations in Teamwork\n"
+            for eval in teamwork_verification["previous_evaluations"][
+                :3
+            ]:  # Limit to first 3
+                teamwork_info += f"  * {eval['title']} ({eval['created_at']})\n"
+
+        # Add previous translations if found
+        if teamwork_verification["previous_translations"]:
+            teamwork_info += f"- Found {len(teamwork_verification['previous_translations'])} previous translations in Teamwork\n"
+            for trans in teamwork_verification["previous_translations"][
+                :3
+            ]:  # Limit to first 3
+                teamwork_info += f"  * {trans['title']} ({trans['created_at']})\n"
+
+        teamwork_info += (
+            f"- Verification status: {teamwork_verification['verification_status']}\n"
+        )
+    else:
+        teamwork_info = (
+            "TEAMWORK VERIFICATION RESULTS:\n- No previous records found in Teamwork\n"
+        )
+
+    return teamwork_info
+
+
+def format_candidates_info(candidates: List[str]) -> str:
+    """
+    Format locally generated notation candidates for the evaluation prompt.
+
+    Args:
+        candidates: Candidate notations from english_transliteration
+
+    Returns:
+        Prompt text listing the candidates
+    """
+    if not candidates:
+        return "LOCAL TRANSLITERATION CANDIDATES:\n- None (no rule-based reading)\n"
+    lines = "".join(f"- {candidate}\n" for candidate in candidates)
+    return (
+        "LOCAL TRANSLITERATION CANDIDATES (established notations for known name "
+        "parts, NIKL rule readings for the rest; rule readings are approximate, "
+        "so check them against the rules before choosing one; most likely "
+        f"first):\n{lines}"
+    )
+
+
+def build_dictionary_evaluation(
+    name: str,
+    notation: str,
+    teamwork_verification: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build an evaluation answered from the exception dictionary alone.
+
+    Args:
+        name: The English name that was evaluated
+        notation: Established Korean notation of the name
+        teamwork_verification: Teamwork verification results, if any
 
     Returns:
         Dictionary with evaluation results
     """
-    # Initialize the OpenAI model
-    model_name = os.environ.get("OPENAI_MODEL_NAME", "gpt-4o-mini")
-    temperature = float(os.environ.get("OPENAI_TEMPERATURE", "0"))
-    llm = ChatOpenAI(model_name=model_name, temperature=temperature)
+    evaluation = {
+        "name": name,
+        "korean_notation": notation,
+        "overall_score": 100,
+        "compliant": True,
+        "verification_process": [
+            "- Every part of the name has an established notation in the "
+            "exception dictionary (english_transliteration.py)"
+        ],
+        "recommendations": [],
+        "sources": ["NIKL foreign word notation examples"],
+        "full_evaluation": "",
+        "transliteration_candidates": [notation],
+        "evaluation_tier": "dictionary",
+    }
+    if teamwork_verification:
+        evaluation["teamwork_verification"] = teamwork_verification
+    return evaluation
 
-    # Check Teamwork for previous translations if enabled and available
-    teamwork_info = ""
-    teamwork_verification = None
 
-    if check_teamwork and TEAMWORK_AVAILABLE and os.environ.get("TEAMWORK_API_KEY"):
-        try:
-            teamwork_verification = verify_name_in_teamwork(name)
-            if teamwork_verification["found_in_teamwork"]:
-                teamwork_info = "TEAMWORK VERIFICATION RESULTS:\n"
-
-                # Add previous evaluations if found
-                if teamwork_verification["previous_evaluations"]:
-                    teamwork_info += f"- Found {len(teamwork_verification['previous_evaluations'])} previous evaluations in Teamwork\n"
-                    for eval in teamwork_verification["previous_evaluations"][
-                        :3
-                    ]:  # Limit to first 3
-                        teamwork_info += f"  * {eval['title']} ({eval['created_at']})\n"
-
-                # Add previous translations if found
-                if teamwork_verification["previous_translations"]:
-                    teamwork_info += f"- Found {len(teamwork_verification['previous_translations'])} previous translations in Teamwork\n"
-                    for trans in teamwork_verification["previous_translations"][
-                        :3
-                    ]:  # Limit to first 3
-                        teamwork_info += (
-                            f"  * {trans['title']} ({trans['created_at']})\n"
-                        )
-
-                teamwork_info += f"- Verification status: {teamwork_verification['verification_status']}\n"
-            else:
-                teamwork_info = "TEAMWORK VERIFICATION RESULTS:\n- No previous records found in Teamwork\n"
-        except Exception as e:
-            teamwork_info = f"TEAMWORK VERIFICATION ERROR: {str(e)}\n"
+def evaluate_locally(
+    name: str, teamwork_verification: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Answer an English name from the exception dictionary, if possible.
 
-    # Create the prompt template based on CF guidelines
-    prompt = ChatPromptTemplate.from_template(
-        """
-    You are a Korean terminology specialist following the CF Terminology Management Manual.
-    
-    Evaluate the following English name for proper Korean notation:
-    
-    Name: {name}
-    
-    {teamwork_info}
-    
-    CF GUIDELINES FOR ENGLISH TO KOREAN NAME VERIFICATION:
-    
-    1. Internal Data Verification:
-       - Check CF's own Termbase in SmartCAT Glossary
-       - Verify with CF Teamwork record (post-2019 only): https://cultureflipper.teamwork.com
-       - Check NFLX Lucid TM for notation history: https://localization-lucid.netflix.com/translation/search/?targetLocales=ko
-       - TM Depository: https://docs.google.com/spreadsheets/d/1A8QpynPg5rNJR2MPkPeyw7WDf5x-NiZauU5b2mN6NE0/edit#gid=0
-       - CF Terminology Depository: https://docs.google.com/spreadsheets/d/1bktPGup6cixITi35RBtgZY41pGqguu93m8noGXQ5ffk/edit#gid=670266495&range=AA38
-       - Follow verified notations from previous projects
-    
-    2. Netflix-Specific Resources:
-       - NF Tiloc: https://localization-lucid.netflix.com/titles/search?cl=1
-       - NF Original Credits (NOC): https://docs.google.com/spreadsheets/d/1AxXZfMZGmGMryaH4waVMvKoYps59owtyuBuTI2T_8pQ/edit#gid=554552356
-       - NF Korean Ratings Trackers: https://docs.google.com/spreadsheets/d/1i7RFBjbHaqsLC4LZz50kdvp1bcWbO4eOILc1kml6Gcc/edit#gid=1190947542
-       - NF LRT: https://lrt.netflix.net/
-    
-    3. External Data Verification:
-       - For foreign author names, check Korean translated books
-       - Verify with National Institute of Korean Language (NIKL): https://kornorms.korean.go.kr//example/exampleList.do?regltn_code=0003
-       - Check multiple sources for consistency
-       - For celebrity names, check official Korean notation in media
-       - Cambridge Dictionary: https://dictionary.cambridge.org/dictionary/english/
-       - YouTube (for pronunciation verification): https://www.youtube.com/
-       - Look for consensus on Korean news sites
-    
-    4. Special Rules:
-       - Distinguish between real person names and character names
-       - Use different rules for stage names and group names
-       - Consider phonetic challenges specific to Korean
-       - Real person names may need stricter adherence to standards
-       - Character names may have established translations from books/media
-    
-    Based on these guidelines, please:
-    
-    1. Recommend the proper Korean notation (Hangul) for this name
-    2. Explain the verification process used
-    3. Rate compliance with CF guidelines (0-100)
-    4. Provide justification for your recommendation
-    5. List sources that should be consulted
+    Names with earlier Teamwork records still go to the model, which weighs
+    those records against the dictionary.
+
+    Args:
+        name: The English name to evaluate
+        teamwork_verification: Teamwork verification results, if any
+
+    Returns:
+        Evaluation from the dictionary, or None if the model is needed
     """
+    if teamwork_verification and teamwork_verification.get("found_in_teamwork"):
+        return None
+    notation = dictionary_notation(name)
+    if notation is None:
+        return None
+    return apply_notation_consistency(
+        build_dictionary_evaluation(name, notation, teamwork_verification)
     )
 
-    # Get the evaluation from the model
-    response = prompt.invoke(
-        {"name": name, "teamwork_info": teamwork_info}
-    ).to_messages()
 
-    chain = prompt | llm | StrOutputParser()
-    result = chain.invoke({"name": name, "teamwork_info": teamwork_info})
+def parse_evaluation_text(name: str, result: str) -> Dict[str, Any]:
+    """
+    Parse the free-text evaluation returned by the model.
+
+    Args:
+        name: The English name that was evaluated
+        result: Model response text
 
-    # Parse important information from the result
+    Returns:
+        Dictionary with the extracted evaluation fields
+    """
     lines = result.split("\n")
 
     # Extract key information
@@ -356,8 +397,7 @@ def evaluate_english_name(name: str, check_teamwork: bool = True) -> Dict[str, A
                     sources.append(lines[j].strip())
                 j += 1
 
-    # Construct the result dictionary
-    evaluation_result = {
+    return {
         "name": name,
         "korean_notation": korean_notation,
         "overall_score": compliance_score,
@@ -368,43 +408,316 @@ def evaluate_english_name(name: str, check_teamwork: bool = True) -> Dict[str, A
         "full_evaluation": result,
     }
 
-    # Add Teamwork verification data if available
-    if teamwork_verification:
-        evaluation_result["teamwork_verification"] = teamwork_verification
 
-    return evaluation_result
+# Prompt used to evaluate English names for Korean notation
+EN_TO_KO_PROMPT_TEMPLATE = """
+    You are a Korean terminology specialist following the CF Terminology Management Manual.
+    
+    Evaluate the following English name for proper Korean notation:
+    
+    Name: {name}
+    
+    {teamwork_info}
+    
+    {candidates_info}
+    
+    {termbase_info}
+    
+    CF GUIDELINES FOR ENGLISH TO KOREAN NAME VERIFICATION:
+    
+    1. Internal Data Verification:
+       - Check CF's own Termbase in SmartCAT Glossary
+       - Verify with CF Teamwork record (post-2019 only): https://cultureflipper.teamwork.com
+       - Check NFLX Lucid TM for notation history: https://localization-lucid.netflix.com/translation/search/?targetLocales=ko
+       - TM Depository: https://docs.google.com/spreadsheets/d/1A8QpynPg5rNJR2MPkPeyw7WDf5x-NiZauU5b2mN6NE0/edit#gid=0
+       - CF Terminology Depository: https://docs.google.com/spreadsheets/d/1bktPGup6cixITi35RBtgZY41pGqguu93m8noGXQ5ffk/edit#gid=670266495&range=AA38
+       - Follow verified notations from previous projects
+    
+    2. Netflix-Specific Resources:
+       - NF Tiloc: https://localization-lucid.netflix.com/titles/search?cl=1
+       - NF Original Credits (NOC): https://docs.google.com/spreadsheets/d/1AxXZfMZGmGMryaH4waVMvKoYps59owtyuBuTI2T_8pQ/edit#gid=554552356
+       - NF Korean Ratings Trackers: https://docs.google.com/spreadsheets/d/1i7RFBjbHaqsLC4LZz50kdvp1bcWbO4eOILc1kml6Gcc/edit#gid=1190947542
+       - NF LRT: https://lrt.netflix.net/
+    
+    3. External Data Verification:
+       - For foreign author names, check Korean translated books
+       - Verify with National Institute of Korean Language (NIKL): https://kornorms.korean.go.kr//example/exampleList.do?regltn_code=0003
+       - Check multiple sources for consistency
+       - For celebrity names, check official Korean notation in media
+       - Cambridge Dictionary: https://dictionary.cambridge.org/dictionary/english/
+       - YouTube (for pronunciation verification): https://www.youtube.com/
+       - Look for consensus on Korean news sites
+    
+    4. Special Rules:
+       - Distinguish between real person names and character names
+       - Use different rules for stage names and group names
+       - Consider phonetic challenges specific to Korean
+       - Real person names may need stricter adherence to standards
+       - Character names may have established translations from books/media
+    
+    Based on these guidelines, please:
+    
+    1. Recommend the proper Korean notation (Hangul) for this name on a line starting with "Korean notation:"
+       (choose one of the local candidates when one is correct, and follow a
+       matching prior notation from the local termbase)
+    2. Explain the verification process used
+    3. Rate compliance with CF guidelines (0-100)
+    4. Provide justification for your recommendation
+    5. List sources that should be consulted
+    """
+
 
+class EnToKoEvaluator:
+    """
+    Long-lived evaluator for English to Korean name notation.
+
+    The ChatOpenAI client (and its HTTP connection pool), the prompt template
+    and the chain are created once in the constructor and reused for every
+    name. Use evaluator_registry.get_evaluator("EN-KO") to share one instance
+    across the process.
+    """
+
+    def __init__(
+        self, model_name: Optional[str] = None, temperature: Optional[float] = None
+    ):
+        """
+        Initialize the evaluator.
+
+        Args:
+            model_name: OpenAI model name (defaults to OPENAI_MODEL_NAME)
+            temperature: Sampling temperature (defaults to OPENAI_TEMPERATURE)
+        """
+        if model_name is None:
+            model_name = os.environ.get("OPENAI_MODEL_NAME", "gpt-4o-mini")
+        if temperature is None:
+            temperature = float(os.environ.get("OPENAI_TEMPERATURE", "0"))
+        self.model_name = model_name
+        self.temperature = temperature
+        self.llm = ChatOpenAI(model_name=model_name, temperature=temperature)
+
+        # Create the prompt template based on CF guidelines
+        self.prompt = ChatPromptTemplate.from_template(EN_TO_KO_PROMPT_TEMPLATE)
+        self.prompt_hash = prompt_fingerprint(self.prompt)
+        self.chain = self.prompt | self.llm | StrOutputParser()
+
+    def verify_in_teamwork(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up previous Teamwork records for a name.
+
+        Args:
+            name: The English name to look up
+
+        Returns:
+            Teamwork verification results, or None if unavailable
+        """
+        if not (TEAMWORK_AVAILABLE and os.environ.get("TEAMWORK_API_KEY")):
+            return None
+        return verify_name_in_teamwork(name)
+
+    def evaluate(
+        self,
+        name: str,
+        check_teamwork: bool = True,
+        local_tiers: bool = True,
+        similar_names: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an English name for Korean notation.
+
+        Args:
+            name: The English name to evaluate
+            check_teamwork: Whether to check Teamwork for previous translations
+            local_tiers: Whether to try the exact-hit and dictionary tiers
+                         before the model (False when tiered_evaluation has
+                         already tried them)
+            similar_names: Similar known names already found for the name by
+                           a batch lookup (looked up here if omitted)
+
+        Returns:
+            Dictionary with evaluation results
+        """
+        # Names recorded verbatim in the local termbase never reach the model
+        if local_tiers:
+            known = exact_hit(name, "EN-KO", check_teamwork=False)
+            if known is not None:
+                return known
+
+        # Check Teamwork for previous translations if enabled and available
+        teamwork_info = ""
+        teamwork_verification = None
+
+        if check_teamwork:
+            try:
+                teamwork_verification = self.verify_in_teamwork(name)
+                if teamwork_verification is not None:
+                    teamwork_info = format_teamwork_info(teamwork_verification)
+            except Exception as e:
+                teamwork_info = f"TEAMWORK VERIFICATION ERROR: {str(e)}\n"
+
+        # Names made entirely of dictionary entries need no model call
+        if local_tiers:
+            local = evaluate_locally(name, teamwork_verification)
+            if local is not None:
+                return local
+
+        # Otherwise the model adjudicates between the local candidates
+        candidates = transliteration_candidates(name)
+        candidates_info = format_candidates_info(candidates)
+        termbase_matches = retrieve_prior_notations(name)
+        termbase_info = format_prior_notations(termbase_matches)
+        if similar_names is None:
+            similar_names = find_similar_names(name)
+        termbase_info += format_similar_names(similar_names, termbase_matches)
+
+        # Get the evaluation from the model (or the response cache)
+        result = cached_llm_call(
+            lambda: self.chain.invoke(
+                {
+                    "name": name,
+                    "teamwork_info": teamwork_info,
+                    "candidates_info": candidates_info,
+                    "termbase_info": termbase_info,
+                }
+            ),
+            name,
+            "EN-KO",
+            self.model_name,
+            self.temperature,
+            self.prompt_hash,
+            teamwork_info + candidates_info + termbase_info,
+        )
+        evaluation_result = parse_evaluation_text(name, result)
+        evaluation_result["transliteration_candidates"] = candidates
+        evaluation_result["termbase_matches"] = termbase_matches
+        evaluation_result["similar_names"] = similar_names
+        evaluation_result["evaluation_tier"] = "llm"
+
+        # Keep the model's notation; a candidate only replaces it when the two
+        # are the same name written with different spacing or punctuation
+        notation = normalize_name(evaluation_result["korean_notation"])
+        matching = [
+            c for c in candidates if comparison_key(c) == comparison_key(notation)
+        ]
+        evaluation_result["korean_notation"] = matching[0] if matching else notation
+        # Rule readings are approximate and never stand in for a missing answer
+        evaluation_result["notation_found"] = bool(notation)
+        if not notation:
+            evaluation_result["compliant"] = False
+            evaluation_result["recommendations"].append(
+                "No notation found in the model response; review this name " "manually"
+            )
+
+        # Add Teamwork verification data if available
+        if teamwork_verification:
+            evaluation_result["teamwork_verification"] = teamwork_verification
+
+        # Flag disagreements with near-identical notations in earlier records
+        return apply_notation_consistency(evaluation_result)
+
+    def evaluate_many(
+        self,
+        names: List[str],
+        check_teamwork: bool = True,
+        max_concurrency: int = MAX_CONCURRENCY,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many English names concurrently.
+
+        Args:
+            names: English names to evaluate
+            check_teamwork: Whether to check Teamwork for previous translations
+            max_concurrency: Maximum number of evaluations in flight at once
+            on_result: Function called with (index, result) as each name finishes
+
+        Returns:
+            List of evaluation results in input order
+        """
+        # Verify the whole batch in Teamwork up front so per-name lookups are
+        # served from the verification cache
+        if check_teamwork and TEAMWORK_AVAILABLE and os.environ.get("TEAMWORK_API_KEY"):
+            try:
+                verify_names_in_teamwork(names)
+            except Exception as e:
+                print(f"Batch Teamwork verification failed: {e}")
+
+        # Look up the similar names of the whole batch in one pass
+        similar = dict(zip(names, find_similar_names_batch(names)))
+
+        def evaluate_one(name: str) -> Dict[str, Any]:
+            print(f"Evaluating English name: {name}")
+            return self.evaluate(name, check_teamwork, similar_names=similar[name])
+
+        def evaluation_error(name: str, e: Exception) -> Dict[str, Any]:
+            print(f"Error evaluating {name}: {e}")
+            return {
+                "name": name,
+                "error": str(e),
+                "compliant": False,
+                "overall_score": 0,
+            }
 
-def evaluate_english_names(names: List[str], check_teamwork: bool = True) -> List[Dict]:
+        return run_concurrently(
+            evaluate_one,
+            names,
+            max_concurrency=max_concurrency,
+            on_error=evaluation_error,
+            on_result=on_result,
+        )
+
+
+def evaluate_english_name(
+    name: str,
+    check_teamwork: bool = True,
+    local_tiers: bool = True,
+    similar_names: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Evaluate an English name for Korean notation.
+
+    Args:
+        name: The English name to evaluate
+        check_teamwork: Whether to check Teamwork for previous translations
+        local_tiers: Whether to try the exact-hit and dictionary tiers first
+        similar_names: Similar known names already found for the name by a
+                       batch lookup (looked up if omitted)
+
+    Returns:
+        Dictionary with evaluation results
+    """
+    return get_evaluator("EN-KO").evaluate(
+        name, check_teamwork, local_tiers, similar_names
+    )
+
+
+def evaluate_english_names(
+    names: List[str],
+    check_teamwork: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> List[Dict]:
     """
     Evaluate multiple English names for proper Korean notation.
 
     Args:
         names: List of English names to evaluate
         check_teamwork: Whether to check Teamwork for previous translations
+        max_concurrency: Maximum number of evaluations in flight at once
 
     Returns:
         List of dictionaries with evaluation results
     """
-    results = []
-
-    for name in names:
-        print(f"Evaluating English name: {name}")
-        try:
-            result = evaluate_english_name(name, check_teamwork)
-            results.append(result)
-        except Exception as e:
-            print(f"Error evaluating {name}: {e}")
-            results.append(
-                {"name": name, "error": str(e), "compliant": False, "overall_score": 0}
-            )
-
-    # Save results to file
-    os.makedirs("reports", exist_ok=True)
-    with open(
-        "reports/english_name_evaluation_results.json", "w", encoding="utf-8"
-    ) as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # Stream each result to disk as it finishes
+    results_path = "reports/english_name_evaluation_results.json"
+    with ResultStream(stream_path_for(results_path)) as stream:
+        results = get_evaluator("EN-KO").evaluate_many(
+            names,
+            check_teamwork,
+            max_concurrency=max_concurrency,
+            on_result=stream.write,
+        )
+
+    # Rebuild the legacy JSON file from the stream
+    rebuild_json(stream.path, results_path)
 
     return results
 
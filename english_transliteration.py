@@ -0,0 +1,730 @@
+#!/usr/bin/env python
+"""
+English to Hangul Transliteration for CF Name Evaluation System.
+
+This module proposes Korean notations for English names offline, following
+the NIKL foreign word notation rules (외래어 표기법). It lets the EN-KO
+evaluator answer common names without a model call and give the model a short
+list of candidates to choose from for the rest.
+
+Notations come from two places:
+- An exception dictionary of established notations for common given names
+  and surnames (NIKL examples first, common media spellings after them).
+  Entries in data/foreign_name_notations.json, if present, extend it.
+- A rule engine that maps English spelling to phonemes and the phonemes to
+  Hangul with the NIKL phoneme table. The rules cover final voiceless stops
+  after short vowels as 받침 (gap -> 갭), ㅡ insertion after other final
+  consonants, dropped postvocalic r, 'ㄹㄹ' for [l] between vowels, the
+  [w]/[j] glide combinations, 츠 and 즈 for final [ts] and [dz], silent e
+  before a final s (Gates, Miles), a syllabic final -en/-on after d and s
+  (Tyson -> 타이슨), [ə] in a final -ton and -an (Clinton -> 클린턴,
+  Nathan -> 네이선) and in later closed syllables with o, [ei] for a in the
+  open first syllable of a two-syllable name, [z] for s between vowels
+  outside a final -son (Susan -> 수전), [wɔ] for wa (Washington -> 워싱턴)
+  and [w] after a consonant in its own syllable (Swift -> 스위프트).
+
+English spelling is ambiguous, so the rule engine returns a primary reading
+and a few single-substitution variants (e.g. the two readings of "o").
+
+The module includes:
+- The exception dictionary and its loader
+- Spelling-to-phoneme rules with alternative readings
+- Phoneme-to-Hangul syllable composition following the NIKL table
+- Helpers returning a dictionary notation or ranked candidate notations
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from terminologists_manual_links import DATA_DIR
+
+# Extra exception dictionary entries maintained by terminologists
+NOTATIONS_FILE = os.path.join(DATA_DIR, "foreign_name_notations.json")
+
+# Maximum number of candidates returned per name
+MAX_CANDIDATES = 4
+
+# Established notations of common name parts (NIKL example first)
+NAME_NOTATIONS: Dict[str, Tuple[str, ...]] = {
+    "adam": ("애덤", "아담"),
+    "alexander": ("알렉산더",),
+    "alice": ("앨리스",),
+    "amanda": ("어맨다", "아만다"),
+    "andrew": ("앤드루", "앤드류"),
+    "anderson": ("앤더슨",),
+    "anna": ("애나", "안나"),
+    "anne": ("앤",),
+    "anthony": ("앤서니",),
+    "benjamin": ("벤저민", "벤자민"),
+    "biden": ("바이든",),
+    "brad": ("브래드",),
+    "brown": ("브라운",),
+    "charles": ("찰스",),
+    "charlotte": ("샬럿",),
+    "chloe": ("클로이",),
+    "chris": ("크리스",),
+    "christopher": ("크리스토퍼",),
+    "clark": ("클라크",),
+    "cruise": ("크루즈",),
+    "daniel": ("대니얼", "다니엘"),
+    "david": ("데이비드",),
+    "davis": ("데이비스",),
+    "downey": ("다우니",),
+    "dylan": ("딜런",),
+    "edward": ("에드워드",),
+    "elizabeth": ("엘리자베스",),
+    "emily": ("에밀리",),
+    "emma": ("에마", "엠마"),
+    "george": ("조지",),
+    "harry": ("해리",),
+    "hathaway": ("해서웨이",),
+    "hemsworth": ("헴스워스",),
+    "henry": ("헨리",),
+    "jack": ("잭",),
+    "james": ("제임스",),
+    "jane": ("제인",),
+    "jason": ("제이슨",),
+    "jennifer": ("제니퍼",),
+    "jessica": ("제시카",),
+    "jobs": ("잡스",),
+    "john": ("존",),
+    "johnson": ("존슨",),
+    "jonathan": ("조너선", "조나단"),
+    "jones": ("존스",),
+    "joseph": ("조지프", "조셉"),
+    "jr": ("주니어",),
+    "kate": ("케이트",),
+    "keanu": ("키아누",),
+    "lawrence": ("로런스", "로렌스"),
+    "lee": ("리",),
+    "lisa": ("리사",),
+    "mark": ("마크",),
+    "mary": ("메리",),
+    "matthew": ("매슈", "매튜"),
+    "michael": ("마이클",),
+    "miller": ("밀러",),
+    "nathan": ("네이선",),
+    "nicole": ("니콜",),
+    "olivia": ("올리비아",),
+    "paul": ("폴",),
+    "peter": ("피터",),
+    "pitt": ("피트",),
+    "richard": ("리처드", "리차드"),
+    "robert": ("로버트",),
+    "rosemary": ("로즈메리",),
+    "ryan": ("라이언",),
+    "sarah": ("세라", "사라"),
+    "scarlett": ("스칼릿", "스칼렛"),
+    "smith": ("스미스",),
+    "sophia": ("소피아",),
+    "sr": ("시니어",),
+    "steven": ("스티븐",),
+    "swift": ("스위프트",),
+    "taylor": ("테일러",),
+    "thomas": ("토머스", "토마스"),
+    "thompson": ("톰프슨",),
+    "tom": ("톰",),
+    "washington": ("워싱턴",),
+    "watson": ("왓슨",),
+    "william": ("윌리엄",),
+    "williams": ("윌리엄스",),
+    "wilson": ("윌슨",),
+    "zoe": ("조이",),
+}
+
+# Hangul jamo in Unicode composition order
+INITIAL_JAMO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+MEDIAL_JAMO = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+FINAL_JAMO = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# NIKL table: consonant phonemes before a vowel
+ONSETS = {
+    "p": "ㅍ", "b": "ㅂ", "t": "ㅌ", "d": "ㄷ", "k": "ㅋ", "g": "ㄱ",
+    "f": "ㅍ", "v": "ㅂ", "th": "ㅅ", "dh": "ㄷ", "s": "ㅅ", "z": "ㅈ",
+    "sh": "ㅅ", "zh": "ㅈ", "ch": "ㅊ", "j": "ㅈ", "m": "ㅁ", "n": "ㄴ",
+    "ng": "ㅇ", "l": "ㄹ", "r": "ㄹ", "h": "ㅎ",
+}  # fmt: skip
+
+# Vowel phonemes; diphthongs are written as two syllables except [ou]
+VOWELS = {
+    "i": ("ㅣ",), "I": ("ㅣ",), "e": ("ㅔ",), "ae": ("ㅐ",), "a": ("ㅏ",),
+    "uh": ("ㅓ",), "schwa": ("ㅓ",), "er": ("ㅓ",), "o": ("ㅗ",), "u": ("ㅜ",),
+    "ei": ("ㅔ", "ㅣ"), "ai": ("ㅏ", "ㅣ"), "oi": ("ㅗ", "ㅣ"),
+    "au": ("ㅏ", "ㅜ"), "ou": ("ㅗ",), "yu": ("ㅠ",),
+}  # fmt: skip
+
+# Medials after a [w] or [j] glide
+W_GLIDES = {"ㅏ": "ㅘ", "ㅐ": "ㅙ", "ㅔ": "ㅞ", "ㅣ": "ㅟ", "ㅓ": "ㅝ", "ㅗ": "ㅝ"}
+Y_GLIDES = {"ㅏ": "ㅑ", "ㅐ": "ㅒ", "ㅔ": "ㅖ", "ㅓ": "ㅕ", "ㅗ": "ㅛ", "ㅜ": "ㅠ"}
+
+# Short vowels after which a final [p], [t], [k] becomes a 받침
+SHORT_VOWELS = {"I", "e", "ae", "uh", "o", "schwa"}
+STOP_FINALS = {"p": "ㅂ", "t": "ㅅ", "k": "ㄱ"}
+SONORANT_FINALS = {"m": "ㅁ", "n": "ㄴ", "ng": "ㅇ", "l": "ㄹ"}
+
+LETTER_VOWELS = "aeiou"
+
+# Spellings of a single consonant that do not close the syllable before them
+CONSONANT_DIGRAPHS = ("th", "sh", "ch", "ph")
+
+# Spelling rules tried at each position, longest first:
+# (spelling, readings, condition); the first reading is the primary one
+CONSONANT_RULES: List[Tuple[str, Tuple[Tuple[str, ...], ...], str]] = [
+    ("tch", (("ch",),), ""),
+    ("sch", (("sh",),), ""),
+    ("chr", (("k", "r"),), ""),
+    ("ght", (("t",),), ""),
+    ("ch", (("ch",), ("k",)), ""),
+    ("sh", (("sh",),), ""),
+    ("ph", (("f",),), ""),
+    ("th", (("th",), ("t",)), ""),
+    ("gh", (("g",),), "initial"),
+    ("gh", ((),), ""),
+    ("ck", (("k",),), ""),
+    ("qu", (("k", "w"),), ""),
+    ("wh", (("h", "w"),), ""),
+    ("wr", (("r",),), "initial"),
+    ("kn", (("n",),), "initial"),
+    ("mc", (("m", "ae", "k"),), "initial"),
+    ("nk", (("ng", "k"),), ""),
+    ("ng", (("ng",),), ""),
+    ("x", (("z",),), "initial"),
+    ("x", (("k", "s"),), ""),
+    ("c", (("s",),), "front"),
+    ("c", (("k",),), ""),
+    ("g", (("j",), ("g",)), "front"),
+    ("g", (("g",),), ""),
+    ("y", (("y",),), "glide"),
+    ("w", (("w",),), "w_glide"),
+    ("s", (("z",), ("s",)), "final_se"),
+    ("s", (("z",), ("s",)), "intervocalic"),
+]
+
+VOWEL_RULES: List[Tuple[str, Tuple[Tuple[str, ...], ...], str]] = [
+    ("eau", (("ou",),), ""),
+    ("igh", (("ai",),), ""),
+    ("ear", (("i", "schwa"), ("er",)), ""),
+    ("ee", (("i",),), ""),
+    ("ea", (("i",), ("e",)), ""),
+    ("oo", (("u",),), ""),
+    ("ou", (("au",), ("u",)), ""),
+    ("ow", (("ou",), ("au",)), ""),
+    ("oa", (("ou",),), ""),
+    ("ai", (("ei",),), ""),
+    ("ay", (("ei",),), ""),
+    ("ey", (("i",),), "final"),
+    ("ey", (("ei",),), ""),
+    ("oe", (("ou",),), "final"),
+    ("ie", (("i",),), ""),
+    ("ei", (("ei",), ("ai",)), ""),
+    ("oi", (("oi",),), ""),
+    ("oy", (("oi",),), ""),
+    ("au", (("o",),), ""),
+    ("aw", (("o",),), "closed"),
+    ("ew", (("yu",),), ""),
+    ("ue", (("u",),), ""),
+    ("eu", (("yu",),), ""),
+    ("ar", (("o",), ("a",)), "after_w"),
+    ("ar", (("a",),), "r_coda"),
+    ("or", (("o",),), "r_coda"),
+    ("er", (("er",),), "r_coda"),
+    ("ir", (("er",),), "r_coda"),
+    ("ur", (("er",),), "r_coda"),
+    ("yr", (("er",),), "r_coda"),
+    ("en", (("n",), ("schwa", "n")), "syllabic"),
+    ("on", (("n",), ("schwa", "n")), "syllabic"),
+    ("on", (("schwa", "n"),), "unstressed"),
+    ("an", (("schwa", "n"), ("ae", "n")), "weak_final"),
+]
+
+# Readings of single vowel letters: (closed syllable, before silent final e)
+SINGLE_VOWELS = {
+    "a": ((("ae",), ("a",)), (("ei",),)),
+    "e": ((("e",),), (("i",),)),
+    "i": ((("I",), ("ai",)), (("ai",),)),
+    "o": ((("o",), ("ou",)), (("ou",),)),
+    "u": ((("uh",), ("u",), ("yu",)), (("yu",), ("u",))),
+    "y": ((("I",),), (("ai",),)),
+}
+
+
+@lru_cache(maxsize=1)
+def load_name_notations() -> Dict[str, Tuple[str, ...]]:
+    """
+    Load the exception dictionary, extended by NOTATIONS_FILE if present.
+
+    Returns:
+        Dictionary mapping lowercase name parts to notations, preferred first
+    """
+    notations = dict(NAME_NOTATIONS)
+    if os.path.exists(NOTATIONS_FILE):
+        try:
+            with open(NOTATIONS_FILE, "r", encoding="utf-8") as f:
+                extra = json.load(f)
+            for word, values in extra.items():
+                if isinstance(values, str):
+                    values = [values]
+                notations[word.lower()] = tuple(values)
+        except (OSError, ValueError) as e:
+            print(f"Error loading {NOTATIONS_FILE}: {e}")
+    return notations
+
+
+def split_name_words(name: str) -> List[str]:
+    """
+    Split an English name into lowercase words.
+
+    Args:
+        name: English name (e.g. "Robert Downey Jr.")
+
+    Returns:
+        Words with punctuation removed
+    """
+    return [w for w in re.split(r"[\s\-]+", re.sub(r"[.,']", "", name.lower())) if w]
+
+
+def _condition_holds(condition: str, word: str, start: int, end: int) -> bool:
+    before = word[start - 1] if start > 0 else ""
+    after = word[end] if end < len(word) else ""
+    if not condition:
+        return True
+    if condition == "initial":
+        return start == 0
+    if condition == "final":
+        return end == len(word)
+    if condition == "front":
+        return after in ("e", "i", "y")
+    if condition == "glide":
+        return after in LETTER_VOWELS and (start == 0 or before in LETTER_VOWELS)
+    if condition == "w_glide":
+        return after != "" and after in LETTER_VOWELS
+    if condition == "closed":
+        return after == "" or after not in LETTER_VOWELS + "y"
+    if condition == "intervocalic":
+        return (
+            start > 0
+            and after != ""
+            and before in LETTER_VOWELS + "y"
+            and after in LETTER_VOWELS + "y"
+            and word[end:] not in ("on", "en")
+        )
+    if condition == "final_se":
+        return before in LETTER_VOWELS and word[end:] == "e" and start > 1
+    if condition == "r_coda":
+        return after not in LETTER_VOWELS + "yr" or after == ""
+    if condition == "after_w":
+        return _after_w(word, start) and _condition_holds("r_coda", word, start, end)
+    if condition == "syllabic":
+        return end == len(word) and start >= 2 and before in "ds"
+    if condition == "unstressed":
+        return end == len(word) and start >= 2 and before == "t"
+    if condition == "weak_final":
+        return (
+            end == len(word)
+            and start >= 2
+            and before not in LETTER_VOWELS + "y"
+            and any(c in LETTER_VOWELS + "y" for c in word[: start - 1])
+        )
+    return False
+
+
+def _without_plural_s(word: str) -> str:
+    """Drop a final s after a silent e whose "es" is not pronounced [iz]."""
+    if (
+        len(word) > 3
+        and word.endswith("es")
+        and word[-3] not in LETTER_VOWELS + "cgsxz"
+        and word[-4:-2] not in ("ch", "sh")
+    ):
+        return word[:-1]
+    return word
+
+
+def _is_silent_final_e(word: str, i: int) -> bool:
+    """Whether the "e" at position i is a silent final e (also before a final s)."""
+    word = _without_plural_s(word)
+    return (
+        i == len(word) - 1
+        and i >= 2
+        and word[i - 1] not in LETTER_VOWELS
+        and any(c in LETTER_VOWELS + "y" for c in word[: i - 1])
+    )
+
+
+def _magic_e(word: str, i: int) -> bool:
+    """Whether the vowel at position i is lengthened by a silent final e."""
+    rest = _without_plural_s(word)[i + 1 :]
+    return (
+        len(rest) in (2, 3)
+        and rest[-1] == "e"
+        and rest[0] not in LETTER_VOWELS
+        and (len(rest) == 2 or rest[1] in "lr")
+    )
+
+
+def _open_syllable(word: str, i: int) -> bool:
+    """Whether the vowel at position i is followed by one consonant and a vowel."""
+    return (
+        i + 2 < len(word)
+        and word[i + 1] not in LETTER_VOWELS + "y"
+        and word[i + 2] in LETTER_VOWELS
+    )
+
+
+def _after_w(word: str, i: int) -> bool:
+    """Whether the vowel at position i follows a [w] glide (Washington, Edward)."""
+    return i > 0 and word[i - 1] == "w" and (i == 1 or word[i - 2] not in LETTER_VOWELS)
+
+
+def _stressed_open_syllable(word: str, i: int) -> bool:
+    """Whether the vowel at position i opens the first of two syllables (Nathan)."""
+    if i == 0 or any(c in LETTER_VOWELS for c in word[:i]):
+        return False
+    consonant = 2 if word[i + 1 : i + 3] in CONSONANT_DIGRAPHS else 1
+    following = word[i + 1 + consonant : i + 2 + consonant]
+    if word[i + 1 : i + 2] in ("", *LETTER_VOWELS, "l", "r", "w", "y"):
+        return False
+    if not following or following not in LETTER_VOWELS:
+        return False
+    base = _without_plural_s(word)
+    if base.endswith("e") and _is_silent_final_e(word, len(base) - 1):
+        base = base[:-1]
+    return len(re.findall(r"[aeiouy]+", base[i:])) == 2
+
+
+def _unstressed_vowel(word: str, i: int) -> bool:
+    """Whether the vowel at position i is in a closed syllable after the first."""
+    return (
+        0 < i < len(word) - 1
+        and word[i - 1] not in LETTER_VOWELS
+        and any(c in LETTER_VOWELS + "y" for c in word[: i - 1])
+        and not _open_syllable(word, i)
+        and not _magic_e(word, i)
+        and word[i + 1 : i + 3] not in CONSONANT_DIGRAPHS
+    )
+
+
+def spelling_to_phonemes(word: str) -> List[Tuple[Tuple[str, ...], ...]]:
+    """
+    Convert the spelling of one word into phoneme chunks.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        One tuple of alternative readings per spelling chunk, primary first
+    """
+    chunks: List[Tuple[Tuple[str, ...], ...]] = []
+    i = 0
+    while i < len(word):
+        char = word[i]
+
+        # Doubled consonants are read once
+        if i > 0 and char == word[i - 1] and char not in LETTER_VOWELS + "c":
+            i += 1
+            continue
+
+        if char == "e" and _is_silent_final_e(word, i):
+            i += 1
+            continue
+
+        # Final "le" after a consonant reads as [əl]
+        if word[i:] == "le" and i > 0 and word[i - 1] not in LETTER_VOWELS:
+            chunks.append((("schwa", "l"),))
+            break
+
+        matched = False
+        rules = VOWEL_RULES if char in LETTER_VOWELS + "y" else CONSONANT_RULES
+        if char in ("y", "w"):
+            rules = CONSONANT_RULES + VOWEL_RULES
+        for spelling, readings, condition in rules:
+            end = i + len(spelling)
+            if word.startswith(spelling, i) and _condition_holds(
+                condition, word, i, end
+            ):
+                chunks.append(readings)
+                i = end
+                matched = True
+                break
+        if matched:
+            continue
+
+        if char in SINGLE_VOWELS:
+            closed, long = SINGLE_VOWELS[char]
+            if char == "y" and i == len(word) - 1:
+                chunks.append((("i",),))
+            elif char == "y" and _open_syllable(word, i):
+                chunks.append(long)
+            elif char == "a" and i == len(word) - 1:
+                chunks.append((("a",),))
+            elif char == "a" and _after_w(word, i) and not _magic_e(word, i):
+                chunks.append((("o",), ("a",), ("ae",)))
+            elif char == "a" and _stressed_open_syllable(word, i):
+                chunks.append((("ei",), ("ae",), ("a",)))
+            elif char == "o" and _unstressed_vowel(word, i):
+                chunks.append((("schwa",), ("o",)))
+            else:
+                chunks.append(long if _magic_e(word, i) else closed)
+        elif char in ONSETS:
+            chunks.append(((char,),))
+        i += 1
+    return chunks
+
+
+def _compose(initial: str, medial: str, final: str = " ") -> str:
+    return chr(
+        0xAC00
+        + (INITIAL_JAMO.index(initial) * 21 + MEDIAL_JAMO.index(medial)) * 28
+        + FINAL_JAMO.index(final)
+    )
+
+
+def phonemes_to_hangul(phonemes: Sequence[str]) -> str:
+    """
+    Write a phoneme sequence in Hangul following the NIKL phoneme table.
+
+    Args:
+        phonemes: Phonemes of one word
+
+    Returns:
+        Hangul notation of the word
+    """
+    syllables: List[List[str]] = []  # [initial, medial, final]
+
+    def add_vowel(onset: str, glide: Optional[str], vowel: str):
+        medials = VOWELS[vowel]
+        first = medials[0]
+        if onset in ("ㅈ", "ㅊ") and glide == "y":
+            glide = None
+        if glide == "w":
+            first = W_GLIDES.get(first, first)
+        elif glide == "y":
+            first = Y_GLIDES.get(first, first)
+        syllables.append([onset, first, " "])
+        for extra in medials[1:]:
+            syllables.append(["ㅇ", extra, " "])
+
+    def add_schwa_syllable(onset: str, medial: str = "ㅡ"):
+        syllables.append([onset, medial, " "])
+
+    # [ju] after [r], [l] and the palatals is written without the glide
+    phonemes = [
+        (
+            "u"
+            if p == "yu" and i and phonemes[i - 1] in ("r", "l", "j", "ch", "sh", "zh")
+            else p
+        )
+        for i, p in enumerate(phonemes)
+    ]
+
+    # Final [ts] and [dz] are written 츠 and 즈
+    merged: List[str] = []
+    for i, p in enumerate(phonemes):
+        following = phonemes[i + 1] if i + 1 < len(phonemes) else None
+        if (
+            p in ("s", "z")
+            and merged
+            and merged[-1] in ("t", "d")
+            and following is None
+        ):
+            merged[-1] = "ts" if merged[-1] == "t" else "dz"
+            continue
+        merged.append(p)
+    phonemes = merged
+
+    n = len(phonemes)
+    i = 0
+    while i < n:
+        p = phonemes[i]
+        if p in VOWELS:
+            add_vowel("ㅇ", None, p)
+            i += 1
+            continue
+
+        # Glide or consonant, possibly followed by a glide, then a vowel
+        j = i + 1
+        glide = None
+        if p in ("w", "y"):
+            if j < n and phonemes[j] in VOWELS:
+                add_vowel("ㅇ", p, phonemes[j])
+                i = j + 1
+            else:
+                add_schwa_syllable("ㅇ", "ㅜ" if p == "w" else "ㅣ")
+                i += 1
+            continue
+        # [w] after consonants other than [g], [k] and [h] starts its own
+        # syllable (swing -> 스윙)
+        if (
+            j + 1 < n
+            and phonemes[j] in ("w", "y")
+            and phonemes[j + 1] in VOWELS
+            and (phonemes[j] == "y" or p in ("g", "k", "h"))
+        ):
+            glide = phonemes[j]
+            j += 1
+
+        if j < n and phonemes[j] in VOWELS:
+            # [l] before a vowel after a vowel or a consonant is written 'ㄹㄹ'
+            previous = syllables[-1] if syllables else None
+            if p == "l" and previous and previous[2] == " ":
+                previous[2] = "ㄹ"
+            if p == "sh" and phonemes[j] not in ("i", "I"):
+                glide = "y"
+            add_vowel(ONSETS[p], glide, phonemes[j])
+            i = j + 1
+            continue
+
+        # The consonant closes a syllable
+        following = phonemes[i + 1] if i + 1 < n else None
+        previous = syllables[-1] if syllables else None
+        open_syllable = previous is not None and previous[2] == " "
+        if p in SONORANT_FINALS and open_syllable:
+            previous[2] = SONORANT_FINALS[p]
+        elif p in ("m", "n") and previous is not None and previous[2] == "ㄹ":
+            # [l] before a final nasal is also written 'ㄹㄹ' (film -> 필름)
+            syllables.append(["ㄹ", "ㅡ", SONORANT_FINALS[p]])
+        elif (
+            p in STOP_FINALS
+            and open_syllable
+            and phonemes[i - 1] in SHORT_VOWELS
+            and (following is None or following not in ("l", "r", "m", "n"))
+        ):
+            previous[2] = STOP_FINALS[p]
+        elif p in ("r", "h"):
+            pass
+        elif p == "sh":
+            add_schwa_syllable("ㅅ", "ㅣ" if following is None else "ㅠ")
+        elif p in ("zh", "j"):
+            add_schwa_syllable("ㅈ", "ㅣ")
+        elif p == "ch":
+            add_schwa_syllable("ㅊ", "ㅣ")
+        elif p == "ts":
+            add_schwa_syllable("ㅊ")
+        elif p == "dz":
+            add_schwa_syllable("ㅈ")
+        else:
+            add_schwa_syllable(ONSETS[p])
+        i += 1
+
+    return "".join(_compose(*syllable) for syllable in syllables)
+
+
+@lru_cache(maxsize=8192)
+def transliterate_word(word: str) -> Tuple[str, ...]:
+    """
+    Propose Hangul notations for one word with the rule engine.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Notations, primary reading first, followed by readings that change
+        one ambiguous spelling
+    """
+    chunks = spelling_to_phonemes(word)
+    if not chunks:
+        return ()
+
+    def render(choice: Sequence[Tuple[str, ...]]) -> str:
+        return phonemes_to_hangul([p for reading in choice for p in reading])
+
+    primary = [readings[0] for readings in chunks]
+    notations = [render(primary)]
+    for index, readings in enumerate(chunks):
+        for alternative in readings[1:]:
+            choice = list(primary)
+            choice[index] = alternative
+            notation = render(choice)
+            if notation not in notations:
+                notations.append(notation)
+    return tuple(notations)
+
+
+def word_notations(word: str) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Get the notations of one word, preferring the exception dictionary.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Tuple of (notations, whether they came from the dictionary)
+    """
+    notations = load_name_notations().get(word)
+    if notations:
+        return notations, True
+    return transliterate_word(word), False
+
+
+def dictionary_notation(name: str) -> Optional[str]:
+    """
+    Look up a name whose every word is in the exception dictionary.
+
+    Args:
+        name: English name
+
+    Returns:
+        Preferred Korean notation, or None if any word is unknown
+    """
+    words = split_name_words(name)
+    if not words:
+        return None
+    notations = []
+    for word in words:
+        found, from_dictionary = word_notations(word)
+        if not from_dictionary:
+            return None
+        notations.append(found[0])
+    return " ".join(notations)
+
+
+def transliteration_candidates(name: str, limit: int = MAX_CANDIDATES) -> List[str]:
+    """
+    Propose Korean notations for an English name.
+
+    Args:
+        name: English name
+        limit: Maximum number of candidates
+
+    Returns:
+        Candidate notations, most likely first
+    """
+    per_word = [word_notations(word)[0] for word in split_name_words(name)]
+    per_word = [notations for notations in per_word if notations]
+    if not per_word:
+        return []
+
+    candidates: List[str] = []
+    primary = [notations[0] for notations in per_word]
+    candidates.append(" ".join(primary))
+    # Vary one word at a time, then fall back to full combinations
+    for index, notations in enumerate(per_word):
+        for alternative in notations[1:]:
+            choice = list(primary)
+            choice[index] = alternative
+            candidates.append(" ".join(choice))
+    candidates.extend(" ".join(choice) for choice in product(*per_word))
+
+    unique = list(dict.fromkeys(candidates))
+    return unique[:limit]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Propose Korean notations for English names (NIKL rules)"
+    )
+    parser.add_argument("names", nargs="+", help="English names")
+    parser.add_argument("--limit", type=int, default=MAX_CANDIDATES)
+    args = parser.parse_args()
+
+    for name in args.names:
+        known = dictionary_notation(name)
+        candidates = transliteration_candidates(name, args.limit)
+        source = "dictionary" if known else "rules"
+        print(f"{name} ({source}): {', '.join(candidates)}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Evaluator Registry for CF Name Evaluation System.
+
+This module keeps one evaluator per translation direction for the lifetime of
+the process. Building an evaluator creates the ChatOpenAI client (and its HTTP
+connection pool), renders the static verification process and resource text,
+and compiles the prompt template; doing that once instead of once per name
+removes the setup cost from every evaluation after the first.
+
+Evaluators are keyed on the direction and the model configuration
+(OPENAI_MODEL_NAME and OPENAI_TEMPERATURE), so changing the configuration in
+the environment yields a freshly built evaluator. Evaluator modules are
+imported lazily, so importing the registry does not pull in LangChain.
+
+The module includes:
+- A thread-safe, process-wide cache of evaluators per direction and model
+- Lazy, importlib-based lookup of each direction's evaluator factory
+- Helpers to register additional factories and to reset the cache
+"""
+
+import importlib
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Direction -> (module, factory function) building that direction's evaluator
+EVALUATOR_FACTORIES: Dict[str, Tuple[str, str]] = {
+    "KO-EN": ("korean_to_english_evaluator", "create_ko_to_en_evaluator"),
+    "EN-KO": ("english_to_korean_evaluator", "EnToKoEvaluator"),
+    "GENERIC": ("korean_name_evaluator", "create_ko_name_evaluator_chain"),
+}
+
+_evaluators: Dict[Tuple[str, str, float], Any] = {}
+_evaluators_lock = threading.Lock()
+
+
+def get_model_config() -> Tuple[str, float]:
+    """
+    Get the model configuration evaluators are built with.
+
+    Returns:
+        Tuple of (model name, temperature)
+    """
+    model_name = os.environ.get("OPENAI_MODEL_NAME", "gpt-4o-mini")
+    temperature = float(os.environ.get("OPENAI_TEMPERATURE", "0"))
+    return model_name, temperature
+
+
+def register_evaluator_factory(direction: str, module: str, factory: str):
+    """
+    Register the factory that builds a direction's evaluator.
+
+    Args:
+        direction: Direction key (e.g. "KO-EN")
+        module: Name of the module defining the factory
+        factory: Name of the factory function in that module
+    """
+    with _evaluators_lock:
+        EVALUATOR_FACTORIES[direction] = (module, factory)
+
+
+def _load_factory(direction: str) -> Callable[[], Any]:
+    """Import and return the factory function for a direction."""
+    if direction not in EVALUATOR_FACTORIES:
+        raise ValueError(
+            f"No evaluator registered for direction '{direction}'. "
+            f"Available: {', '.join(sorted(EVALUATOR_FACTORIES))}"
+        )
+    module_name, factory_name = EVALUATOR_FACTORIES[direction]
+    return getattr(importlib.import_module(module_name), factory_name)
+
+
+def get_evaluator(direction: str) -> Any:
+    """
+    Get the shared evaluator for a direction, building it on first use.
+
+    Args:
+        direction: Direction key (e.g. "KO-EN")
+
+    Returns:
+        The evaluator returned by the direction's factory
+    """
+    key = (direction, *get_model_config())
+    with _evaluators_lock:
+        evaluator = _evaluators.get(key)
+        if evaluator is None:
+            evaluator = _load_factory(direction)()
+            _evaluators[key] = evaluator
+        return evaluator
+
+
+def clear_evaluators():
+    """Drop every cached evaluator so the next lookup builds a new one."""
+    with _evaluators_lock:
+        _evaluators.clear()
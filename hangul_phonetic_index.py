@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+"""
+Jamo-Level Phonetic Index of Korean Notations for CF Name Evaluation System.
+
+Korean notations of foreign names often differ by a single jamo: 제니퍼 and
+재니퍼, 쥬디 and 주디, 빠리 and 파리. Exact lookup treats them as unrelated,
+so an evaluation can recommend one spelling while earlier records use the
+other. This module reduces every Korean notation to a phonetic key and
+indexes the notations known from the local termbase workbooks and the
+Teamwork "Name Evaluation" tasks (the same records name_similarity searches)
+by that key, so near-identical prior notations are found with one dictionary
+lookup and inconsistencies are flagged without a model call.
+
+Each Hangul syllable is decomposed arithmetically into its initial, medial
+and final jamo, and each jamo is replaced by the representative of its
+equivalence class:
+- Initials: tense and aspirated consonants are merged (ㄲ/ㅋ, ㄸ/ㅌ, ㅃ/ㅍ,
+  ㅉ/ㅊ), as are ㅅ/ㅆ. Plain consonants stay distinct, so 게이트 and
+  케이트 keep different keys.
+- Medials: ㅐ/ㅔ, ㅒ/ㅖ and ㅙ/ㅚ/ㅞ are merged. After ㅈ, ㅉ and ㅊ the
+  y-glide is dropped (쥬 → 주, 쟈 → 자, 챠 → 차), since the NIKL rules do not
+  write it there.
+- Finals: each final is reduced to the consonant it is pronounced as (ㅅ,
+  ㅈ, ㅊ, ㅌ, ㅎ and ㅆ to ㄷ; ㄲ and ㅋ to ㄱ; ㅍ to ㅂ, and so on).
+Everything but Hangul syllables is ignored, so spacing and middle dots do
+not matter either.
+
+The module includes:
+- The phonetic key of a Korean notation
+- An index of known Korean notations by phonetic key
+- Lookup of near-identical prior notations and of the notations recorded
+  for an English name
+- A consistency check that annotates EN-KO evaluations
+- A CLI for printing keys and checking notations
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from korean_romanization import HANGUL_BASE, HANGUL_LAST
+from name_normalization import comparison_key, contains_hangul, normalize_name
+from name_similarity import sources_version, teamwork_records, termbase_records
+
+# Load environment variables
+load_dotenv()
+
+# Initial jamo index -> representative (tense and aspirated merged, ㅆ -> ㅅ)
+INITIAL_CLASSES = {1: 15, 4: 16, 8: 17, 10: 9, 13: 14}
+
+# Medial jamo index -> representative (ㅐ/ㅔ, ㅒ/ㅖ, ㅙ/ㅚ/ㅞ)
+MEDIAL_CLASSES = {1: 5, 3: 7, 10: 15, 11: 15}
+
+# Medials that lose their y-glide after ㅈ, ㅉ and ㅊ (ㅑ, ㅒ, ㅕ, ㅖ, ㅛ, ㅠ)
+PALATAL_INITIALS = {12, 13, 14}
+PALATAL_MEDIALS = {2: 0, 3: 5, 6: 4, 7: 5, 12: 8, 17: 13}
+
+# Final jamo index -> index of the consonant it is pronounced as
+FINAL_CLASSES = {
+    2: 1, 3: 1, 9: 1, 24: 1,  # ㄲ ㄳ ㄺ ㅋ -> ㄱ
+    5: 4, 6: 4,  # ㄵ ㄶ -> ㄴ
+    19: 7, 20: 7, 22: 7, 23: 7, 25: 7, 27: 7,  # ㅅ ㅆ ㅈ ㅊ ㅌ ㅎ -> ㄷ
+    11: 8, 12: 8, 13: 8, 15: 8,  # ㄼ ㄽ ㄾ ㅀ -> ㄹ
+    10: 16,  # ㄻ -> ㅁ
+    14: 17, 18: 17, 26: 17,  # ㄿ ㅄ ㅍ -> ㅂ
+}  # fmt: skip
+
+
+def phonetic_key(notation: str) -> str:
+    """
+    Reduce a Korean notation to its phonetic key.
+
+    The key is written in conjoining jamo, one class representative per
+    initial, medial and final.
+
+    Args:
+        notation: Korean notation (other characters are ignored)
+
+    Returns:
+        Phonetic key ("" if the notation has no Hangul syllables)
+    """
+    key = []
+    for char in notation:
+        code = ord(char)
+        if not HANGUL_BASE <= code <= HANGUL_LAST:
+            continue
+        index = code - HANGUL_BASE
+        initial, medial, final = index // 588, (index % 588) // 28, index % 28
+        initial = INITIAL_CLASSES.get(initial, initial)
+        medial = MEDIAL_CLASSES.get(medial, medial)
+        if initial in PALATAL_INITIALS:
+            medial = PALATAL_MEDIALS.get(medial, medial)
+        final = FINAL_CLASSES.get(final, final)
+        key.append(chr(0x1100 + initial) + chr(0x1161 + medial))
+        if final:
+            key.append(chr(0x11A7 + final))
+    return "".join(key)
+
+
+def _spelling(notation: str) -> str:
+    """Spelling of a notation with spacing and punctuation ignored."""
+    return comparison_key(normalize_name(notation))
+
+
+class HangulPhoneticIndex:
+    """Known Korean notations keyed by phonetic key and by counterpart name."""
+
+    def __init__(self, records: List[Dict[str, Any]], version: Any = None):
+        """
+        Index the Korean side of known name records.
+
+        Args:
+            records: Dictionaries with a "name", its "notation" and the
+                     "source" recording them; whichever of name and notation
+                     is written in Hangul is indexed
+            version: State of the sources the records came from
+        """
+        self.version = version
+        self.by_key: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_counterpart: Dict[str, List[Dict[str, Any]]] = {}
+        seen = set()
+        for record in records:
+            name, notation = record.get("name") or "", record.get("notation") or ""
+            if contains_hangul(notation) and not contains_hangul(name):
+                korean, counterpart = notation, name
+            elif contains_hangul(name) and not contains_hangul(notation):
+                korean, counterpart = name, notation
+            else:
+                continue
+            key = phonetic_key(korean)
+            identity = (korean, counterpart, record.get("source"))
+            if not key or identity in seen:
+                continue
+            seen.add(identity)
+            known = {
+                "notation": korean,
+                "name": counterpart or None,
+                "source": record.get("source"),
+            }
+            self.by_key.setdefault(key, []).append(known)
+            if counterpart:
+                self.by_counterpart.setdefault(_spelling(counterpart), []).append(known)
+
+    def __len__(self) -> int:
+        return sum(len(known) for known in self.by_key.values())
+
+    def variants(self, notation: str) -> List[Dict[str, Any]]:
+        """
+        Find known notations that sound the same but are spelled differently.
+
+        Args:
+            notation: Korean notation
+
+        Returns:
+            Known notations with the same phonetic key and another spelling
+        """
+        spelling = _spelling(notation)
+        return [
+            known
+            for known in self.by_key.get(phonetic_key(notation), [])
+            if _spelling(known["notation"]) != spelling
+        ]
+
+    def notations_for(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Get the Korean notations recorded for a name in another script.
+
+        Args:
+            name: English (or romanized) name
+
+        Returns:
+            Known notations whose counterpart is spelled like the name
+        """
+        return list(self.by_counterpart.get(_spelling(name), []))
+
+
+_index: Optional[HangulPhoneticIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_phonetic_index() -> HangulPhoneticIndex:
+    """
+    Get the process-wide phonetic index, rebuilding it if its sources changed.
+
+    Returns:
+        The phonetic index
+    """
+    global _index
+    with _index_lock:
+        version = sources_version()
+        if _index is None or _index.version != version:
+            _index = HangulPhoneticIndex(
+                termbase_records() + teamwork_records(), version
+            )
+        return _index
+
+
+def check_notation_consistency(name: str, notation: str) -> Dict[str, Any]:
+    """
+    Compare a Korean notation of an English name with the earlier records.
+
+    Args:
+        name: English name
+        notation: Korean notation recommended for it
+
+    Returns:
+        Dictionary with the "prior_notations" recorded for the name, the
+        near-identical "notation_variants" of the notation, whether the
+        notation is "consistent" with both, and "issues" describing any
+        disagreement
+    """
+    try:
+        index = get_phonetic_index()
+    except Exception as e:
+        print(f"Phonetic index unavailable: {e}")
+        return {
+            "prior_notations": [],
+            "notation_variants": [],
+            "consistent": True,
+            "issues": [],
+        }
+
+    spelling = _spelling(notation)
+    prior = index.notations_for(name)
+    variants = index.variants(notation) if notation else []
+
+    issues = []
+    differing = sorted(
+        {k["notation"] for k in prior if _spelling(k["notation"]) != spelling}
+    )
+    if notation and differing:
+        issues.append(
+            f"Earlier records write '{name}' as {', '.join(differing)}, "
+            f"not {notation}"
+        )
+    for known in variants:
+        if known["notation"] in differing:
+            continue
+        issues.append(
+            f"Near-identical notation {known['notation']} is recorded"
+            + (f" for '{known['name']}'" if known.get("name") else "")
+            + (f" ({known['source']})" if known.get("source") else "")
+        )
+
+    return {
+        "prior_notations": prior,
+        "notation_variants": variants,
+        "consistent": not issues,
+        "issues": issues,
+    }
+
+
+def apply_notation_consistency(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Annotate an EN-KO evaluation with the consistency check of its notation.
+
+    Adds "prior_notations", "notation_variants" and "notation_consistent",
+    and a recommendation for every disagreement found.
+
+    Args:
+        evaluation: Evaluation with a name and a korean_notation
+
+    Returns:
+        The same evaluation, updated in place
+    """
+    notation = evaluation.get("korean_notation") or ""
+    check = check_notation_consistency(evaluation.get("name", ""), notation)
+    evaluation["prior_notations"] = check["prior_notations"]
+    evaluation["notation_variants"] = check["notation_variants"]
+    evaluation["notation_consistent"] = check["consistent"]
+    if check["issues"]:
+        evaluation.setdefault("recommendations", []).extend(
+            f"{issue}; align the notation with the earlier records or record "
+            "why it differs"
+            for issue in check["issues"]
+        )
+    return evaluation
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Print phonetic keys of Korean notations and check them "
+        "against earlier records"
+    )
+    parser.add_argument("notations", nargs="+", help="Korean notations")
+    parser.add_argument("--name", help="English name the notations are for")
+    args = parser.parse_args()
+
+    for text in args.notations:
+        print(f"{text}: {phonetic_key(text)}")
+        result = check_notation_consistency(args.name or "", text)
+        for known in result["notation_variants"]:
+            print(
+                f"  sounds like {known['notation']} "
+                f"({known.get('name') or '?'}, {known.get('source') or '?'})"
+            )
+        for issue in result["issues"] if args.name else []:
+            print(f"  ! {issue}")
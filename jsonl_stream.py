@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+"""
+Streaming JSONL Results for CF Name Evaluation System.
+
+Batch evaluations used to keep every result in memory and write one JSON file
+when the batch finished, so a crash near the end of a long batch lost all of
+its results. This module writes each result to a JSON Lines file (one JSON
+object per line) as soon as it is produced instead, and rebuilds the legacy
+JSON files from that stream.
+
+Every line is an envelope naming the section of the legacy file the result
+belongs to and its position in that section:
+
+    {"section": "ko_en_results", "index": 3, "result": {...}}
+    {"section": "tier_stats", "value": {...}}
+
+Results can therefore be written in completion order by concurrent workers
+and still be reassembled in input order. A later line for the same section
+and index replaces an earlier one. Lines are flushed to the operating system
+as they are written and fsynced in batches (every JSONL_FSYNC_EVERY lines or
+JSONL_FSYNC_INTERVAL seconds), and a torn last line left by a crash is
+ignored when reading.
+
+A stream can also be tagged with the hash of the configuration that produced
+it (model, flags, prompts and resources). Each line then carries a "config"
+key, and a resumed run reuses only the results whose hash matches its own.
+
+The module includes:
+- A thread-safe, fsync-batched JSONL result writer
+- A tolerant reader and the reconstruction of legacy JSON files
+- Loading of completed results for resuming an interrupted run
+- A CLI that rebuilds a JSON file from a stream left by an interrupted run
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# fsync the stream after this many lines or seconds, whichever comes first
+JSONL_FSYNC_EVERY = int(os.environ.get("JSONL_FSYNC_EVERY", "20"))
+JSONL_FSYNC_INTERVAL = float(os.environ.get("JSONL_FSYNC_INTERVAL", "2"))
+
+# Section used by files that hold a plain list of results
+RESULTS_SECTION = "results"
+
+
+def stream_path_for(json_path: str) -> str:
+    """
+    Get the JSONL stream path that backs a legacy JSON results file.
+
+    Args:
+        json_path: Path of the JSON file (e.g. reports/results.json)
+
+    Returns:
+        Path of the stream (e.g. reports/results.jsonl)
+    """
+    root, _ = os.path.splitext(json_path)
+    return root + ".jsonl"
+
+
+class ResultStream:
+    """Append-only JSONL writer for evaluation results."""
+
+    def __init__(
+        self,
+        path: str,
+        append: bool = False,
+        fsync_every: int = JSONL_FSYNC_EVERY,
+        fsync_interval: float = JSONL_FSYNC_INTERVAL,
+        config_hash: Optional[str] = None,
+    ):
+        """
+        Open a result stream.
+
+        Args:
+            path: Path of the JSONL file
+            append: Keep existing lines instead of starting a new stream
+            fsync_every: Lines written between fsyncs
+            fsync_interval: Maximum seconds between fsyncs
+            config_hash: Hash of the run configuration, recorded on each line
+        """
+        self.path = path
+        self.config_hash = config_hash
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _write_line(self, record: Dict[str, Any]):
+        if self.config_hash:
+            record["config"] = self.config_hash
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def write(
+        self,
+        index: int,
+        result: Any,
+        section: str = RESULTS_SECTION,
+        name: Optional[str] = None,
+    ):
+        """
+        Append one result.
+
+        Args:
+            index: Position of the result in its section
+            result: JSON-serialisable result
+            section: Section of the legacy file the result belongs to
+            name: Input name the result is for, used when resuming
+        """
+        record = {"section": section, "index": index, "result": result}
+        if name is not None:
+            record["name"] = name
+        self._write_line(record)
+
+    def writer_for(
+        self, section: str, names: Optional[List[str]] = None
+    ) -> Callable[[int, Any], None]:
+        """
+        Get a callback that appends results to one section.
+
+        Args:
+            section: Section name
+            names: Input names by index, recorded with each result
+
+        Returns:
+            Function taking (index, result)
+        """
+        return lambda index, result: self.write(
+            index, result, section, names[index] if names is not None else None
+        )
+
+    def write_completed(
+        self,
+        completed: Dict[str, Dict[str, Any]],
+        section_names: Dict[str, List[str]],
+    ) -> int:
+        """
+        Write the results reused from an earlier run to this stream.
+
+        Args:
+            completed: Results keyed by input name, per section (as returned
+                       by load_completed)
+            section_names: Input names of each section, by index
+
+        Returns:
+            Number of results written
+        """
+        written = 0
+        for section, names in section_names.items():
+            by_name = completed.get(section) or {}
+            for index, name in enumerate(names):
+                if name in by_name:
+                    self.write(index, by_name[name], section, name)
+                    written += 1
+        return written
+
+    def write_value(self, section: str, value: Any):
+        """
+        Append a section that is a single value rather than a list.
+
+        Args:
+            section: Section name
+            value: JSON-serialisable value
+        """
+        self._write_line({"section": section, "value": value})
+
+    def close(self):
+        """fsync and close the stream."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
+
+    def __enter__(self) -> "ResultStream":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_stream(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the records of a JSONL stream.
+
+    Blank lines and a torn or otherwise unparseable line (left by a crash in
+    the middle of a write) are skipped.
+
+    Args:
+        path: Path of the JSONL file
+
+    Yields:
+        Record envelopes in file order
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Skipping unreadable line {number} of {path}")
+
+
+def reconstruct(path: str) -> Dict[str, Any]:
+    """
+    Reassemble the sections of a results file from its stream.
+
+    Args:
+        path: Path of the JSONL file
+
+    Returns:
+        Dictionary mapping each section to its value, or to its results
+        ordered by index (a later result for an index replaces an earlier one)
+    """
+    lists: Dict[str, Dict[int, Any]] = {}
+    values: Dict[str, Any] = {}
+    for record in read_stream(path):
+        section = record.get("section", RESULTS_SECTION)
+        if "value" in record:
+            values[section] = record["value"]
+        elif "index" in record:
+            lists.setdefault(section, {})[record["index"]] = record.get("result")
+
+    sections: Dict[str, Any] = {
+        section: [by_index[i] for i in sorted(by_index)]
+        for section, by_index in lists.items()
+    }
+    sections.update(values)
+    return sections
+
+
+def load_completed(
+    path: str, config_hash: str, sections: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the results an earlier run completed with the same configuration.
+
+    Results written under another configuration hash (or none) and results
+    recording an error are left out, so they are evaluated again. Results are
+    keyed by the input name recorded with them, or by their "name" field.
+
+    Args:
+        path: Path of the JSONL file
+        config_hash: Hash of the current run configuration
+        sections: Sections to load (all list sections if omitted)
+
+    Returns:
+        Dictionary mapping each section to its results keyed by input name
+    """
+    completed: Dict[str, Dict[str, Any]] = {}
+    for record in read_stream(path):
+        section = record.get("section", RESULTS_SECTION)
+        if (
+            record.get("config") != config_hash
+            or "index" not in record
+            or (sections is not None and section not in sections)
+        ):
+            continue
+        result = record.get("result")
+        if not isinstance(result, dict) or result.get("error"):
+            continue
+        name = record.get("name") or result.get("name")
+        if name:
+            completed.setdefault(section, {})[name] = result
+    return completed
+
+
+def rebuild_json(
+    stream_path: str,
+    json_path: Optional[str] = None,
+    sections: Optional[List[str]] = None,
+) -> Any:
+    """
+    Write the legacy JSON file for a stream.
+
+    Args:
+        stream_path: Path of the JSONL file
+        json_path: Path of the JSON file (defaults to the stream path with a
+                   .json extension)
+        sections: Sections the legacy file always has; files with a single
+                  "results" section are written as a plain list
+
+    Returns:
+        The data written
+    """
+    if json_path is None:
+        json_path = os.path.splitext(stream_path)[0] + ".json"
+
+    data = reconstruct(stream_path)
+    if sections:
+        data = {**{section: [] for section in sections}, **data}
+    elif set(data) <= {RESULTS_SECTION}:
+        data = data.get(RESULTS_SECTION, [])
+
+    os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return data
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild a JSON results file from its JSONL stream"
+    )
+    parser.add_argument("stream", help="Path of the .jsonl stream")
+    parser.add_argument("output", nargs="?", help="Path of the JSON file to write")
+    args = parser.parse_args()
+
+    rebuilt = rebuild_json(args.stream, args.output)
+    count = (
+        len(rebuilt)
+        if isinstance(rebuilt, list)
+        else sum(len(v) for v in rebuilt.values() if isinstance(v, list))
+    )
+    print(f"Rebuilt {count} results from {args.stream}")
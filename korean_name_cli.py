@@ -15,6 +15,8 @@ The CLI supports:
 - Controlling Teamwork integration with simple flags
 - Showing available verification resources
 - Configuring evaluation parameters via command-line arguments
+- Evaluating large batches concurrently with a configurable concurrency limit
+- Collapsing duplicate and variant spellings so each person is evaluated once
 
 This tool makes the name evaluation system accessible to terminologists and
 translators who can use it directly from their terminal without needing to
@@ -27,7 +29,10 @@ import os
 import sys
 from typing import List
 
+from concurrent_evaluation import MAX_CONCURRENCY
 from korean_name_evaluator import batch_evaluate_names, generate_html_report
+from name_normalization import evaluate_unique
+from persistent_cache import print_cache_stats
 from terminologists_manual_links import get_verification_process_text
 
 
@@ -75,6 +80,13 @@ def parse_arguments():
         help="Output JSON file path for raw results",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help="Maximum number of names evaluated at the same time (default: %(default)s)",
+    )
+
     return parser.parse_args()
 
 
@@ -119,7 +131,14 @@ def main():
     print(f"Starting evaluation of {len(names)} names (direction: {args.direction})...")
 
     # Run the evaluation
-    results = batch_evaluate_names(names, args.direction)
+    # Evaluate each distinct name once and copy results to duplicate entries
+    results = evaluate_unique(
+        names,
+        lambda unique: batch_evaluate_names(
+            unique, args.direction, max_concurrency=args.concurrency
+        ),
+        prefer="hangul" if args.direction == "KO-EN" else "latin",
+    )
 
     # Ensure reports directory exists
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
@@ -127,12 +146,10 @@ def main():
     # Generate the HTML report
     generate_html_report(results, args.output)
 
-    # Save raw results to JSON (already done in batch_evaluate_names)
-    if args.json_output != "reports/name_evaluation_results.json":
-        # If user specified a different JSON output path, save the results there too
-        os.makedirs(os.path.dirname(args.json_output), exist_ok=True)
-        with open(args.json_output, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+    # Save raw results to JSON (one entry per input name, including duplicates)
+    os.makedirs(os.path.dirname(args.json_output) or ".", exist_ok=True)
+    with open(args.json_output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
 
     # Print summary
     compliant_count = sum(1 for r in results if r.get("compliant", False))
@@ -151,6 +168,9 @@ def main():
     print(f"HTML report generated: {args.output}")
     print(f"JSON results saved: {args.json_output}")
 
+    # Print cache hit/miss counters for this run
+    print_cache_stats()
+
     # Exit with status code 0 (success) if all names are compliant, otherwise 1
     sys.exit(0 if compliant_count == len(names) else 1)
 
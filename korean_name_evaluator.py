@@ -21,9 +21,9 @@ specialized evaluators build upon, implementing the shared logic and
 verification workflow while allowing for direction-specific customization.
 """
 
-import json
 import os
 import re
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -34,9 +34,15 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
+from concurrent_evaluation import MAX_CONCURRENCY, print_throughput, run_concurrently
+from evaluator_registry import get_evaluator
+from jsonl_stream import ResultStream, rebuild_json, stream_path_for
+from llm_response_cache import cached_llm_call, prompt_fingerprint
+from termbase_index import format_prior_notations, retrieve_prior_notations
+
 # Import Teamwork integration if available
 try:
-    from teamwork_integration import verify_name_in_teamwork
+    from teamwork_integration import verify_name_in_teamwork, verify_names_in_teamwork
 
     TEAMWORK_AVAILABLE = True
 except ImportError:
@@ -86,6 +92,8 @@ def create_ko_name_evaluator_chain():
         
         {teamwork_info}
         
+        {termbase_info}
+        
         GUIDELINES FOR KOREAN NAME VERIFICATION:
         
         1. Internal Data Verification:
@@ -142,6 +150,14 @@ def create_ko_name_evaluator_chain():
 
     # Create the extraction chain for structured output - updated approach
     extraction_chain = create_structured_output_chain(NameEvaluationResult, llm, prompt)
+    prompt_hash = prompt_fingerprint(prompt)
+
+    def extract(input_data: Dict[str, Any]) -> Dict[str, Any]:
+        result = extraction_chain.invoke(input_data)
+        # The chain may wrap the parsed model in its output dictionary
+        if isinstance(result, dict) and isinstance(result.get("function"), BaseModel):
+            result = result["function"]
+        return result.dict() if isinstance(result, BaseModel) else result
 
     # Build the complete evaluation function
     def evaluate_name(name: str, direction: str = "KO-EN", check_teamwork: bool = True):
@@ -181,20 +197,34 @@ def create_ko_name_evaluator_chain():
             except Exception as e:
                 teamwork_info = f"TEAMWORK VERIFICATION ERROR: {str(e)}\n"
 
+        # Prior notations of similar names in the local termbase workbooks
+        termbase_matches = retrieve_prior_notations(name)
+        termbase_info = format_prior_notations(termbase_matches)
+
         # Use the structured output chain directly with the input
         input_data = {
             "name": name,
             "direction": direction,
             "teamwork_info": teamwork_info,
+            "termbase_info": termbase_info,
         }
 
         try:
-            # Get structured result directly from the extraction chain
-            result = extraction_chain.invoke(input_data)
+            # Get structured result from the extraction chain (or the response cache)
+            result = cached_llm_call(
+                lambda: extract(input_data),
+                name,
+                direction,
+                model_name,
+                temperature,
+                prompt_hash,
+                teamwork_info + termbase_info,
+            )
 
             # Add Teamwork verification data to the result
             if teamwork_verification:
-                result.teamwork_verification = teamwork_verification
+                result["teamwork_verification"] = teamwork_verification
+            result["termbase_matches"] = termbase_matches
 
             return result
         except Exception as e:
@@ -217,48 +247,70 @@ def create_ko_name_evaluator_chain():
                 "verification_sources": ["CF Terminology Management Manual"],
                 "notes": f"Error in structured extraction. Raw evaluation:\n{evaluation_text}",
                 "teamwork_verification": teamwork_verification,
+                "termbase_matches": termbase_matches,
             }
 
     return evaluate_name
 
 
 def batch_evaluate_names(
-    names: List[str], direction: str = "KO-EN", check_teamwork: bool = True
+    names: List[str],
+    direction: str = "KO-EN",
+    check_teamwork: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
 ) -> List[Dict]:
     """
     Evaluates multiple names against Korean terminology guidelines.
 
+    Names are evaluated concurrently (see concurrent_evaluation.py) and the
+    results are returned in input order.
+
     Args:
         names: List of names to evaluate
         direction: Translation direction (KO-EN or EN-KO)
         check_teamwork: Whether to check Teamwork for previous translations
+        max_concurrency: Maximum number of evaluations in flight at once
 
     Returns:
         List of evaluation results for each name
     """
-    # Create the evaluator function
-    evaluate_name = create_ko_name_evaluator_chain()
+    # Get the shared evaluator function
+    evaluate_name = get_evaluator("GENERIC")
 
-    # Process all names
-    results = []
-    for name in names:
-        print(f"Evaluating name: {name}")
+    # Verify the whole batch in Teamwork up front so per-name lookups are
+    # served from the verification cache
+    if check_teamwork and TEAMWORK_AVAILABLE and os.environ.get("TEAMWORK_API_KEY"):
         try:
-            result = evaluate_name(name, direction, check_teamwork)
-            if isinstance(result, BaseModel):
-                results.append(result.dict())
-            else:
-                results.append(result)
+            verify_names_in_teamwork(names)
         except Exception as e:
-            print(f"Error evaluating {name}: {e}")
-            results.append(
-                {"name": name, "error": str(e), "compliant": False, "overall_score": 0}
-            )
+            print(f"Batch Teamwork verification failed: {e}")
 
-    # Save results to file
-    os.makedirs("reports", exist_ok=True)
-    with open("reports/name_evaluation_results.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    def evaluate_one(name: str) -> Dict:
+        print(f"Evaluating name: {name}")
+        result = evaluate_name(name, direction, check_teamwork)
+        if isinstance(result, BaseModel):
+            return result.dict()
+        return result
+
+    def evaluation_error(name: str, e: Exception) -> Dict:
+        print(f"Error evaluating {name}: {e}")
+        return {"name": name, "error": str(e), "compliant": False, "overall_score": 0}
+
+    # Process all names, streaming each result to disk as it finishes
+    results_path = "reports/name_evaluation_results.json"
+    started = time.perf_counter()
+    with ResultStream(stream_path_for(results_path)) as stream:
+        results = run_concurrently(
+            evaluate_one,
+            names,
+            max_concurrency=max_concurrency,
+            on_error=evaluation_error,
+            on_result=stream.write,
+        )
+    print_throughput(len(results), started)
+
+    # Rebuild the legacy JSON file from the stream
+    rebuild_json(stream.path, results_path)
 
     return results
 
@@ -0,0 +1,431 @@
+#!/usr/bin/env python
+"""
+Revised Romanization of Korean for CF Name Evaluation System.
+
+This module converts Hangul to the Revised Romanization of Korean (the NIKL
+standard) without any external service. It gives the KO-EN evaluator a
+reference romanization for every name and lets it score a recommended
+English notation locally instead of asking a model or the Pusan converter.
+
+Hangul syllables are decomposed arithmetically (a precomposed syllable is
+0xAC00 + (initial * 21 + medial) * 28 + final). General text applies the
+sound changes that Revised Romanization reflects: linking of a final
+consonant into a following silent ㅇ, palatalization (같이 -> gachi),
+nasalization, lateralization (ㄴ+ㄹ and ㄹ+ㄴ as "ll") and aspiration with ㅎ. Personal names follow the standard's
+rule for names instead: sound changes between the syllables of a given name
+are not reflected, syllables are joined with hyphens, and surnames use the
+customary spellings in SURNAME_ROMANIZATIONS (이 → Lee, 박 → Park).
+
+The module includes:
+- A precomputed romanization table covering all 11,172 Hangul syllables
+- General text romanization with assimilation rules
+- Name romanization with a surname exception table and compound surnames
+- Scoring of an English notation against the reference romanization
+"""
+
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# Revised Romanization of initials, medials and finals in Unicode order
+INITIALS = [
+    "g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s",
+    "ss", "", "j", "jj", "ch", "k", "t", "p", "h",
+]  # fmt: skip
+MEDIALS = [
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+    "oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+]  # fmt: skip
+FINALS = [
+    "", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l",
+    "p", "l", "m", "p", "p", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+]  # fmt: skip
+
+# Indices of the jamo used by the assimilation rules
+I_G, I_N, I_D, I_R, I_M, I_SILENT, I_J, I_H = 0, 2, 3, 5, 6, 11, 12, 18
+M_I = 20
+F_NONE, F_D, F_H = 0, 7, 27
+
+# Palatalization: final ㄷ, ㅌ and ㄾ before 이 (and ㄷ before 히) are
+# pronounced ㅈ, ㅊ -> (kept final index, spelling of the next initial)
+PALATALIZED = {
+    7: (0, "j"),  # ㄷ + 이 -> 지 (굳이 -> guji)
+    25: (0, "ch"),  # ㅌ + 이 -> 치 (같이 -> gachi)
+    13: (8, "ch"),  # ㄾ + 이 -> ㄹ + 치 (훑이 -> hulchi)
+}
+
+# Initial index a final consonant becomes when linked into a silent ㅇ
+# (the second consonant of a cluster moves over)
+FINAL_TO_LINKED_INITIAL = {
+    1: (0, 0),  # ㄱ
+    2: (0, 1),  # ㄲ
+    3: (1, 9),  # ㄳ -> ㄱ + ㅅ
+    4: (0, 2),  # ㄴ
+    5: (4, 12),  # ㄵ -> ㄴ + ㅈ
+    6: (0, 2),  # ㄶ -> ㄴ (ㅎ drops)
+    7: (0, 3),  # ㄷ
+    8: (0, 5),  # ㄹ
+    9: (8, 0),  # ㄺ -> ㄹ + ㄱ
+    10: (8, 6),  # ㄻ -> ㄹ + ㅁ
+    11: (8, 7),  # ㄼ -> ㄹ + ㅂ
+    12: (8, 9),  # ㄽ -> ㄹ + ㅅ
+    13: (8, 16),  # ㄾ -> ㄹ + ㅌ
+    14: (8, 17),  # ㄿ -> ㄹ + ㅍ
+    15: (0, 5),  # ㅀ -> ㄹ (ㅎ drops)
+    16: (0, 6),  # ㅁ
+    17: (0, 7),  # ㅂ
+    18: (17, 9),  # ㅄ -> ㅂ + ㅅ
+    19: (0, 9),  # ㅅ
+    20: (0, 10),  # ㅆ
+    22: (0, 12),  # ㅈ
+    23: (0, 14),  # ㅊ
+    24: (0, 15),  # ㅋ
+    25: (0, 16),  # ㅌ
+    26: (0, 17),  # ㅍ
+    27: (0, 11),  # ㅎ -> silent
+}
+
+# Customary romanizations of surnames; the first spelling is preferred and
+# the Revised Romanization spelling is always accepted as well
+SURNAME_ROMANIZATIONS: Dict[str, Tuple[str, ...]] = {
+    "김": ("Kim", "Gim"),
+    "이": ("Lee", "Yi", "Rhee", "I"),
+    "박": ("Park", "Pak", "Bak"),
+    "최": ("Choi", "Choe"),
+    "정": ("Jung", "Jeong", "Chung"),
+    "강": ("Kang", "Gang"),
+    "조": ("Cho", "Jo"),
+    "윤": ("Yoon", "Yun"),
+    "장": ("Jang", "Chang"),
+    "임": ("Lim", "Im", "Yim"),
+    "림": ("Lim", "Rim"),
+    "한": ("Han",),
+    "오": ("Oh", "O"),
+    "서": ("Seo", "Suh"),
+    "신": ("Shin", "Sin"),
+    "권": ("Kwon", "Gwon"),
+    "황": ("Hwang",),
+    "안": ("Ahn", "An"),
+    "송": ("Song",),
+    "류": ("Ryu", "Yoo", "Yu"),
+    "유": ("Yoo", "Yu"),
+    "홍": ("Hong",),
+    "전": ("Jeon", "Jun", "Chun"),
+    "고": ("Ko", "Go"),
+    "문": ("Moon", "Mun"),
+    "양": ("Yang",),
+    "손": ("Son", "Sohn"),
+    "배": ("Bae",),
+    "백": ("Baek", "Paik"),
+    "허": ("Heo", "Huh"),
+    "남": ("Nam",),
+    "심": ("Shim", "Sim"),
+    "노": ("Noh", "Roh", "No"),
+    "하": ("Ha",),
+    "곽": ("Kwak", "Gwak"),
+    "성": ("Sung", "Seong"),
+    "차": ("Cha",),
+    "주": ("Joo", "Ju"),
+    "우": ("Woo", "U"),
+    "구": ("Koo", "Gu"),
+    "민": ("Min",),
+    "나": ("Na", "Ra"),
+    "진": ("Jin",),
+    "지": ("Ji",),
+    "엄": ("Uhm", "Eom"),
+    "채": ("Chae",),
+    "원": ("Won",),
+    "천": ("Chun", "Cheon"),
+    "방": ("Bang",),
+    "공": ("Kong", "Gong"),
+    "현": ("Hyun", "Hyeon"),
+    "변": ("Byun", "Byeon"),
+    "염": ("Yeom",),
+    "여": ("Yeo",),
+    "추": ("Choo", "Chu"),
+    "도": ("Do",),
+    "소": ("So",),
+    "석": ("Seok",),
+    "선": ("Sun", "Seon"),
+    "설": ("Seol",),
+    "마": ("Ma",),
+    "길": ("Gil",),
+    "표": ("Pyo",),
+    "명": ("Myung", "Myeong"),
+    "기": ("Ki", "Gi"),
+    "반": ("Ban",),
+    "왕": ("Wang",),
+    "금": ("Geum", "Keum"),
+    "옥": ("Ok",),
+    "육": ("Yook", "Yuk"),
+    "인": ("In",),
+    "맹": ("Maeng",),
+    "제": ("Je",),
+    "모": ("Mo",),
+    "탁": ("Tak",),
+    "국": ("Kook", "Guk"),
+    "남궁": ("Namgung",),
+    "황보": ("Hwangbo",),
+    "제갈": ("Jegal",),
+    "선우": ("Sunwoo", "Seonu"),
+    "독고": ("Dokgo",),
+    "사공": ("Sagong",),
+    "서문": ("Seomun",),
+}
+
+COMPOUND_SURNAMES = {surname for surname in SURNAME_ROMANIZATIONS if len(surname) == 2}
+
+
+def _build_syllable_table() -> List[str]:
+    return [
+        INITIALS[code // 588] + MEDIALS[(code % 588) // 28] + FINALS[code % 28]
+        for code in range(HANGUL_LAST - HANGUL_BASE + 1)
+    ]
+
+
+# Romanization of every precomposed syllable, indexed by code - HANGUL_BASE
+SYLLABLE_TABLE = _build_syllable_table()
+
+
+def is_hangul_syllable(char: str) -> bool:
+    """Check whether a character is a precomposed Hangul syllable."""
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose(char: str) -> Tuple[int, int, int]:
+    """
+    Split a Hangul syllable into its jamo indices.
+
+    Args:
+        char: Precomposed Hangul syllable
+
+    Returns:
+        Tuple of (initial, medial, final) indices
+    """
+    code = ord(char) - HANGUL_BASE
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def romanize_syllable(char: str) -> str:
+    """Romanize a single syllable without reference to its neighbours."""
+    if is_hangul_syllable(char):
+        return SYLLABLE_TABLE[ord(char) - HANGUL_BASE]
+    return char
+
+
+def _assimilate(
+    final: int, initial: int, medial: Optional[int] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Apply the sound changes Revised Romanization reflects at a syllable boundary.
+
+    Args:
+        final: Final index of the first syllable
+        initial: Initial index of the second syllable
+        medial: Medial index of the second syllable
+
+    Returns:
+        Tuple of (final spelling, initial spelling) overrides; None keeps the default
+    """
+    if final == F_NONE:
+        return None, None
+
+    # Palatalization: ㄷ, ㅌ + 이 -> 지, 치 and ㄷ + 히 -> 치
+    if medial == M_I:
+        if initial == I_SILENT and final in PALATALIZED:
+            kept, moved = PALATALIZED[final]
+            return FINALS[kept], moved
+        if initial == I_H and final == F_D:
+            return "", "ch"
+
+    # Linking into a silent ㅇ
+    if initial == I_SILENT and final in FINAL_TO_LINKED_INITIAL:
+        kept, moved = FINAL_TO_LINKED_INITIAL[final]
+        return FINALS[kept], INITIALS[moved]
+
+    sound = FINALS[final]
+
+    # Aspiration: ㅎ final before ㄱ, ㄷ, ㅈ
+    if final == F_H and initial in (I_G, I_D, I_J):
+        return "", {I_G: "k", I_D: "t", I_J: "ch"}[initial]
+
+    # Lateralization: ㄴ+ㄹ, ㄹ+ㄴ, ㄹ+ㄹ
+    if (sound == "n" and initial == I_R) or (sound == "l" and initial in (I_N, I_R)):
+        return "l", "l"
+
+    # Nasalization of obstruents before ㄴ, ㅁ
+    if initial in (I_N, I_M) and sound in ("k", "t", "p"):
+        return {"k": "ng", "t": "n", "p": "m"}[sound], None
+
+    # ㄹ after ㅁ, ㅇ (and after nasalized ㄱ, ㅂ) is pronounced ㄴ
+    if initial == I_R:
+        if sound in ("m", "ng"):
+            return None, "n"
+        if sound in ("k", "p"):
+            return {"k": "ng", "p": "m"}[sound], "n"
+
+    return None, None
+
+
+def romanize(text: str, assimilate: bool = True) -> str:
+    """
+    Romanize Hangul text following Revised Romanization.
+
+    Args:
+        text: Text containing Hangul (other characters pass through)
+        assimilate: Whether to reflect sound changes between syllables
+
+    Returns:
+        Romanized text in lowercase
+    """
+    output = []
+    chars = list(text)
+    pending_initial: Optional[str] = None
+    for i, char in enumerate(chars):
+        if not is_hangul_syllable(char):
+            output.append(char)
+            pending_initial = None
+            continue
+
+        initial, medial, final = decompose(char)
+        initial_text = INITIALS[initial] if pending_initial is None else pending_initial
+        final_text = FINALS[final]
+        pending_initial = None
+
+        if assimilate and i + 1 < len(chars) and is_hangul_syllable(chars[i + 1]):
+            next_initial, next_medial, _ = decompose(chars[i + 1])
+            final_override, initial_override = _assimilate(
+                final, next_initial, next_medial
+            )
+            if final_override is not None:
+                final_text = final_override
+            pending_initial = initial_override
+
+        output.append(initial_text + MEDIALS[medial] + final_text)
+    return "".join(output)
+
+
+def split_surname(hangul: str) -> Tuple[str, str]:
+    """
+    Split a Hangul full name into surname and given name.
+
+    Args:
+        hangul: Hangul name, with or without a space after the surname
+
+    Returns:
+        Tuple of (surname, given name)
+    """
+    if " " in hangul.strip():
+        surname, given = hangul.strip().split(" ", 1)
+        return surname, given.replace(" ", "")
+    if len(hangul) > 2 and hangul[:2] in COMPOUND_SURNAMES:
+        return hangul[:2], hangul[2:]
+    return hangul[:1], hangul[1:]
+
+
+def surname_variants(surname: str) -> List[str]:
+    """
+    Get the accepted English spellings of a Hangul surname.
+
+    Args:
+        surname: Hangul surname
+
+    Returns:
+        Accepted spellings, preferred first (always including the RR spelling)
+    """
+    variants = list(SURNAME_ROMANIZATIONS.get(surname, ()))
+    rr = romanize(surname).capitalize()
+    if rr not in variants:
+        variants.append(rr)
+    return variants
+
+
+@lru_cache(maxsize=65536)
+def romanize_name(hangul: str, customary_surname: bool = True) -> str:
+    """
+    Romanize a Korean personal name (e.g. 김지원 -> Kim Ji-won).
+
+    Given-name syllables are romanized one by one, without sound changes,
+    and joined with hyphens.
+
+    Args:
+        hangul: Hangul name, surname first
+        customary_surname: Use the customary surname spelling (Lee, Park)
+                           instead of strict Revised Romanization (I, Bak)
+
+    Returns:
+        English notation of the name
+    """
+    surname, given = split_surname(hangul)
+    if customary_surname:
+        surname_text = surname_variants(surname)[0]
+    else:
+        surname_text = romanize(surname).capitalize()
+    if not given:
+        return surname_text
+
+    given_text = "-".join(romanize_syllable(char) for char in given)
+    return f"{surname_text} {given_text.capitalize()}"
+
+
+def _comparable(text: str) -> str:
+    return "".join(char for char in text.lower() if char.isalpha())
+
+
+def score_notation(hangul: str, notation: str) -> Dict[str, Any]:
+    """
+    Score an English notation against the reference romanization of a name.
+
+    The surname counts for 30 points and is accepted in any customary
+    spelling; the given name counts for 70 points and is compared letter by
+    letter with its Revised Romanization (hyphens, spaces and case are
+    ignored here, since name_rules checks them).
+
+    Args:
+        hangul: Hangul name, surname first
+        notation: English notation to score
+
+    Returns:
+        Dictionary with the reference romanization, whether the notation
+        matches it, the surname and given-name similarities, and a 0-100 score
+    """
+    reference = romanize_name(hangul)
+    surname, given = split_surname(hangul)
+    words = notation.split()
+    notation_surname = words[0] if words else ""
+    notation_given = "".join(words[1:])
+
+    accepted = {_comparable(variant) for variant in surname_variants(surname)}
+    surname_ok = _comparable(notation_surname) in accepted
+    given_reference = _comparable("".join(romanize_syllable(char) for char in given))
+    given_similarity = (
+        SequenceMatcher(None, given_reference, _comparable(notation_given)).ratio()
+        if given_reference
+        else 1.0
+    )
+
+    score = round(30 * surname_ok + 70 * given_similarity)
+    return {
+        "reference_romanization": reference,
+        "matches_reference": surname_ok and given_similarity == 1.0,
+        "surname_accepted": surname_ok,
+        "given_name_similarity": round(given_similarity, 3),
+        "score": score,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Romanize Korean names (RR)")
+    parser.add_argument("names", nargs="+", help="Hangul names or words")
+    parser.add_argument(
+        "--text", action="store_true", help="Romanize as general text, not names"
+    )
+    args = parser.parse_args()
+
+    for name in args.names:
+        print(f"{name} -> {romanize(name) if args.text else romanize_name(name)}")
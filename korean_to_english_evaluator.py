@@ -11,6 +11,8 @@ The module includes:
 - LangChain integration for intelligent name analysis
 - Comprehensive rule checking for each name component
 - Verification against reference sources and previous translations
+- Prior notations of similar names from the local termbase index
+- Spelling variants of the name found in the termbase and Teamwork records
 - Teamwork API integration for checking existing terminology
 - Report generation in multiple formats (JSON, HTML, text)
 
@@ -36,6 +38,20 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
+from evaluator_registry import get_evaluator
+from jsonl_stream import ResultStream, rebuild_json, stream_path_for
+from korean_romanization import romanize_name, score_notation
+from llm_response_cache import cached_llm_call, prompt_fingerprint
+from name_normalization import normalize_name, split_name_pair
+from name_rules import check_ko_en_notation
+from name_similarity import (
+    find_similar_names,
+    find_similar_names_batch,
+    format_similar_names,
+)
+from termbase_index import format_prior_notations, retrieve_prior_notations
+from tiered_evaluation import exact_hit
+
 # Use relative imports for our modules
 from terminologists_manual_links import (
     get_resources_for_direction,
@@ -55,6 +71,15 @@ except ImportError:
 # Load environment variables
 load_dotenv()
 
+# How each name type is described to the model
+NAME_TYPE_LABELS = {
+    "person": "real person",
+    "north_korean": "North Korean person",
+    "idol": "idol group or stage name",
+    "animal": "animal",
+    "organization": "organization",
+}
+
 
 class KoToEnNameEvaluation(BaseModel):
     """Schema for Korean to English name evaluation results."""
@@ -92,12 +117,41 @@ class KoToEnNameEvaluation(BaseModel):
     )
     # Simplify this field to avoid anyOf validation issues with gpt-4o-mini
     teamwork_verification: Optional[Dict[str, Any]] = None
+    # Filled in locally by the rule engine (name_rules.py), not by the model
+    rule_violations: List[str] = Field(
+        default_factory=list, description="Mechanical rule violations found locally"
+    )
+    evaluation_tier: Optional[str] = Field(
+        default=None, description="Which stage settled the evaluation (rules or llm)"
+    )
+    # Filled in locally by korean_romanization.py, not by the model
+    reference_romanization: Optional[str] = Field(
+        default=None, description="Revised Romanization of the Hangul name"
+    )
+    romanization_score: Optional[int] = Field(
+        default=None,
+        description="Similarity of the notation to the reference romanization (0-100)",
+    )
+    # Filled in locally by termbase_index.py, not by the model
+    termbase_matches: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Prior notations of similar names in the local termbase",
+    )
+    # Filled in locally by name_similarity.py, not by the model
+    similar_names: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Known spellings within a small edit distance of the name",
+    )
 
 
 def create_ko_to_en_evaluator():
     """
     Creates an evaluator for Korean to English name verification.
 
+    The LLM client, static prompt fragments and compiled chain are built here
+    once; use evaluator_registry.get_evaluator("KO-EN") to share the result
+    across calls instead of calling this per name.
+
     Returns:
         A callable function for name evaluation
     """
@@ -124,6 +178,8 @@ def create_ko_to_en_evaluator():
         
         Examine the Korean name "{name}" and determine the proper English notation following the guidelines.
         
+        {reference_context}
+        
         {teamwork_context}
         
         Return your evaluation as a single JSON object with the following fields:
@@ -142,10 +198,62 @@ def create_ko_to_en_evaluator():
         
         Format your entire response as a valid JSON object. Do not include any text outside the JSON object.
         """
-    )
+    ).partial(process_text=process_text, resources_text=resources_text)
+    chain = evaluation_prompt | llm
+    prompt_hash = prompt_fingerprint(evaluation_prompt)
+
+    def call_model(name: str, reference_context: str, teamwork_context: str) -> str:
+        result = chain.invoke(
+            {
+                "name": name,
+                "reference_context": reference_context,
+                "teamwork_context": teamwork_context,
+            }
+        )
+        return result.content if hasattr(result, "content") else str(result)
 
     # Use function calling instead of structured output
-    def name_evaluator(name, teamwork_results=None):
+    def name_evaluator(
+        name,
+        teamwork_results=None,
+        local_tiers=True,
+        similar_names=None,
+        name_type="person",
+    ):
+        if local_tiers:
+            # Names recorded verbatim in the local termbase never reach the model
+            known = exact_hit(name, "KO-EN", check_teamwork=False)
+            if known is not None:
+                return known
+
+            # Proposed notations the rules can settle never reach the model
+            local = evaluate_locally(name, teamwork_results, name_type)
+            if local is not None:
+                return local
+        hangul, _ = split_name_pair(normalize_name(name))
+
+        # Give the model the locally computed romanization as a starting point
+        reference_context = ""
+        if name_type != "person":
+            reference_context = (
+                f"Name type: {NAME_TYPE_LABELS[name_type]}; apply the special "
+                "rules for this type of name.\n\n"
+            )
+        if hangul:
+            reference_context += (
+                "Reference Revised Romanization computed locally (surname in its "
+                f"customary spelling): {romanize_name(hangul)}"
+            )
+
+        # Prior notations of similar names in the local termbase workbooks
+        termbase_matches = retrieve_prior_notations(name)
+        reference_context += "\n\n" + format_prior_notations(termbase_matches)
+
+        # Spelling variants of the name in the termbase and Teamwork records
+        if similar_names is None:
+            similar_names = find_similar_names(name)
+        reference_context += format_similar_names(similar_names, termbase_matches)
+
         # Format teamwork context
         teamwork_context = ""
         if isinstance(teamwork_results, dict) and teamwork_results.get("matches"):
@@ -159,20 +267,17 @@ def create_ko_to_en_evaluator():
         else:
             teamwork_context = "No previous translations found in Teamwork."
 
-        # Get the evaluation from LLM
-        chain = evaluation_prompt | llm
-        result = chain.invoke(
-            {
-                "name": name,
-                "process_text": process_text,
-                "resources_text": resources_text,
-                "teamwork_context": teamwork_context,
-            }
+        # Get the evaluation from LLM (or the response cache)
+        response_text = cached_llm_call(
+            lambda: call_model(name, reference_context, teamwork_context),
+            name,
+            "KO-EN",
+            model_name,
+            temperature,
+            prompt_hash,
+            teamwork_context + reference_context,
         )
 
-        # Extract the evaluation from the response
-        response_text = result.content if hasattr(result, "content") else str(result)
-
         # Create default evaluation structure
         evaluation = {
             "name": name,
@@ -183,6 +288,8 @@ def create_ko_to_en_evaluator():
             "overall_score": 0,
             "notes": f"Raw evaluation:\n{response_text}",
             "teamwork_verification": teamwork_results,
+            "termbase_matches": termbase_matches,
+            "similar_names": similar_names,
         }
 
         # Try to parse JSON response
@@ -239,24 +346,197 @@ def create_ko_to_en_evaluator():
             except Exception as e2:
                 evaluation["notes"] += f"\nRegex fallback error: {str(e2)}"
 
-        return evaluation
+        evaluation["name_type"] = name_type
+        return apply_rule_checks(evaluation, hangul, name_type)
 
     return name_evaluator
 
 
-def evaluate_korean_name(name: str, check_teamwork: bool = True) -> Dict[str, Any]:
+def evaluate_locally(
+    name: str,
+    teamwork_results: Optional[Dict[str, Any]] = None,
+    name_type: str = "person",
+) -> Optional[Dict[str, Any]]:
+    """
+    Settle the evaluation of a "Hangul (Roman)" input without the model, if possible.
+
+    The rules are confident in two cases: the proposed notation breaks the
+    mechanical hyphenation or capitalization rules, or it passes every rule
+    and matches the reference romanization of the Hangul name. A given name
+    whose syllables cannot be matched to the Hangul (such as "Yuna" for 연아)
+    is left to the model, since its corrected form would only be a guess.
+
+    Args:
+        name: Name as submitted
+        teamwork_results: Teamwork verification results, if any
+        name_type: One of name_rules.NAME_TYPES
+
+    Returns:
+        Evaluation settled by the rules, or None if the model is needed
+    """
+    hangul, proposed = split_name_pair(normalize_name(name))
+    if not (hangul and proposed):
+        return None
+
+    checks = check_ko_en_notation(proposed, hangul, name_type)
+    if not checks["syllables_verified"]:
+        return None
+    if not (checks["hyphenation_compliant"] and checks["capitalization_compliant"]):
+        return build_rule_evaluation(
+            name, proposed, checks, teamwork_results, name_type
+        )
+    if checks["compliant"] and score_notation(hangul, proposed)["matches_reference"]:
+        return build_rule_evaluation(
+            name, proposed, checks, teamwork_results, name_type
+        )
+    return None
+
+
+def build_rule_evaluation(
+    name: str,
+    proposed: str,
+    checks: Dict[str, Any],
+    teamwork_results: Optional[Dict[str, Any]] = None,
+    name_type: str = "person",
+) -> Dict[str, Any]:
+    """
+    Build an evaluation settled by the local rule engine alone.
+
+    Args:
+        name: Name as submitted
+        proposed: English notation proposed in the input
+        checks: Result of name_rules.check_ko_en_notation
+        teamwork_results: Teamwork verification results, if any
+        name_type: Name type the checks were run for
+
+    Returns:
+        Dictionary with evaluation results
+    """
+    suggested = checks["suggested_notation"]
+    if checks["compliant"]:
+        recommendations = []
+        notes = (
+            "Settled by local rule checks; the proposed notation follows the "
+            "mechanical rules and matches the reference romanization."
+        )
+    else:
+        recommendations = checks["violations"] + [
+            f"Use '{suggested}' instead of '{proposed}'"
+        ]
+        notes = (
+            "Settled by local rule checks; the proposed notation breaks "
+            "mechanical hyphenation or capitalization rules."
+        )
+    evaluation = {
+        "name": name,
+        "english_notation": suggested,
+        "romanization_compliant": checks["romanization_compliant"],
+        "hyphenation_compliant": checks["hyphenation_compliant"],
+        "capitalization_compliant": checks["capitalization_compliant"],
+        "verification_process": {},
+        "verification_sources": ["CF Terminology Management Manual"],
+        "reference_links": [],
+        "termbase_entry": {},
+        "compliant": checks["compliant"],
+        "overall_score": checks["score"],
+        "recommendations": recommendations,
+        "rule_violations": checks["violations"],
+        "notes": notes,
+        "teamwork_verification": teamwork_results,
+        "evaluation_tier": "rules",
+        "name_type": name_type,
+    }
+    hangul, _ = split_name_pair(normalize_name(name))
+    return apply_reference_romanization(evaluation, hangul)
+
+
+def apply_rule_checks(
+    evaluation: Dict[str, Any],
+    hangul: Optional[str] = None,
+    name_type: str = "person",
+) -> Dict[str, Any]:
+    """
+    Replace the model's compliance flags with the local rule engine's verdict.
+
+    Args:
+        evaluation: Evaluation built from the model response
+        hangul: Original Hangul name, used to count given-name syllables
+        name_type: One of name_rules.NAME_TYPES
+
+    Returns:
+        The same evaluation, updated in place
+    """
+    evaluation["evaluation_tier"] = "llm"
+    notation = evaluation.get("english_notation")
+    if not notation:
+        return evaluation
+    apply_reference_romanization(evaluation, hangul)
+
+    checks = check_ko_en_notation(notation, hangul, name_type)
+    for flag in (
+        "romanization_compliant",
+        "hyphenation_compliant",
+        "capitalization_compliant",
+    ):
+        evaluation[flag] = checks[flag]
+    evaluation["rule_violations"] = checks["violations"]
+    if not (checks["hyphenation_compliant"] and checks["capitalization_compliant"]):
+        evaluation["compliant"] = False
+    if checks["violations"]:
+        evaluation["recommendations"] = evaluation.get("recommendations", []) + [
+            f"Rule check: {violation}" for violation in checks["violations"]
+        ]
+    return evaluation
+
+
+def apply_reference_romanization(
+    evaluation: Dict[str, Any], hangul: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Score the evaluation's English notation against the local romanization.
+
+    Args:
+        evaluation: Evaluation with an english_notation
+        hangul: Original Hangul name
+
+    Returns:
+        The same evaluation, updated in place
+    """
+    notation = evaluation.get("english_notation")
+    if not (hangul and notation):
+        return evaluation
+
+    reference = score_notation(hangul, notation)
+    evaluation["reference_romanization"] = reference["reference_romanization"]
+    evaluation["romanization_score"] = reference["score"]
+    return evaluation
+
+
+def evaluate_korean_name(
+    name: str,
+    check_teamwork: bool = True,
+    local_tiers: bool = True,
+    similar_names: Optional[List[Dict[str, Any]]] = None,
+    name_type: str = "person",
+) -> Dict[str, Any]:
     """
     Evaluate a Korean name and provide English notation recommendations.
 
     Args:
         name: Korean name to evaluate
         check_teamwork: Whether to check Teamwork for previous translations
+        local_tiers: Whether to try the exact-hit and rule tiers before the
+                     model (False when tiered_evaluation has already tried them)
+        similar_names: Similar known names already found for the name by a
+                       batch lookup (looked up if omitted)
+        name_type: One of name_rules.NAME_TYPES (idol, animal, North Korean
+                   and organization names have their own rules)
 
     Returns:
         Dictionary with evaluation results
     """
-    # Get the evaluation function
-    evaluator = create_ko_to_en_evaluator()
+    # Get the shared evaluation function
+    evaluator = get_evaluator("KO-EN")
 
     # Check Teamwork if enabled
     teamwork_results = None
@@ -268,38 +548,47 @@ def evaluate_korean_name(name: str, check_teamwork: bool = True) -> Dict[str, An
             teamwork_results = None
 
     # Run the evaluation
-    return evaluator(name, teamwork_results)
+    return evaluator(name, teamwork_results, local_tiers, similar_names, name_type)
 
 
-def evaluate_korean_names(names: List[str], check_teamwork: bool = True) -> List[Dict]:
+def evaluate_korean_names(
+    names: List[str], check_teamwork: bool = True, name_type: str = "person"
+) -> List[Dict]:
     """
     Evaluates multiple Korean names for English notation.
 
     Args:
         names: List of Korean names to evaluate
         check_teamwork: Whether to check Teamwork for previous translations
+        name_type: One of name_rules.NAME_TYPES, applied to every name
 
     Returns:
         List of dictionaries with evaluation results
     """
     results = []
-
-    # Create the evaluator function
-    evaluator = create_ko_to_en_evaluator()
-
-    # Process each name
-    for name in names:
-        print(f"Evaluating '{name}'...")
-        result = evaluator(name, check_teamwork)
-        # Convert Pydantic model to dict if necessary
-        if hasattr(result, "model_dump"):
-            result = result.model_dump()
-        results.append(result)
-
-    # Save results to file
-    os.makedirs("reports", exist_ok=True)
-    with open("reports/korean_to_english_results.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    results_path = "reports/korean_to_english_results.json"
+
+    # Look up the similar names of the whole batch in one pass
+    similar = find_similar_names_batch(names)
+
+    # Process each name with the shared evaluator, streaming each result
+    with ResultStream(stream_path_for(results_path)) as stream:
+        for index, name in enumerate(names):
+            print(f"Evaluating '{name}'...")
+            result = evaluate_korean_name(
+                name,
+                check_teamwork,
+                similar_names=similar[index],
+                name_type=name_type,
+            )
+            # Convert Pydantic model to dict if necessary
+            if hasattr(result, "model_dump"):
+                result = result.model_dump()
+            stream.write(index, result)
+            results.append(result)
+
+    # Rebuild the legacy JSON file from the stream
+    rebuild_json(stream.path, results_path)
 
     return results
 
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+LLM Response Cache for CF Name Evaluation System.
+
+This module keeps model responses for name evaluations on disk so that names
+resubmitted across jobs are not sent to OpenAI again. Responses are
+content-addressed: the key is a hash of the normalized name, the direction,
+the model name and temperature, a hash of the prompt template and a hash of
+the Teamwork context given to the model. Any change to one of these produces
+a different key, so a cached response is only reused for an identical
+request.
+
+The cache is also tied to the verification resources in
+terminologists_manual_links. When their fingerprint changes, every cached
+response is dropped on first use, since the prompts were built from the old
+resources.
+
+The module includes:
+- Key construction from names, model settings, prompt and context hashes
+- A get-or-compute helper used by the KO-EN, EN-KO and generic evaluators
+- Invalidation when the verification resources change
+- A small CLI to show statistics or clear the cache
+"""
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+
+from persistent_cache import PersistentCache, get_cache
+from terminologists_manual_links import get_resources_fingerprint
+
+# Load environment variables
+load_dotenv()
+
+# Cache settings (a TTL of 0 disables the cache)
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", str(30 * 24 * 3600)))
+LLM_CACHE_SIZE = int(os.environ.get("LLM_CACHE_SIZE", "20000"))
+
+# Entry holding the fingerprint of the resources the cached responses used
+FINGERPRINT_KEY = "__resources_fingerprint__"
+
+_fingerprint_checked = False
+_fingerprint_lock = threading.Lock()
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _resources_fingerprint() -> str:
+    """Fingerprint of the verification resources, computed once per process."""
+    return get_resources_fingerprint()
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for use in a cache key.
+
+    Applies Unicode NFC and collapses whitespace. Case is kept, since
+    capitalization is one of the things being evaluated.
+
+    Args:
+        name: Name as submitted
+
+    Returns:
+        Normalized name
+    """
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", name)).strip()
+
+
+def prompt_fingerprint(prompt: Any) -> str:
+    """
+    Hash a prompt template, including any partial variables bound to it.
+
+    Args:
+        prompt: ChatPromptTemplate (or a plain template string)
+
+    Returns:
+        Hex digest of the template
+    """
+    if isinstance(prompt, str):
+        return _digest(prompt)
+
+    parts = []
+    for message in getattr(prompt, "messages", []):
+        template = getattr(getattr(message, "prompt", None), "template", None)
+        parts.append(template if template is not None else repr(message))
+    partials = getattr(prompt, "partial_variables", None) or {}
+    parts.extend(f"{key}={value}" for key, value in sorted(partials.items()))
+    return _digest("\x00".join(parts))
+
+
+def response_cache_key(
+    name: str,
+    direction: str,
+    model_name: str,
+    temperature: float,
+    prompt_hash: str,
+    context: str = "",
+) -> str:
+    """
+    Build the content-addressed key for an evaluation request.
+
+    Args:
+        name: Name being evaluated
+        direction: Evaluation direction (e.g. "KO-EN")
+        model_name: OpenAI model name
+        temperature: Sampling temperature
+        prompt_hash: Fingerprint of the prompt template
+        context: Teamwork context text given to the model
+
+    Returns:
+        Hex digest key
+    """
+    parts = [
+        normalize_name(name),
+        direction,
+        model_name,
+        repr(float(temperature)),
+        prompt_hash,
+        _digest(context or ""),
+        _resources_fingerprint(),
+    ]
+    return _digest(json.dumps(parts, ensure_ascii=False))
+
+
+def get_response_cache() -> PersistentCache:
+    """
+    Get the response cache, dropping its entries if the resources changed.
+
+    Returns:
+        Shared PersistentCache for LLM responses
+    """
+    global _fingerprint_checked
+
+    cache = get_cache("llm_responses", ttl=LLM_CACHE_TTL, max_entries=LLM_CACHE_SIZE)
+    with _fingerprint_lock:
+        if not _fingerprint_checked and cache.enabled:
+            fingerprint = _resources_fingerprint()
+            stored = cache.peek(FINGERPRINT_KEY)
+            if stored is not None and stored != fingerprint:
+                print("Verification resources changed, clearing cached LLM responses")
+                cache.clear()
+            if stored != fingerprint:
+                cache.set(FINGERPRINT_KEY, fingerprint)
+            _fingerprint_checked = True
+    return cache
+
+
+def cached_llm_call(
+    call: Callable[[], Any],
+    name: str,
+    direction: str,
+    model_name: str,
+    temperature: float,
+    prompt_hash: str,
+    context: str = "",
+) -> Any:
+    """
+    Return a cached model response, or call the model and cache its response.
+
+    Args:
+        call: Function making the model call; must return a JSON-serialisable value
+        name: Name being evaluated
+        direction: Evaluation direction (e.g. "KO-EN")
+        model_name: OpenAI model name
+        temperature: Sampling temperature
+        prompt_hash: Fingerprint of the prompt template
+        context: Teamwork context text given to the model
+
+    Returns:
+        The model response
+    """
+    cache = get_response_cache()
+    key = response_cache_key(
+        name, direction, model_name, temperature, prompt_hash, context
+    )
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = call()
+    cache.set(key, response)
+    return response
+
+
+def invalidate_response_cache():
+    """Remove every cached LLM response."""
+    get_response_cache().clear()
+    print("Cleared cached LLM responses")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the LLM response cache")
+    parser.add_argument("command", choices=["stats", "clear"], help="Action to run")
+    args = parser.parse_args()
+
+    if args.command == "clear":
+        invalidate_response_cache()
+    else:
+        stats = get_response_cache().stats()
+        print(f"Cached responses: {stats['entries']}")
+        print(f"TTL: {LLM_CACHE_TTL:.0f}s, size bound: {LLM_CACHE_SIZE} entries")
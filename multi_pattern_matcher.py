@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Multi-Pattern String Matching for CF Name Evaluation System.
+
+This module provides an Aho–Corasick automaton used to find many names in a
+body of text in a single pass. It lets batch operations (such as verifying a
+list of names against every Teamwork task) scan each text once regardless of
+how many names are being looked for.
+
+The module includes:
+- An Aho–Corasick automaton with goto, failure and output links
+- Case-insensitive matching helpers keyed by the caller's pattern identifiers
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class AhoCorasickMatcher:
+    """Aho–Corasick automaton for matching many patterns in one scan."""
+
+    def __init__(self, case_sensitive: bool = False):
+        """
+        Initialize an empty matcher.
+
+        Args:
+            case_sensitive: Whether patterns and texts are compared as-is
+                            (otherwise both are lowercased)
+        """
+        self.case_sensitive = case_sensitive
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[Hashable]] = [set()]
+        self._built = False
+
+    def __len__(self) -> int:
+        return sum(1 for out in self._output if out)
+
+    def _prepare(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def add_pattern(self, pattern: str, key: Hashable):
+        """
+        Add a pattern to the automaton.
+
+        Args:
+            pattern: Text to look for
+            key: Identifier reported when the pattern is found
+        """
+        pattern = self._prepare(pattern)
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(key)
+        self._built = False
+
+    def add_patterns(self, patterns: Iterable[Tuple[str, Hashable]]):
+        """
+        Add several (pattern, key) pairs to the automaton.
+
+        Args:
+            patterns: Iterable of (pattern, key) tuples
+        """
+        for pattern, key in patterns:
+            self.add_pattern(pattern, key)
+
+    def build(self):
+        """Compute failure links; called automatically before the first search."""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+        self._built = True
+
+    def find_keys(self, text: str) -> Set[Hashable]:
+        """
+        Find which patterns occur in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keys whose patterns occur at least once
+        """
+        if not self._built:
+            self.build()
+
+        found = set()
+        state = 0
+        for char in self._prepare(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+        return found
@@ -22,21 +22,35 @@ guidelines specified in the CF Terminology Management Manual.
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 
-from english_to_korean_evaluator import evaluate_english_names
+import english_to_korean_evaluator
+import english_transliteration
+import hangul_phonetic_index
+import korean_romanization
+import korean_to_english_evaluator
+import llm_response_cache
+import name_normalization
+import name_rules
+import name_similarity
+import teamwork_integration
+import termbase_data
+import termbase_exact_index
+import termbase_index
+import tiered_evaluation
 from english_to_korean_evaluator import (
     generate_termbase_entries as generate_en_ko_termbase_entries,
 )
 from korean_name_evaluator import batch_evaluate_names as evaluate_ko_names
 from korean_name_evaluator import generate_html_report
-from korean_to_english_evaluator import evaluate_korean_names
 from korean_to_english_evaluator import (
     generate_termbase_entries as generate_ko_en_termbase_entries,
 )
@@ -63,9 +77,20 @@ except ImportError:
         pass
 
 
-from teamwork_integration import post_evaluation_to_teamwork, verify_name_in_teamwork
+from evaluator_registry import get_model_config
+from jsonl_stream import ResultStream, load_completed, rebuild_json, stream_path_for
+from name_normalization import (
+    comparison_key,
+    evaluate_unique,
+    normalize_name,
+    split_name_pair,
+)
+from persistent_cache import print_cache_stats
+from teamwork_integration import post_evaluations_to_teamwork, verify_names_in_teamwork
+from tiered_evaluation import TierStats, evaluate_tiered
 from terminologists_manual_links import (
     DATA_DIR,
+    get_resources_fingerprint,
     get_resources_for_direction,
     get_verification_process_text,
     load_manual_content,
@@ -108,6 +133,8 @@ def auto_detect_names(names: List[str]) -> Dict[str, List[str]]:
     """
     Automatically categorize names by detected language.
 
+    Variants of the same name are kept together so they can be de-duplicated.
+
     Args:
         names: List of names to categorize
 
@@ -116,13 +143,219 @@ def auto_detect_names(names: List[str]) -> Dict[str, List[str]]:
     """
     categorized = {"ko": [], "en": []}
 
-    for name in names:
-        lang = detect_language(name)
-        categorized[lang].append(name)
+    # Variants of the same name (e.g. "김지원 (Kim Ji-won)" and "Kim Jiwon")
+    # go to the same side: a romanized name that appears next to Hangul
+    # anywhere in the input is Korean
+    forms = [split_name_pair(normalize_name(name)) for name in names]
+    paired = {comparison_key(roman) for hangul, roman in forms if hangul and roman}
+
+    for name, (hangul, roman) in zip(names, forms):
+        if hangul or comparison_key(roman) in paired:
+            categorized["ko"].append(name)
+        else:
+            categorized[detect_language(name)].append(name)
 
     return categorized
 
 
+def post_results_to_teamwork(results: List[Dict[str, Any]], project_id: str):
+    """
+    Post evaluation results to Teamwork in bulk and report the outcome.
+
+    Args:
+        results: Evaluation result dictionaries
+        project_id: Teamwork project ID to create tasks in
+    """
+    summary = post_evaluations_to_teamwork(results, project_id=project_id)
+
+    for outcome in summary["outcomes"]:
+        name = outcome["name"]
+        if outcome["status"] == "posted":
+            print(f"✓ Posted evaluation for '{name}' to Teamwork: {outcome['message']}")
+        elif outcome["status"] == "skipped":
+            print(f"- Skipped '{name}': {outcome['message']}")
+        else:
+            print(
+                f"✗ Failed to post evaluation for '{name}' to Teamwork: {outcome['message']}"
+            )
+
+    print(
+        f"Teamwork posting: {summary['posted']} posted, {summary['skipped']} skipped, "
+        f"{summary['failed']} failed in {summary['elapsed']:.1f}s "
+        f"({summary['throughput']:.1f} posts/s)"
+    )
+
+
+# Sections of name_evaluation_results.json holding one entry per name
+RESULT_SECTIONS = ["ko_en_results", "en_ko_results", "teamwork_verification"]
+
+# Modules whose code determines evaluation results (prompts, rules,
+# dictionaries, local lookups, grouping of duplicates, the response cache key
+# and the Teamwork context added to prompts), hashed into the run configuration
+RESULT_MODULES = (
+    korean_to_english_evaluator,
+    english_to_korean_evaluator,
+    tiered_evaluation,
+    name_normalization,
+    llm_response_cache,
+    teamwork_integration,
+    name_rules,
+    korean_romanization,
+    english_transliteration,
+    termbase_data,
+    termbase_index,
+    termbase_exact_index,
+    name_similarity,
+    hangul_phonetic_index,
+)
+
+# Direction -> (full evaluator, confident local evaluator, preferred script)
+TIERED_EVALUATORS = {
+    "KO-EN": (
+        korean_to_english_evaluator.evaluate_korean_name,
+        korean_to_english_evaluator.evaluate_locally,
+        "hangul",
+    ),
+    "EN-KO": (
+        english_to_korean_evaluator.evaluate_english_name,
+        english_to_korean_evaluator.evaluate_locally,
+        "latin",
+    ),
+}
+
+
+def run_config_hash(
+    use_local_only: bool, verify_in_teamwork: bool, name_type: str = "person"
+) -> str:
+    """
+    Hash the configuration that determines a run's results.
+
+    Covers the model and temperature, the flags that change what evaluators
+    see, the code of RESULT_MODULES (the evaluators' prompts, the local rules
+    and dictionaries, the termbase lookups, duplicate grouping, the response
+    cache and the Teamwork prompt context) and the verification resources. A resumed run only reuses results produced under the same hash.
+
+    Args:
+        use_local_only: Whether only local resources are used
+        verify_in_teamwork: Whether Teamwork records are used
+        name_type: Name type the KO-EN rules are applied for
+
+    Returns:
+        Hex digest identifying the configuration
+    """
+    model_name, temperature = get_model_config()
+    digest = hashlib.sha256(
+        json.dumps(
+            {
+                "model": model_name,
+                "temperature": temperature,
+                "use_local_only": use_local_only,
+                "verify_in_teamwork": verify_in_teamwork,
+                "name_type": name_type,
+                "resources": get_resources_fingerprint(),
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+    for module in RESULT_MODULES:
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def evaluate_direction(
+    names: List[str],
+    direction: str,
+    check_teamwork: bool,
+    tier_stats: Optional[TierStats] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+    completed: Optional[Dict[str, Dict[str, Any]]] = None,
+    name_type: str = "person",
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate names in one direction, each distinct name once, tier by tier.
+
+    Args:
+        names: Names to evaluate (duplicates and variants allowed)
+        direction: "KO-EN" or "EN-KO"
+        check_teamwork: Whether to use Teamwork records
+        tier_stats: Counters recording which tier settled each name
+        on_result: Function called with (input position, result) as soon as
+                   each name is settled
+        completed: Results of an interrupted run keyed by input name; these
+                   names are not evaluated again
+        name_type: One of name_rules.NAME_TYPES, applied to every KO-EN name
+
+    Returns:
+        One result per input name, in input order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(names)
+    remaining: List[int] = []
+    for i, name in enumerate(names):
+        if completed and name in completed:
+            results[i] = completed[name]
+            if tier_stats is not None:
+                tier_stats.record("resumed", 0.0)
+            if on_result is not None:
+                on_result(i, results[i])
+        else:
+            remaining.append(i)
+
+    if len(remaining) < len(names):
+        print(
+            f"Resuming: {len(names) - len(remaining)} of {len(names)} {direction} "
+            f"names already evaluated, {len(remaining)} remaining"
+        )
+    if not remaining:
+        return results
+
+    evaluated = _evaluate_direction(
+        [names[i] for i in remaining],
+        direction,
+        check_teamwork,
+        tier_stats,
+        on_result=(
+            None
+            if on_result is None
+            else lambda j, result: on_result(remaining[j], result)
+        ),
+        name_type=name_type,
+    )
+    for i, result in zip(remaining, evaluated):
+        results[i] = result
+    return results
+
+
+def _evaluate_direction(
+    names: List[str],
+    direction: str,
+    check_teamwork: bool,
+    tier_stats: Optional[TierStats] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+    name_type: str = "person",
+) -> List[Dict[str, Any]]:
+    """Evaluate names in one direction, without reusing earlier results."""
+    evaluate_one, evaluate_locally, prefer = TIERED_EVALUATORS[direction]
+    if direction == "KO-EN":
+        # The KO-EN rules depend on the type of name
+        evaluate_one = functools.partial(evaluate_one, name_type=name_type)
+        evaluate_locally = functools.partial(evaluate_locally, name_type=name_type)
+    return evaluate_unique(
+        names,
+        lambda unique, done=None: evaluate_tiered(
+            unique,
+            direction,
+            evaluate_one,
+            evaluate_locally,
+            check_teamwork=check_teamwork,
+            stats=tier_stats,
+            on_result=done,
+        ),
+        prefer=prefer,
+        on_result=on_result,
+    )
+
+
 def process_names(
     names: List[str],
     direction: Optional[str] = None,
@@ -133,6 +366,8 @@ def process_names(
     post_to_teamwork: bool = False,
     teamwork_project_id: Optional[str] = None,
     use_local_only: bool = False,
+    resume: bool = False,
+    name_type: str = "person",
 ) -> Dict[str, Any]:
     """
     Process names through the appropriate evaluator based on direction or auto-detection.
@@ -147,6 +382,11 @@ def process_names(
         post_to_teamwork: Whether to post evaluation results to Teamwork
         teamwork_project_id: Optional Teamwork project ID for creating tasks
         use_local_only: Whether to use only local resources available in the data directory
+        resume: Whether to reuse the results an interrupted run with the same
+                configuration left in the output directory
+        name_type: One of name_rules.NAME_TYPES; the KO-EN rules for idol,
+                   animal, North Korean and organization names are applied to
+                   every Korean name when it is not "person"
 
     Returns:
         Dictionary with evaluation results
@@ -154,7 +394,37 @@ def process_names(
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    results = {"ko_en_results": [], "en_ko_results": [], "teamwork_verification": []}
+    results = {section: [] for section in RESULT_SECTIONS}
+    tier_stats = TierStats()
+
+    # Stream every result to disk as soon as it is produced
+    results_file = os.path.join(output_dir, "name_evaluation_results.json")
+    stream_path = stream_path_for(results_file)
+    config_hash = run_config_hash(use_local_only, verify_in_teamwork, name_type)
+
+    # Load what an interrupted run with the same configuration finished
+    completed: Dict[str, Dict[str, Any]] = {}
+    if resume:
+        completed = load_completed(stream_path, config_hash, RESULT_SECTIONS)
+        reused = sum(len(by_name) for by_name in completed.values())
+        print(f"Found {reused} completed results to reuse in {stream_path}")
+
+    stream = ResultStream(stream_path, config_hash=config_hash)
+
+    # Input names of each section, by position within the section
+    categorized = auto_detect_names(names) if auto_detect else None
+    if completed:
+        section_names = {"teamwork_verification": names}
+        if categorized is not None:
+            section_names["ko_en_results"] = categorized["ko"]
+            section_names["en_ko_results"] = categorized["en"]
+        elif direction == "KO-EN":
+            section_names["ko_en_results"] = names
+        elif direction == "EN-KO":
+            section_names["en_ko_results"] = names
+        # Put the reused results back on disk before any network work, so a
+        # failure during the resumed run cannot lose them
+        stream.write_completed(completed, section_names)
 
     # Log message about local resources mode
     if use_local_only:
@@ -181,27 +451,33 @@ def process_names(
     # First verify names in Teamwork if enabled
     if verify_in_teamwork and os.environ.get("TEAMWORK_API_KEY"):
         print("Verifying names in Teamwork...")
-        teamwork_results = []
-        for name in names:
-            verification = verify_name_in_teamwork(name)
-            teamwork_results.append(verification)
+        teamwork_results = verify_names_in_teamwork(names)
+        for verification in teamwork_results:
+            name = verification["name"]
             if verification["found_in_teamwork"]:
                 print(f"✓ Found previous entries for '{name}' in Teamwork")
             else:
                 print(f"✗ No previous entries for '{name}' in Teamwork")
 
         results["teamwork_verification"] = teamwork_results
+        for index, verification in enumerate(teamwork_results):
+            stream.write(index, verification, "teamwork_verification")
 
     if auto_detect:
         print("Auto-detecting name languages...")
-        categorized = auto_detect_names(names)
 
         # Process Korean names (KO-EN direction)
         if categorized["ko"]:
             print(f"Processing {len(categorized['ko'])} Korean names (KO-EN)...")
             # Use the specialized Korean to English evaluator
-            ko_results = evaluate_korean_names(
-                categorized["ko"], check_teamwork=verify_in_teamwork
+            ko_results = evaluate_direction(
+                categorized["ko"],
+                "KO-EN",
+                verify_in_teamwork,
+                tier_stats,
+                on_result=stream.writer_for("ko_en_results", categorized["ko"]),
+                completed=completed.get("ko_en_results"),
+                name_type=name_type,
             )
             results["ko_en_results"] = ko_results
 
@@ -236,27 +512,18 @@ def process_names(
                 and teamwork_project_id
             ):
                 print("Posting Korean name evaluations to Teamwork...")
-                for result in ko_results:
-                    name = result.get("name", "")
-                    success, message = post_evaluation_to_teamwork(
-                        name=name,
-                        evaluation_results=result,
-                        project_id=teamwork_project_id,
-                    )
-                    if success:
-                        print(
-                            f"✓ Posted evaluation for '{name}' to Teamwork: {message}"
-                        )
-                    else:
-                        print(
-                            f"✗ Failed to post evaluation for '{name}' to Teamwork: {message}"
-                        )
+                post_results_to_teamwork(ko_results, teamwork_project_id)
 
         # Process English names (EN-KO direction)
         if categorized["en"]:
             print(f"Processing {len(categorized['en'])} English names (EN-KO)...")
-            en_results = evaluate_english_names(
-                categorized["en"], check_teamwork=verify_in_teamwork
+            en_results = evaluate_direction(
+                categorized["en"],
+                "EN-KO",
+                verify_in_teamwork,
+                tier_stats,
+                on_result=stream.writer_for("en_ko_results", categorized["en"]),
+                completed=completed.get("en_ko_results"),
             )
             results["en_ko_results"] = en_results
 
@@ -286,27 +553,21 @@ def process_names(
                 and teamwork_project_id
             ):
                 print("Posting English name evaluations to Teamwork...")
-                for result in en_results:
-                    name = result.get("name", "")
-                    success, message = post_evaluation_to_teamwork(
-                        name=name,
-                        evaluation_results=result,
-                        project_id=teamwork_project_id,
-                    )
-                    if success:
-                        print(
-                            f"✓ Posted evaluation for '{name}' to Teamwork: {message}"
-                        )
-                    else:
-                        print(
-                            f"✗ Failed to post evaluation for '{name}' to Teamwork: {message}"
-                        )
+                post_results_to_teamwork(en_results, teamwork_project_id)
     elif direction:
         # Process with specific direction
         if direction == "KO-EN":
             print(f"Processing {len(names)} Korean names for English notation...")
             # Use the specialized Korean to English evaluator
-            ko_results = evaluate_korean_names(names, check_teamwork=verify_in_teamwork)
+            ko_results = evaluate_direction(
+                names,
+                "KO-EN",
+                verify_in_teamwork,
+                tier_stats,
+                on_result=stream.writer_for("ko_en_results", names),
+                completed=completed.get("ko_en_results"),
+                name_type=name_type,
+            )
             results["ko_en_results"] = ko_results
 
             # Trace evaluations to LangSmith if enabled
@@ -340,26 +601,17 @@ def process_names(
                 and teamwork_project_id
             ):
                 print("Posting Korean name evaluations to Teamwork...")
-                for result in ko_results:
-                    name = result.get("name", "")
-                    success, message = post_evaluation_to_teamwork(
-                        name=name,
-                        evaluation_results=result,
-                        project_id=teamwork_project_id,
-                    )
-                    if success:
-                        print(
-                            f"✓ Posted evaluation for '{name}' to Teamwork: {message}"
-                        )
-                    else:
-                        print(
-                            f"✗ Failed to post evaluation for '{name}' to Teamwork: {message}"
-                        )
+                post_results_to_teamwork(ko_results, teamwork_project_id)
 
         elif direction == "EN-KO":
             print(f"Processing {len(names)} English names for Korean notation...")
-            en_results = evaluate_english_names(
-                names, check_teamwork=verify_in_teamwork
+            en_results = evaluate_direction(
+                names,
+                "EN-KO",
+                verify_in_teamwork,
+                tier_stats,
+                on_result=stream.writer_for("en_ko_results", names),
+                completed=completed.get("en_ko_results"),
             )
             results["en_ko_results"] = en_results
 
@@ -389,21 +641,7 @@ def process_names(
                 and teamwork_project_id
             ):
                 print("Posting English name evaluations to Teamwork...")
-                for result in en_results:
-                    name = result.get("name", "")
-                    success, message = post_evaluation_to_teamwork(
-                        name=name,
-                        evaluation_results=result,
-                        project_id=teamwork_project_id,
-                    )
-                    if success:
-                        print(
-                            f"✓ Posted evaluation for '{name}' to Teamwork: {message}"
-                        )
-                    else:
-                        print(
-                            f"✗ Failed to post evaluation for '{name}' to Teamwork: {message}"
-                        )
+                post_results_to_teamwork(en_results, teamwork_project_id)
         else:
             print(f"Unknown direction: {direction}. Please use 'KO-EN' or 'EN-KO'.")
     else:
@@ -411,10 +649,13 @@ def process_names(
             "Please specify a direction ('KO-EN' or 'EN-KO') or enable auto-detection."
         )
 
-    # Save all results to JSON file
-    results_file = os.path.join(output_dir, "name_evaluation_results.json")
-    with open(results_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
+    tier_stats.print_summary()
+    results["tier_stats"] = tier_stats.summary()
+    stream.write_value("tier_stats", results["tier_stats"])
+    stream.close()
+
+    # Rebuild the legacy JSON file from the stream
+    rebuild_json(stream.path, results_file, sections=RESULT_SECTIONS)
 
     return results
 
@@ -458,6 +699,14 @@ def parse_arguments():
         help="Automatically detect language and use appropriate evaluator",
     )
 
+    parser.add_argument(
+        "--name-type",
+        choices=name_rules.NAME_TYPES,
+        default="person",
+        help="Type of the Korean names, for the rules specific to idol, animal, "
+        "North Korean and organization names (default: person)",
+    )
+
     # Output options
     parser.add_argument(
         "--output-dir",
@@ -466,6 +715,13 @@ def parse_arguments():
         help="Directory to store evaluation reports and results",
     )
 
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse the results an interrupted run with the same configuration "
+        "left in the output directory and evaluate only the remaining names",
+    )
+
     # Resource options
     parser.add_argument(
         "--local-only",
@@ -649,6 +905,8 @@ def main():
         post_to_teamwork=post_to_teamwork,
         teamwork_project_id=args.teamwork_project_id,
         use_local_only=args.local_only,
+        resume=args.resume,
+        name_type=args.name_type,
     )
 
     # Print summary
@@ -675,6 +933,9 @@ def main():
 
     print(f"\nAll reports saved to: {args.output_dir}/")
 
+    # Print cache hit/miss counters for this run
+    print_cache_stats()
+
     # Print LangSmith info if applicable
     if LANGSMITH_AVAILABLE and not args.disable_tracing:
         project_name = os.environ.get("LANGCHAIN_PROJECT", "cf_name_evaluation")
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+"""
+Name Normalization and De-duplication for CF Name Evaluation System.
+
+Input files often list the same person several times in different shapes,
+for example "김지원 (Kim Ji-won)", "김지원" and "Kim Jiwon". This module
+groups such variants before evaluation so that each person is sent to the
+model once, and then copies each group's result back to every input
+position in the original order.
+
+Names are normalized with Unicode NFC, typographic punctuation folding and
+whitespace collapsing. "Hangul (Roman)" and "Roman (Hangul)" pairs are split
+into their two forms. A name written only in the source language of the
+direction (Hangul for KO-EN, Roman for EN-KO) is reduced to a comparison key
+(casefolded, with spaces, hyphens and other punctuation removed), so "김지원"
+and "김 지원" are evaluated once. A name that carries a notation in the
+target language is only merged with identical normalized names: its
+spelling, hyphenation and capitalization are what is evaluated, so
+"김지원 (Kim Ji-won)" and "김지원 (KIM JIWON)" need separate verdicts.
+
+The module includes:
+- Normalization, pair splitting and comparison key helpers
+- Grouping of name variants
+- A helper that evaluates each group once and fans results back out
+"""
+
+import copy
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Typographic punctuation folded to its ASCII equivalent
+PUNCTUATION_FOLDS = {
+    "\u2010": "-",  # hyphen
+    "\u2011": "-",  # non-breaking hyphen
+    "\u2012": "-",  # figure dash
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u2212": "-",  # minus sign
+    "\u00b7": " ",  # middle dot
+    "\u30fb": " ",  # katakana middle dot
+    "\u2018": "'",  # left single quotation mark
+    "\u2019": "'",  # right single quotation mark
+    "\u00a0": " ",  # no-break space
+    "\u3000": " ",  # ideographic space
+    "\uff08": "(",  # fullwidth left parenthesis
+    "\uff09": ")",  # fullwidth right parenthesis
+}
+
+# Brackets accepted around the second form of a name pair
+PAIR_PATTERN = re.compile(
+    r"^(?P<first>[^()\[\]]+?)\s*[(\[]\s*(?P<second>[^()\[\]]+?)\s*[)\]]$"
+)
+
+# Characters ignored when comparing name variants
+KEY_IGNORED = re.compile(r"[\s\-'.,_/]+")
+
+
+def contains_hangul(text: str) -> bool:
+    """Check whether a text contains any Hangul syllables or jamo."""
+    return any(
+        "\uac00" <= char <= "\ud7a3" or "\u1100" <= char <= "\u11ff" for char in text
+    )
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize how a name is written without changing its spelling.
+
+    Applies Unicode NFC, folds typographic dashes, dots, quotes, spaces and
+    fullwidth brackets to ASCII, and collapses whitespace.
+
+    Args:
+        name: Name as submitted
+
+    Returns:
+        Normalized name
+    """
+    name = unicodedata.normalize("NFC", name)
+    name = "".join(PUNCTUATION_FOLDS.get(char, char) for char in name)
+    return re.sub(r"\s+", " ", name).strip()
+
+
+def split_name_pair(name: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a name into its Hangul and romanized forms.
+
+    Handles "김지원 (Kim Ji-won)" and "Kim Ji-won (김지원)" pairs as well as
+    names written in only one script.
+
+    Args:
+        name: Normalized name
+
+    Returns:
+        Tuple of (Hangul form or None, romanized form or None)
+    """
+    match = PAIR_PATTERN.match(name)
+    if match:
+        first, second = match.group("first"), match.group("second")
+        if contains_hangul(first) and not contains_hangul(second):
+            return first, second
+        if contains_hangul(second) and not contains_hangul(first):
+            return second, first
+
+    if contains_hangul(name):
+        return name, None
+    return None, name
+
+
+def comparison_key(form: str) -> str:
+    """
+    Reduce one form of a name to the key used to detect duplicates.
+
+    Args:
+        form: Hangul or romanized form of a name
+
+    Returns:
+        Casefolded form without spaces, hyphens or punctuation
+    """
+    return KEY_IGNORED.sub("", form.casefold())
+
+
+@dataclass
+class NameGroup:
+    """Input names that refer to the same person."""
+
+    indices: List[int] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    hangul_key: Optional[str] = None
+
+    @property
+    def has_hangul(self) -> bool:
+        """Whether any variant in the group is written in Hangul."""
+        return self.hangul_key is not None
+
+    def representative(self, prefer: str = "hangul") -> str:
+        """
+        Pick the variant that is sent for evaluation.
+
+        Args:
+            prefer: "hangul" to prefer a variant containing Hangul (KO-EN),
+                    "latin" to prefer a variant without Hangul (EN-KO)
+
+        Returns:
+            First variant, in input order, written in the preferred script
+        """
+        for name in self.names:
+            if contains_hangul(name) == (prefer == "hangul"):
+                return name
+        return self.names[0]
+
+
+def group_key(name: str, prefer: str = "hangul") -> str:
+    """
+    Get the key under which variants of a normalized name are grouped.
+
+    Args:
+        name: Normalized name
+        prefer: "hangul" when Hangul is the source language (KO-EN), "latin"
+                when Roman is (EN-KO)
+
+    Returns:
+        The comparison key of a name written only in the source language, or
+        the name itself when it carries a target-language notation
+    """
+    hangul, roman = split_name_pair(name)
+    source, target = (hangul, roman) if prefer == "hangul" else (roman, hangul)
+    if source and not target:
+        return ("ko:" if prefer == "hangul" else "en:") + comparison_key(source)
+    # The submitted notation is evaluated as written
+    return "as:" + name
+
+
+def group_names(names: List[str], prefer: str = "hangul") -> List[NameGroup]:
+    """
+    Group input names that are variants of the same name.
+
+    Args:
+        names: Names as submitted
+        prefer: "hangul" when Hangul is the source language (KO-EN), "latin"
+                when Roman is (EN-KO)
+
+    Returns:
+        Groups in order of first appearance
+    """
+    groups: Dict[str, NameGroup] = {}
+    for i, name in enumerate(names):
+        name = normalize_name(name)
+        hangul, _ = split_name_pair(name)
+        group = groups.setdefault(
+            group_key(name, prefer),
+            NameGroup(hangul_key=comparison_key(hangul) if hangul else None),
+        )
+        group.indices.append(i)
+        group.names.append(name)
+    return list(groups.values())
+
+
+def fan_out_group(
+    names: List[str], group: NameGroup, result: Dict, prefer: str
+) -> List[Tuple[int, Dict]]:
+    """
+    Copy one group's result to every input position of the group.
+
+    Args:
+        names: Names as submitted
+        group: Group the result belongs to
+        result: Result for the group's representative
+        prefer: Script preference used to pick the representative
+
+    Returns:
+        List of (input position, result) pairs
+    """
+    representative = group.representative(prefer)
+    copies = []
+    for position, i in enumerate(group.indices):
+        copied = result if position == 0 else copy.deepcopy(result)
+        if isinstance(copied, dict) and group.names[position] != representative:
+            copied = dict(copied, name=names[i], evaluated_name=representative)
+        copies.append((i, copied))
+    return copies
+
+
+def fan_out(
+    names: List[str], groups: List[NameGroup], results: List[Dict], prefer: str
+) -> List[Dict]:
+    """
+    Copy each group's result to every input position of the group.
+
+    Args:
+        names: Names as submitted
+        groups: Groups returned by group_names
+        results: One result per group, in group order
+        prefer: Script preference used to pick the representatives
+
+    Returns:
+        One result per input name, in input order
+    """
+    expanded: List[Optional[Dict]] = [None] * len(names)
+    for group, result in zip(groups, results):
+        for i, copied in fan_out_group(names, group, result, prefer):
+            expanded[i] = copied
+    return expanded
+
+
+def evaluate_unique(
+    names: List[str],
+    evaluate_batch: Callable[..., List[Dict]],
+    prefer: str = "hangul",
+    on_result: Optional[Callable[[int, Dict], None]] = None,
+) -> List[Dict]:
+    """
+    Evaluate each distinct name once and return results for every input.
+
+    Args:
+        names: Names as submitted (duplicates and variants allowed)
+        evaluate_batch: Function evaluating a list of names, returning results
+                        in the same order. When on_result is given it is also
+                        passed a callback to call with (position, result) as
+                        each unique name finishes.
+        prefer: "hangul" or "latin", the script of the variant to evaluate
+        on_result: Function called with (input position, result) for every
+                   input name as soon as its group's result is known
+
+    Returns:
+        One result per input name, in input order
+    """
+    groups = group_names(names, prefer)
+    representatives = [group.representative(prefer) for group in groups]
+    if len(representatives) < len(names):
+        print(
+            f"Collapsed {len(names)} input names into "
+            f"{len(representatives)} unique names"
+        )
+
+    if on_result is None:
+        results = evaluate_batch(representatives)
+    else:
+
+        def group_done(position: int, result: Dict):
+            for i, copied in fan_out_group(names, groups[position], result, prefer):
+                on_result(i, copied)
+
+        results = evaluate_batch(representatives, group_done)
+    return fan_out(names, groups, results, prefer)
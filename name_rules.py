@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+"""
+Deterministic Notation Rules for CF Name Evaluation System.
+
+This module checks English notations of Korean names against the mechanical
+rules of the CF Terminology Management Manual without calling a model. The
+checks run in microseconds and are applied before and after the LLM: a
+proposed notation that breaks a rule is settled locally, and the compliance
+flags of a model-recommended notation are always computed here rather than
+taken from the model.
+
+Rules implemented for an English target:
+- Romanization: every syllable of the given name is a valid Revised
+  Romanization syllable (surnames may also use their customary spellings)
+- Hyphenation: real-person given names are hyphenated between syllables;
+  North Korean style spaced syllables become one hyphenated given name with
+  the second syllable in lowercase; animal names are written without hyphens
+- Capitalization: the first letter of each word is capitalized and the rest
+  is lowercase, including the syllable after a hyphen; uppercase idol and
+  stage names are written the same way
+- Idol, stage and organization names follow their official notation, so only
+  their capitalization is checked
+
+The rules to apply depend on the name type (NAME_TYPES), which the caller
+supplies; names are checked as real people by default.
+
+When the Hangul name is known, an unbroken given name is split where its
+romanized Hangul syllables fall. A given name that does not spell those
+syllables (a customary spelling such as "Yuna" for 연아) can only be split
+by guessing, and the result says so, so the evaluators leave it to the model.
+
+The module includes:
+- A Revised Romanization syllable splitter
+- The romanized syllables of a Hangul given name
+- Per-rule checks returning violations and a corrected notation, per name
+  type
+- A combined checker returning the three compliance flags
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from korean_romanization import is_hangul_syllable, romanize_syllable, split_surname
+
+# Revised Romanization building blocks (longest spellings first)
+RR_INITIALS = [
+    "kk", "tt", "pp", "ss", "jj", "ch",
+    "g", "n", "d", "r", "m", "b", "s", "j", "k", "t", "p", "h", "",
+]  # fmt: skip
+RR_VOWELS = [
+    "yae", "yeo", "wae",
+    "ae", "ya", "eo", "ye", "wa", "oe", "yo", "wo", "we", "wi", "yu", "eu", "ui",
+    "a", "e", "o", "u", "i",
+]  # fmt: skip
+RR_FINALS = ["ng", "k", "n", "t", "l", "m", "p", ""]
+
+RR_SYLLABLE = re.compile(
+    "(?:{})(?:{})(?:{})".format(
+        "|".join(RR_INITIALS), "|".join(RR_VOWELS), "|".join(RR_FINALS)
+    )
+)
+
+# Name types with their own hyphenation or capitalization rules
+NAME_TYPES = ("person", "north_korean", "idol", "animal", "organization")
+
+# Customary surname spellings accepted alongside Revised Romanization
+SURNAME_SPELLINGS = {
+    "ahn", "an", "bae", "baek", "ban", "bang", "byun", "cha", "chae", "chang",
+    "cho", "choe", "choi", "choo", "chu", "chun", "chung", "do", "eom", "gil",
+    "go", "gong", "gu", "gwon", "ha", "han", "heo", "hong", "huh", "hwang",
+    "hyun", "im", "jang", "jeon", "jeong", "jin", "jo", "joo", "ju", "jung",
+    "kang", "ki", "kim", "ko", "kong", "koo", "kwak", "kwon", "lee", "lim",
+    "ma", "maeng", "min", "moon", "mun", "na", "nam", "noh", "o", "oh", "pak",
+    "paik", "park", "pyo", "rhee", "roh", "ryu", "seo", "seok", "seong",
+    "shin", "sin", "so", "sohn", "son", "song", "suh", "sung", "u", "uhm",
+    "won", "woo", "yang", "yeo", "yi", "yoo", "yoon", "yu", "yuk", "yun",
+    "namgung", "hwangbo", "jegal", "seonu", "dokgo", "sagong",
+}  # fmt: skip
+
+
+@lru_cache(maxsize=4096)
+def split_rr_syllables(
+    text: str, count: Optional[int] = None
+) -> Optional[Tuple[str, ...]]:
+    """
+    Split romanized text into Revised Romanization syllables.
+
+    Prefers the split with the fewest syllables, taking longer syllables
+    first when several splits have the same length.
+
+    Args:
+        text: Lowercase romanized text without spaces or hyphens
+        count: Required number of syllables, if known
+
+    Returns:
+        Tuple of syllables, or None if the text cannot be split
+    """
+
+    @lru_cache(maxsize=None)
+    def best(start: int, remaining: Optional[int]) -> Optional[Tuple[str, ...]]:
+        if start == len(text):
+            return () if remaining in (None, 0) else None
+        if remaining == 0:
+            return None
+
+        candidates = []
+        for end in range(len(text), start, -1):
+            piece = text[start:end]
+            if RR_SYLLABLE.fullmatch(piece):
+                rest = best(end, None if remaining is None else remaining - 1)
+                if rest is not None:
+                    candidates.append((piece,) + rest)
+                    if remaining is not None:
+                        break
+        if not candidates:
+            return None
+        return min(candidates, key=len)
+
+    return best(0, count)
+
+
+def hangul_given_syllables(hangul: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Romanize the given-name syllables of a Hangul full name one by one.
+
+    Args:
+        hangul: Hangul name, surname first
+
+    Returns:
+        Tuple of lowercase syllable romanizations, or None if the name has no
+        given name
+    """
+    if not hangul:
+        return None
+    _, given = split_surname(hangul)
+    syllables = tuple(romanize_syllable(c) for c in given if is_hangul_syllable(c))
+    return syllables or None
+
+
+def capitalize_word(word: str) -> str:
+    """Capitalize the first letter of a word and lowercase the rest."""
+    return word[:1].upper() + word[1:].lower()
+
+
+def check_capitalization(words: List[str], name_type: str = "person") -> List[str]:
+    """
+    Check that each word starts with a capital and is otherwise lowercase.
+
+    Args:
+        words: Words of the notation
+        name_type: One of NAME_TYPES
+
+    Returns:
+        List of violation messages
+    """
+    violations = []
+    for word in words:
+        if not any(c.isalpha() for c in word):
+            continue
+        if word != capitalize_word(word):
+            if word.isupper() and name_type == "idol":
+                violations.append(
+                    f"Uppercase stage name '{word}' should be written "
+                    f"'{capitalize_word(word)}'"
+                )
+            else:
+                violations.append(
+                    f"'{word}' should be capitalized as '{capitalize_word(word)}'"
+                )
+    return violations
+
+
+def check_ko_en_notation(
+    notation: str, hangul: Optional[str] = None, name_type: str = "person"
+) -> Dict[str, Any]:
+    """
+    Check an English notation of a Korean name against the mechanical rules.
+
+    Args:
+        notation: English notation to check (surname first, e.g. "Kim Ji-won")
+        hangul: Original Hangul name, used to find the given-name syllables
+        name_type: One of NAME_TYPES
+
+    Returns:
+        Dictionary with the three compliance flags, the violations found,
+        a corrected notation, a rule score (0-100) and whether the given-name
+        syllable boundaries were known ("syllables_verified") rather than
+        guessed (always True for name types without a given name)
+    """
+    if name_type not in NAME_TYPES:
+        raise ValueError(
+            f"Unknown name type '{name_type}'; use one of {', '.join(NAME_TYPES)}"
+        )
+    words = notation.split()
+    violations = {"romanization": [], "hyphenation": [], "capitalization": []}
+    if not words:
+        return {
+            "romanization_compliant": False,
+            "hyphenation_compliant": False,
+            "capitalization_compliant": False,
+            "violations": ["Empty notation"],
+            "suggested_notation": "",
+            "score": 0,
+            "compliant": False,
+            "syllables_verified": False,
+        }
+
+    violations["capitalization"] = check_capitalization(words, name_type)
+
+    if name_type in ("idol", "organization", "animal"):
+        # These names have no surname/given name structure: stage, group and
+        # organization names follow their official notation, and animal names
+        # are only written without hyphens
+        if name_type == "animal" and "-" in notation:
+            violations["hyphenation"].append("Animal names are written without hyphens")
+        suggested = " ".join(
+            capitalize_word(word.replace("-", "") if name_type == "animal" else word)
+            for word in words
+        )
+        flags = {f"{rule}_compliant": not found for rule, found in violations.items()}
+        all_violations = [m for found in violations.values() for m in found]
+        return {
+            **flags,
+            "violations": all_violations,
+            "suggested_notation": suggested,
+            "score": round(100 * sum(flags.values()) / len(flags)),
+            "compliant": not all_violations,
+            "syllables_verified": True,
+        }
+
+    if len(words) == 1:
+        # A single word has no surname/given name structure to check
+        surname, given_parts = None, words
+    else:
+        surname, given_parts = words[0], words[1:]
+
+    # Romanization: the surname may use a customary spelling, every other
+    # syllable must be Revised Romanization
+    if surname and surname.lower() not in SURNAME_SPELLINGS:
+        if not split_rr_syllables(surname.lower().replace("-", "")):
+            violations["romanization"].append(
+                f"Surname '{surname}' is not a Revised Romanization or customary spelling"
+            )
+
+    # Given name syllables: submitted hyphens or spaces mark the syllable
+    # boundaries; an unbroken given name is split where the romanized Hangul
+    # syllables fall, and only guessed from RR syllables when it does not
+    # spell them
+    reference = hangul_given_syllables(hangul)
+    expected = len(reference) if reference else None
+    given_notation = " ".join(given_parts)
+    pieces = [p for p in re.split(r"[\s-]+", given_notation.lower()) if p]
+    verified = len(pieces) > 1
+    if len(pieces) > 1:
+        syllables = tuple(pieces)
+        invalid = [p for p in pieces if not RR_SYLLABLE.fullmatch(p)]
+        if invalid:
+            violations["romanization"].append(
+                f"'{', '.join(invalid)}' in '{given_notation}' is not a Revised "
+                f"Romanization syllable"
+            )
+    elif pieces and reference and pieces[0] == "".join(reference):
+        syllables, verified = reference, True
+    else:
+        syllables = split_rr_syllables(pieces[0], expected) if pieces else ()
+        if syllables is None:
+            violations["romanization"].append(
+                f"'{given_notation}' does not split into "
+                f"{expected or 'valid'} Revised Romanization syllables"
+            )
+    if syllables and expected and len(syllables) != expected:
+        violations["romanization"].append(
+            f"'{given_notation}' has {len(syllables)} syllables but the Hangul "
+            f"given name has {expected}"
+        )
+
+    # Hyphenation
+    suggested_given = given_notation
+    if surname and syllables:
+        suggested_given = capitalize_word("-".join(syllables))
+        if len(given_parts) > 1:
+            violations["hyphenation"].append(
+                f"Spaced North Korean given name '{given_notation}' should be "
+                f"hyphenated with a lowercase second syllable: '{suggested_given}'"
+                if name_type == "north_korean"
+                else f"Spaced given name '{given_notation}' should be one "
+                f"hyphenated word '{suggested_given}'"
+            )
+        elif len(syllables) > 1 and len(pieces) == 1:
+            violations["hyphenation"].append(
+                f"Given name '{given_notation}' should be hyphenated as "
+                f"'{suggested_given}'"
+                if verified
+                else f"Given name '{given_notation}' should be hyphenated "
+                "between its syllables"
+            )
+
+    if surname:
+        suggested = f"{capitalize_word(surname)} {suggested_given}".strip()
+    else:
+        suggested = " ".join(capitalize_word(word) for word in suggested_given.split())
+
+    flags = {f"{rule}_compliant": not found for rule, found in violations.items()}
+    all_violations = [message for found in violations.values() for message in found]
+    return {
+        **flags,
+        "violations": all_violations,
+        "suggested_notation": suggested,
+        "score": round(100 * sum(flags.values()) / len(flags)),
+        "compliant": not all_violations,
+        "syllables_verified": verified,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Check English notations of Korean names against CF rules"
+    )
+    parser.add_argument("notations", nargs="+", help="Notations such as 'Kim Ji-won'")
+    parser.add_argument("--hangul", help="Original Hangul name")
+    parser.add_argument("--name-type", default="person", choices=NAME_TYPES)
+    args = parser.parse_args()
+
+    for notation in args.notations:
+        result = check_ko_en_notation(notation, args.hangul, args.name_type)
+        status = "✓" if result["compliant"] else "✗"
+        print(f"{status} {notation} (suggested: {result['suggested_notation']})")
+        for violation in result["violations"]:
+            print(f"  - {violation}")
@@ -0,0 +1,512 @@
+#!/usr/bin/env python
+"""
+Fuzzy Name Retrieval for CF Name Evaluation System.
+
+"Kim Ji-won", "Kim Jiwon", "Gim Ji-won" and "Kim Ji Won" are the same name,
+but the substring searches used for Teamwork lookups only find the spelling
+they were given. This module finds the known names closest to a query in the
+local termbase workbooks (termbase_data) and the "Name Evaluation" tasks of
+the local Teamwork task index, so the evaluators can show the model how a
+name, or a near-identical spelling of it, was written before.
+
+Names are reduced to name_normalization.comparison_key form (casefolded,
+without spaces, hyphens or punctuation) and split into character bigrams,
+with ^ and $ marking the start and the end. An inverted index maps each
+bigram to the names containing it, stored as flat NumPy posting arrays.
+Retrieval runs in two stages:
+1. Candidates: the postings of every query bigram are gathered with NumPy and
+   the shared bigrams counted per name, for a whole batch of queries at once.
+   The SIMILAR_NAMES_CANDIDATES names with the highest Dice coefficient are
+   kept for each query.
+2. Re-ranking: candidates are scored with the Jaro-Winkler similarity and
+   dropped when their Levenshtein distance exceeds a bound that grows with
+   the length of the name (one edit per SIMILAR_NAMES_CHARS_PER_EDIT
+   characters). The distance computation stops as soon as the bound is
+   exceeded.
+
+The index is built once per process and rebuilt when the termbase workbooks
+change or the Teamwork index is refreshed.
+
+The module includes:
+- Bounded Levenshtein distance and Jaro-Winkler similarity
+- A bigram inverted index with vectorized batch candidate retrieval
+- The find_similar_names API and its batch form
+- Prompt formatting of the similar names for the evaluators
+- A CLI for querying the index
+"""
+
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from name_normalization import comparison_key, normalize_name, split_name_pair
+from termbase_data import (
+    files_fingerprint,
+    load_termbase_entries,
+    resource_label,
+    termbase_files,
+)
+
+# Import the Teamwork task index if available
+try:
+    from teamwork_integration import EVALUATION_NOTATION_PATTERN, evaluation_task_title
+    from teamwork_task_index import get_task_index
+
+    TEAMWORK_AVAILABLE = True
+except ImportError:
+    TEAMWORK_AVAILABLE = False
+
+# Load environment variables
+load_dotenv()
+
+# Number of similar names returned, and candidates re-ranked per query
+SIMILAR_NAMES_K = int(os.environ.get("SIMILAR_NAMES_K", "5"))
+SIMILAR_NAMES_CANDIDATES = int(os.environ.get("SIMILAR_NAMES_CANDIDATES", "50"))
+
+# Levenshtein bound: one edit allowed per this many characters (at least one)
+SIMILAR_NAMES_CHARS_PER_EDIT = int(os.environ.get("SIMILAR_NAMES_CHARS_PER_EDIT", "4"))
+
+# Minimum Jaro-Winkler similarity of a returned name
+SIMILAR_NAMES_MIN_SIMILARITY = float(
+    os.environ.get("SIMILAR_NAMES_MIN_SIMILARITY", "0.8")
+)
+
+# Jaro-Winkler prefix scale and maximum prefix length
+WINKLER_SCALE = 0.1
+WINKLER_PREFIX = 4
+
+
+def bounded_levenshtein(a: str, b: str, bound: int) -> int:
+    """
+    Compute the Levenshtein distance between two strings, up to a bound.
+
+    Args:
+        a: First string
+        b: Second string
+        bound: Largest distance of interest
+
+    Returns:
+        The distance, or bound + 1 if it is larger than the bound
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(previous[-1], bound + 1)
+
+
+def jaro_winkler(a: str, b: str) -> float:
+    """
+    Compute the Jaro-Winkler similarity of two strings.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Similarity between 0 (nothing in common) and 1 (identical)
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    window = max(0, max(len(a), len(b)) // 2 - 1)
+    matched_b = [False] * len(b)
+    matches_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not matched_b[j] and b[j] == char:
+                matched_b[j] = True
+                matches_a.append(char)
+                break
+    if not matches_a:
+        return 0.0
+
+    matches_b = [b[j] for j, matched in enumerate(matched_b) if matched]
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) / 2
+    m = len(matches_a)
+    jaro = (m / len(a) + m / len(b) + (m - transpositions) / m) / 3
+
+    prefix = 0
+    for x, y in zip(a[:WINKLER_PREFIX], b[:WINKLER_PREFIX]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * WINKLER_SCALE * (1 - jaro)
+
+
+def name_bigrams(key: str) -> List[str]:
+    """
+    Split a comparison key into its distinct bigrams, with ^ and $ marking the ends.
+
+    Args:
+        key: comparison_key form of a name
+
+    Returns:
+        Distinct bigrams in order of first occurrence
+    """
+    padded = f"^{key}$"
+    return list(dict.fromkeys(padded[i : i + 2] for i in range(len(padded) - 1)))
+
+
+class NameSimilarityIndex:
+    """Bigram inverted index over known names with edit-distance re-ranking."""
+
+    def __init__(self, records: List[Dict[str, Any]], version: Any = None):
+        """
+        Index known names.
+
+        Args:
+            records: Dictionaries with the "name" to index, its known
+                     "notation" and the "source" recording it
+            version: State of the sources the records came from
+        """
+        self.version = version
+        self.records = []
+        self.keys: List[str] = []
+        vocabulary: Dict[str, int] = {}
+        gram_ids: List[int] = []
+        doc_ids: List[int] = []
+        for record in records:
+            key = comparison_key(normalize_name(record["name"]))
+            if not key:
+                continue
+            doc = len(self.records)
+            self.records.append(record)
+            self.keys.append(key)
+            for gram in name_bigrams(key):
+                gram_ids.append(vocabulary.setdefault(gram, len(vocabulary)))
+                doc_ids.append(doc)
+
+        self.vocabulary = vocabulary
+        grams = np.asarray(gram_ids, dtype=np.int64)
+        docs = np.asarray(doc_ids, dtype=np.int32)
+        order = np.argsort(grams, kind="stable")
+        self.postings = docs[order]
+        self.offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(grams, minlength=len(vocabulary))))
+        ).astype(np.int64)
+        self.gram_counts = np.bincount(docs, minlength=len(self.records)).astype(
+            np.int32
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def candidates(self, keys: List[str], limit: int) -> List[np.ndarray]:
+        """
+        Find the names sharing the most bigrams with each query, in one pass.
+
+        Args:
+            keys: comparison_key forms of the queries
+            limit: Maximum number of candidates per query
+
+        Returns:
+            For each query, candidate record positions, best Dice coefficient first
+        """
+        query_parts, doc_parts, query_sizes = [], [], []
+        for query, key in enumerate(keys):
+            grams = name_bigrams(key)
+            query_sizes.append(len(grams))
+            for gram in grams:
+                gram_id = self.vocabulary.get(gram)
+                if gram_id is None:
+                    continue
+                postings = self.postings[
+                    self.offsets[gram_id] : self.offsets[gram_id + 1]
+                ]
+                doc_parts.append(postings)
+                query_parts.append(np.full(len(postings), query, dtype=np.int64))
+
+        results = [np.zeros(0, dtype=np.int64) for _ in keys]
+        if not doc_parts:
+            return results
+
+        # Count shared bigrams per (query, name) pair
+        pairs = np.concatenate(query_parts) * len(self.records) + np.concatenate(
+            doc_parts
+        )
+        pairs, shared = np.unique(pairs, return_counts=True)
+        queries, docs = np.divmod(pairs, len(self.records))
+        dice = 2 * shared / (np.asarray(query_sizes)[queries] + self.gram_counts[docs])
+
+        # Best candidates of each query: sort by query, then by Dice descending
+        order = np.lexsort((-dice, queries))
+        queries, docs = queries[order], docs[order]
+        starts = np.searchsorted(queries, np.arange(len(keys)), side="left")
+        ends = np.searchsorted(queries, np.arange(len(keys)), side="right")
+        for query, (start, end) in enumerate(zip(starts, ends)):
+            results[query] = docs[start : min(end, start + limit)]
+        return results
+
+    def rerank(self, key: str, candidates: np.ndarray, k: int) -> List[Dict[str, Any]]:
+        """
+        Score candidates by Jaro-Winkler similarity within the edit bound.
+
+        Args:
+            key: comparison_key form of the query
+            candidates: Candidate record positions
+            k: Maximum number of names returned
+
+        Returns:
+            Records with "distance" and "similarity" keys, most similar first
+        """
+        bound = max(1, len(key) // SIMILAR_NAMES_CHARS_PER_EDIT)
+        scored = []
+        for doc in candidates.tolist():
+            distance = bounded_levenshtein(key, self.keys[doc], bound)
+            if distance > bound:
+                continue
+            similarity = jaro_winkler(key, self.keys[doc])
+            if similarity >= SIMILAR_NAMES_MIN_SIMILARITY:
+                scored.append((similarity, -distance, doc))
+        scored.sort(reverse=True)
+        return [
+            dict(self.records[doc], distance=-negative, similarity=round(similarity, 3))
+            for similarity, negative, doc in scored[:k]
+        ]
+
+    def search_many(
+        self, names: List[str], k: int = SIMILAR_NAMES_K
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find the known names most similar to each of several names.
+
+        A "Hangul (Roman)" pair is searched under both forms.
+
+        Args:
+            names: Names to look up
+            k: Maximum number of similar names per query
+
+        Returns:
+            For each name, similar known names, most similar first
+        """
+        if not self.records:
+            return [[] for _ in names]
+
+        forms: List[Tuple[int, str]] = []
+        for i, name in enumerate(names):
+            hangul, roman = split_name_pair(normalize_name(name))
+            for form in (hangul, roman):
+                key = comparison_key(form) if form else ""
+                if key:
+                    forms.append((i, key))
+
+        found = self.candidates([key for _, key in forms], SIMILAR_NAMES_CANDIDATES)
+        merged: List[Dict[Tuple[str, Optional[str], str], Dict[str, Any]]] = [
+            {} for _ in names
+        ]
+        for (i, key), candidates in zip(forms, found):
+            for match in self.rerank(key, candidates, k):
+                identity = (match["name"], match.get("notation"), match["source"])
+                best = merged[i].get(identity)
+                if best is None or match["similarity"] > best["similarity"]:
+                    merged[i][identity] = match
+
+        return [
+            sorted(matches.values(), key=lambda m: (-m["similarity"], m["distance"]))[
+                :k
+            ]
+            for matches in merged
+        ]
+
+
+def termbase_records() -> List[Dict[str, Any]]:
+    """
+    Get both forms of every termbase pair as searchable records.
+
+    Returns:
+        Records naming each form, its counterpart and the workbook row
+    """
+    entries = load_termbase_entries()
+    records = []
+    for hangul, roman, resource, sheet, row in zip(
+        *(
+            entries.column(field).tolist()
+            for field in ("hangul", "roman", "resource", "sheet", "row")
+        )
+    ):
+        source = f"{resource_label(resource)} ({sheet}, row {row})"
+        records.append({"name": hangul, "notation": roman, "source": source})
+        records.append({"name": roman, "notation": hangul, "source": source})
+    return records
+
+
+def teamwork_records() -> List[Dict[str, Any]]:
+    """
+    Get the names of the "Name Evaluation" tasks in the local Teamwork index.
+
+    Returns:
+        Records naming each evaluated name, its recorded notation (if any)
+        and the task
+    """
+    if not TEAMWORK_AVAILABLE:
+        return []
+    prefix = evaluation_task_title("")
+    records = []
+    for task in get_task_index().iter_tasks():
+        title = task.get("content") or ""
+        if not title.startswith(prefix):
+            continue
+        notation = EVALUATION_NOTATION_PATTERN.search(task.get("description") or "")
+        records.append(
+            {
+                "name": title[len(prefix) :].strip(),
+                "notation": notation.group(1).strip() if notation else None,
+                "source": f"Teamwork task {task.get('id')}",
+            }
+        )
+    return records
+
+
+def sources_version() -> Tuple[str, Optional[float]]:
+    """
+    Identify the current state of the termbase workbooks and the Teamwork index.
+
+    Returns:
+        Tuple of (workbook fingerprint, time of the last Teamwork refresh)
+    """
+    files = termbase_files()
+    refreshed = get_task_index().last_refreshed() if TEAMWORK_AVAILABLE else None
+    return (files_fingerprint(files) if files else "", refreshed)
+
+
+_index: Optional[NameSimilarityIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_similarity_index() -> NameSimilarityIndex:
+    """
+    Get the process-wide similarity index, rebuilding it if its sources changed.
+
+    Returns:
+        The similarity index
+    """
+    global _index
+    with _index_lock:
+        version = sources_version()
+        if _index is None or _index.version != version:
+            _index = NameSimilarityIndex(
+                termbase_records() + teamwork_records(), version
+            )
+        return _index
+
+
+def find_similar_names_batch(
+    names: List[str], k: int = SIMILAR_NAMES_K
+) -> List[List[Dict[str, Any]]]:
+    """
+    Find the known names most similar to each of several names.
+
+    Args:
+        names: Names to look up
+        k: Maximum number of similar names per query
+
+    Returns:
+        For each name, dictionaries with the known "name", its "notation",
+        the "source" recording it, the Levenshtein "distance" between the
+        normalized forms and the Jaro-Winkler "similarity", most similar first
+    """
+    try:
+        return get_similarity_index().search_many(names, k)
+    except Exception as e:
+        print(f"Similar name lookup failed: {e}")
+        return [[] for _ in names]
+
+
+def find_similar_names(name: str, k: int = SIMILAR_NAMES_K) -> List[Dict[str, Any]]:
+    """
+    Find the known names most similar to a name.
+
+    Args:
+        name: Name to look up
+        k: Maximum number of similar names
+
+    Returns:
+        Similar known names, most similar first (see find_similar_names_batch)
+    """
+    return find_similar_names_batch([name], k)[0]
+
+
+def format_similar_names(
+    matches: List[Dict[str, Any]],
+    listed: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """
+    Format similar known names for an evaluation prompt.
+
+    Args:
+        matches: Result of find_similar_names
+        listed: Termbase entries already given to the model, left out here
+
+    Returns:
+        Prompt text listing the similar names, or "" if there are none
+    """
+    seen = {
+        pair
+        for entry in listed or []
+        for pair in (
+            (entry["hangul"], entry["roman"]),
+            (entry["roman"], entry["hangul"]),
+        )
+    }
+    lines = "".join(
+        f"- {match['name']}"
+        + (f" = {match['notation']}" if match.get("notation") else "")
+        + f" ({match['source']}, edit distance {match['distance']})\n"
+        for match in matches
+        if (match["name"], match.get("notation")) not in seen
+    )
+    if not lines:
+        return ""
+    return f"SIMILAR SPELLINGS IN EARLIER RECORDS:\n{lines}"
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Find known names similar to the given names"
+    )
+    parser.add_argument("names", nargs="+", help="Names to look up")
+    parser.add_argument(
+        "-k", type=int, default=SIMILAR_NAMES_K, help="Number of names to show"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    similarity_index = get_similarity_index()
+    print(
+        f"Similarity index: {len(similarity_index)} names "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+    started = time.perf_counter()
+    results = find_similar_names_batch(args.names, args.k)
+    print(f"Searched {len(args.names)} names in {time.perf_counter() - started:.3f}s")
+    for query, similar in zip(args.names, results):
+        print(f"\n{query}")
+        for match in similar:
+            print(
+                f"  {match['name']} = {match.get('notation') or '?'} "
+                f"[{match['source']}] distance {match['distance']}, "
+                f"similarity {match['similarity']}"
+            )
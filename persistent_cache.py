@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""
+Persistent Result Cache for CF Name Evaluation System.
+
+This module provides a small on-disk key/value cache used to keep the results
+of slow external lookups (such as Teamwork verification) across CLI runs.
+Entries are stored as JSON in SQLite under the reports cache directory, expire
+after a configurable time-to-live, and the least recently used entries are
+evicted once the cache grows past its size bound.
+
+The module includes:
+- A SQLite-backed cache with TTL expiry and LRU size bounding
+- Hit/miss/eviction counters for each cache
+- A registry of named caches shared across the process
+- Helpers to print cache statistics in run summaries
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from terminologists_manual_links import CACHE_DIR
+
+
+class PersistentCache:
+    """SQLite-backed JSON cache with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Optional[float] = 3600,
+        max_entries: int = 5000,
+        path: Optional[str] = None,
+    ):
+        """
+        Open (or create) a named cache.
+
+        Args:
+            name: Cache name, used for the file name and in statistics
+            ttl: Seconds an entry stays valid (None for no expiry, 0 disables caching)
+            max_entries: Maximum number of entries kept (least recently used evicted)
+            path: Path to the SQLite file (defaults to <CACHE_DIR>/<name>.sqlite)
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path or os.path.join(CACHE_DIR, f"{name}.sqlite")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, "
+            "created REAL, last_access REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (last_access)"
+        )
+        self._conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything (a TTL of 0 disables it)."""
+        return self.ttl != 0 and self.max_entries > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if absent or expired
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def peek(self, key: str) -> Optional[Any]:
+        """
+        Read a value without expiry checks, access updates or counting a lookup.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value, or None if absent
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any):
+        """
+        Store a JSON-serialisable value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries."""
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+                "ORDER BY last_access ASC LIMIT ?)",
+                (excess,),
+            )
+            self.evictions += excess
+
+    def delete(self, key: str):
+        """Remove a single entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get counters for this cache.
+
+        Returns:
+            Dictionary with hits, misses, evictions, hit rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+
+_caches: Dict[str, PersistentCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(
+    name: str, ttl: Optional[float] = 3600, max_entries: int = 5000
+) -> PersistentCache:
+    """
+    Get a named process-wide cache, opening it on first use.
+
+    Args:
+        name: Cache name
+        ttl: Seconds an entry stays valid (only used on first call)
+        max_entries: Maximum number of entries (only used on first call)
+
+    Returns:
+        Shared PersistentCache instance
+    """
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = PersistentCache(name, ttl=ttl, max_entries=max_entries)
+        return _caches[name]
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """
+    Get statistics for every cache used in this process.
+
+    Returns:
+        List of statistics dictionaries
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [cache.stats() for cache in caches]
+
+
+def print_cache_stats():
+    """Print hit/miss counters for every cache that was consulted in this run."""
+    stats = [s for s in get_cache_stats() if s["hits"] or s["misses"]]
+    if not stats:
+        return
+
+    print("\nCache statistics:")
+    for s in stats:
+        print(
+            f"- {s['name']}: {s['hits']} hits, {s['misses']} misses "
+            f"({s['hit_rate']:.0%} hit rate, {s['entries']} entries stored)"
+        )
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Rate Limiting Utilities for CF Name Evaluation System.
+
+This module provides thread-safe rate limiters shared by the parts of the
+system that call external APIs from worker pools, such as bulk posting of
+evaluation results to Teamwork and concurrent LLM evaluation.
+
+The module includes:
+- A request rate limiter that spaces out call starts across threads
+- A token bucket limiter for budgets such as LLM tokens per minute
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces out calls to a maximum rate."""
+
+    def __init__(self, max_calls: float, period: float = 1.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_calls: Maximum number of calls per period (0 for unlimited)
+            period: Length of the period in seconds
+        """
+        self.interval = period / max_calls if max_calls > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next call is allowed to start."""
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + self.interval
+
+        delay = start - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class TokenBucketLimiter:
+    """Thread-safe token bucket for budgets measured in units per period."""
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            capacity: Units available per period (0 for unlimited)
+            period: Length of the period in seconds
+        """
+        self.capacity = capacity
+        self.refill_rate = capacity / period if capacity > 0 else 0.0
+        self._available = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0):
+        """
+        Block until the requested number of units can be spent.
+
+        Requests larger than the bucket's capacity are clamped to the capacity
+        so that they wait for a full bucket instead of blocking forever.
+
+        Args:
+            amount: Number of units to spend
+        """
+        if not self.refill_rate:
+            return
+
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._available = min(
+                self.capacity,
+                self._available + (now - self._updated) * self.refill_rate,
+            )
+            self._updated = now
+            # Spend now and let the balance go negative; later callers wait
+            # for the debt to be repaid, which keeps the order first-come
+            # first-served.
+            self._available -= amount
+            delay = -self._available / self.refill_rate if self._available < 0 else 0
+
+        if delay > 0:
+            time.sleep(delay)
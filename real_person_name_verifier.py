@@ -31,6 +31,7 @@ from korean_name_evaluator import generate_html_report
 
 # Import core functionality from existing modules
 from korean_to_english_evaluator import evaluate_korean_name
+from persistent_cache import print_cache_stats
 
 # Teamwork integration
 try:
@@ -325,3 +326,6 @@ if __name__ == "__main__":
         )
 
     print(f"\nAll reports saved to: {args.output_dir}/")
+
+    # Print cache hit/miss counters for this run
+    print_cache_stats()
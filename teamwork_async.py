@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+"""
+Asynchronous Teamwork API Client for CF Name Evaluation System.
+
+This module provides an asyncio-based counterpart to `TeamworkClient` for the
+operations that fan out over every project in the workspace. Per-project task
+lists are fetched concurrently under a configurable semaphore and a shared
+request rate limiter, so crawling hundreds of projects costs roughly the
+slowest few round-trips instead of the sum of all of them.
+
+The module includes:
+- An httpx-based async client with the same authentication as TeamworkClient
+- Bounded concurrency (TEAMWORK_MAX_CONCURRENCY) and a request rate limiter
+  (TEAMWORK_RATE_LIMIT requests per second)
+- Handling of Teamwork rate limiting: 429 responses pause all workers for the
+  duration given in the Retry-After header before retrying
+- Paginated listings (pageSize up to the API maximum) yielded page by page
+- A synchronous streaming helper used by the task index and the Teamwork
+  integration to consume many projects' tasks concurrently as pages arrive
+
+The base URL can be overridden so the client can be exercised against a local
+stub server.
+"""
+
+import asyncio
+import base64
+import os
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Maximum number of concurrent requests to Teamwork
+MAX_CONCURRENCY = int(os.environ.get("TEAMWORK_MAX_CONCURRENCY", "8"))
+
+# Maximum number of requests started per second (0 disables the limiter)
+RATE_LIMIT = float(os.environ.get("TEAMWORK_RATE_LIMIT", "10"))
+
+# Retries for rate-limited or failed requests
+MAX_RETRIES = int(os.environ.get("TEAMWORK_MAX_RETRIES", "3"))
+
+# Records requested per page (Teamwork allows up to 250 tasks per page)
+PAGE_SIZE = int(os.environ.get("TEAMWORK_PAGE_SIZE", "250"))
+
+# Fallback wait when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 5.0
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# Seconds the background producer waits on a full page queue before checking
+# whether the consumer has stopped
+QUEUE_POLL_INTERVAL = 0.1
+
+# (project, tasks on this page, error, whether this is the project's last page)
+ProjectTaskPage = Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[Exception], bool]
+
+
+class AsyncRateLimiter:
+    """Spaces out request starts and applies workspace-wide Retry-After pauses."""
+
+    def __init__(self, rate_per_second: float = RATE_LIMIT):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate_per_second: Maximum requests started per second (0 for unlimited)
+        """
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the next request is allowed to start."""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot, self._paused_until)
+            self._next_slot = start + self.interval
+        delay = start - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float):
+        """
+        Hold back every request for a period (used for Retry-After).
+
+        Args:
+            seconds: Number of seconds to pause
+        """
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Read the Retry-After header as a number of seconds."""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class AsyncTeamworkClient:
+    """Asynchronous client for the Teamwork API with bounded concurrency."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        domain: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        rate_limit: float = RATE_LIMIT,
+        max_retries: int = MAX_RETRIES,
+    ):
+        """
+        Initialize the async Teamwork client.
+
+        Args:
+            api_key: Teamwork API key (defaults to TEAMWORK_API_KEY env var)
+            domain: Teamwork domain (defaults to TEAMWORK_DOMAIN env var)
+            base_url: Override for the API base URL (e.g. a local stub server)
+            max_concurrency: Maximum number of requests in flight
+            rate_limit: Maximum requests started per second (0 for unlimited)
+            max_retries: Retries for 429 and transient server errors
+        """
+        self.api_key = (api_key or os.environ.get("TEAMWORK_API_KEY") or "").strip('"')
+        if not self.api_key:
+            raise ValueError("Teamwork API key is required.")
+
+        self.domain = domain or os.environ.get("TEAMWORK_DOMAIN", "cultureflipper")
+        self.base_url = base_url or f"https://{self.domain}.teamwork.com"
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.rate_limiter = AsyncRateLimiter(rate_limit)
+
+        encoded = base64.b64encode(f"{self.api_key}:X".encode()).decode()
+        self.auth_header = {"Authorization": f"Basic {encoded}"}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_client(cls, client, **kwargs) -> "AsyncTeamworkClient":
+        """
+        Create an async client sharing the credentials of a TeamworkClient.
+
+        Args:
+            client: Synchronous TeamworkClient
+            **kwargs: Extra keyword arguments for the constructor
+
+        Returns:
+            AsyncTeamworkClient instance
+        """
+        return cls(
+            api_key=client.api_key,
+            domain=client.domain,
+            base_url=kwargs.pop("base_url", client.base_url),
+            **kwargs,
+        )
+
+    async def __aenter__(self) -> "AsyncTeamworkClient":
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.auth_header,
+            limits=limits,
+            timeout=httpx.Timeout(30.0),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+        self._client = None
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Issue a GET request under the concurrency and rate limits.
+
+        Args:
+            path: API path relative to the base URL
+            params: Optional query parameters
+
+        Returns:
+            httpx.Response with a successful status code
+        """
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            async with self._semaphore:
+                try:
+                    response = await self._client.get(path, params=params)
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    response = None
+
+            if response is not None and response.status_code not in RETRYABLE_STATUS:
+                response.raise_for_status()
+                return response
+
+            if attempt >= self.max_retries:
+                response.raise_for_status()
+
+            if response is not None and response.status_code == 429:
+                # Teamwork limits the whole account, so hold back every worker
+                self.rate_limiter.pause(_retry_after_seconds(response))
+            else:
+                await asyncio.sleep(0.5 * (2**attempt))
+            attempt += 1
+
+    async def _iter_pages(
+        self, path: str, key: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the pages of a paginated listing as they arrive.
+
+        The first page is read to learn the page count (X-Pages header); the
+        remaining pages are then requested concurrently.
+
+        Args:
+            path: API path relative to the base URL
+            key: JSON key holding the records
+            params: Optional extra query parameters
+
+        Yields:
+            Lists of records, one per page
+        """
+        params = {**(params or {}), "pageSize": PAGE_SIZE, "page": 1}
+        response = await self._get(path, params=params)
+        records = response.json().get(key, [])
+        yield records
+
+        total_pages = _total_pages(response, len(records))
+        if total_pages is None:
+            # No page count available: walk pages sequentially until a short page
+            page = 1
+            while len(records) >= PAGE_SIZE:
+                page += 1
+                response = await self._get(path, params={**params, "page": page})
+                records = response.json().get(key, [])
+                yield records
+            return
+
+        pending = [
+            asyncio.ensure_future(self._get(path, params={**params, "page": page}))
+            for page in range(2, total_pages + 1)
+        ]
+        try:
+            for next_response in asyncio.as_completed(pending):
+                yield (await next_response).json().get(key, [])
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def iter_projects(
+        self, status: str = "active"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over projects, fetching them page by page.
+
+        Args:
+            status: Project status to filter by ('active', 'archived', 'all')
+
+        Yields:
+            Project dictionaries
+        """
+        async for page in self._iter_pages(
+            "/projects.json", "projects", params={"status": status}
+        ):
+            for project in page:
+                yield project
+
+    async def get_projects(self, status: str = "active") -> List[Dict[str, Any]]:
+        """
+        Get list of projects from Teamwork.
+
+        Args:
+            status: Project status to filter by ('active', 'archived', 'all')
+
+        Returns:
+            List of project dictionaries
+        """
+        return [project async for project in self.iter_projects(status)]
+
+    async def iter_task_pages_by_project(
+        self, project_id: str, updated_after: Optional[str] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over a project's tasks one page at a time.
+
+        Args:
+            project_id: ID of the project
+            updated_after: Only return tasks changed after this time (YYYYMMDDHHMMSS)
+
+        Yields:
+            Lists of task dictionaries, one per page
+        """
+        params = {"updatedAfterDate": updated_after} if updated_after else None
+        async for page in self._iter_pages(
+            f"/projects/{project_id}/tasks.json", "todo-items", params=params
+        ):
+            yield page
+
+    async def get_tasks_by_project(
+        self, project_id: str, updated_after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all tasks for a specific project.
+
+        Args:
+            project_id: ID of the project
+            updated_after: Only return tasks changed after this time (YYYYMMDDHHMMSS)
+
+        Returns:
+            List of task dictionaries
+        """
+        tasks = []
+        async for page in self.iter_task_pages_by_project(project_id, updated_after):
+            tasks.extend(page)
+        return tasks
+
+    async def iter_project_task_pages(
+        self,
+        projects: List[Dict[str, Any]],
+        updated_after: Optional[Dict[str, Optional[str]]] = None,
+    ) -> AsyncIterator[ProjectTaskPage]:
+        """
+        Fetch many projects' tasks concurrently, yielding pages as they arrive.
+
+        Each project ends with a page whose `done` flag is set (carrying the
+        error if the project could not be fetched completely).
+
+        Args:
+            projects: Project dictionaries to fetch tasks for
+            updated_after: Optional map of project ID to updated-since timestamp
+
+        Yields:
+            (project, tasks, error, done) tuples
+        """
+        updated_after = updated_after or {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency * 4)
+
+        async def produce(project):
+            project_id = str(project.get("id"))
+            try:
+                async for page in self.iter_task_pages_by_project(
+                    project_id, updated_after=updated_after.get(project_id)
+                ):
+                    await queue.put((project, page, None, False))
+                await queue.put((project, [], None, True))
+            except Exception as e:
+                await queue.put((project, [], e, True))
+
+        producers = [asyncio.ensure_future(produce(project)) for project in projects]
+        remaining = len(producers)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item[3]:
+                    remaining -= 1
+                yield item
+        finally:
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+
+
+def _total_pages(response: httpx.Response, page_length: int) -> Optional[int]:
+    """Read the page count from Teamwork's X-Pages header, if present."""
+    try:
+        return int(response.headers["X-Pages"])
+    except (KeyError, ValueError):
+        return 1 if page_length < PAGE_SIZE else None
+
+
+def _event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+_QUEUE_END = object()
+
+
+def iter_project_tasks(
+    client,
+    projects: List[Dict[str, Any]],
+    updated_after: Optional[Dict[str, Optional[str]]] = None,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Iterator[ProjectTaskPage]:
+    """
+    Stream many projects' tasks page by page, concurrently when possible.
+
+    The async client runs on a background thread and hands pages over through
+    a bounded queue, so callers can consume (index, match) each page as it
+    arrives without holding the whole workspace in memory. When concurrency is
+    disabled, or an event loop is already running in this thread, pages are
+    fetched sequentially with the given synchronous client instead. If the
+    caller stops iterating early, the background producer stops as well and
+    its outstanding requests are cancelled.
+
+    Args:
+        client: Synchronous TeamworkClient (credentials and fallback transport)
+        projects: Project dictionaries to fetch tasks for
+        updated_after: Optional map of project ID to updated-since timestamp
+        max_concurrency: Maximum number of requests in flight
+
+    Yields:
+        (project, tasks, error, done) tuples; `done` marks a project's last page
+    """
+    updated_after = updated_after or {}
+
+    if max_concurrency <= 1 or _event_loop_running():
+        for project in projects:
+            project_id = str(project.get("id"))
+            try:
+                for page in client.iter_task_pages_by_project(
+                    project_id, updated_after=updated_after.get(project_id)
+                ):
+                    yield project, page, None, False
+                yield project, [], None, True
+            except Exception as e:
+                yield project, [], e, True
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=max_concurrency * 4)
+    stopped = threading.Event()
+
+    def hand_over(item) -> bool:
+        """Queue an item for the consumer; False once the consumer has stopped."""
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=QUEUE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    async def produce():
+        async_client = AsyncTeamworkClient.from_client(
+            client, max_concurrency=max_concurrency
+        )
+        async with async_client:
+            task_pages = async_client.iter_project_task_pages(projects, updated_after)
+            try:
+                async for item in task_pages:
+                    if not await asyncio.to_thread(hand_over, item):
+                        return
+            finally:
+                await task_pages.aclose()
+
+    def run():
+        try:
+            asyncio.run(produce())
+        except Exception as e:
+            hand_over(e)
+        finally:
+            hand_over(_QUEUE_END)
+
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _QUEUE_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Lets the producer finish (and cancel its requests) if iteration
+        # stops early
+        stopped.set()
@@ -24,27 +24,99 @@ that can be referenced in future projects.
 import base64
 import json
 import os
+import re
+import threading
 import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from multi_pattern_matcher import AhoCorasickMatcher
+from persistent_cache import get_cache
+from teamwork_async import PAGE_SIZE, iter_project_tasks
+from rate_limiting import RateLimiter
+from teamwork_task_index import ensure_fresh_index, get_task_index
 
 # Load environment variables
 load_dotenv()
 
+# Connection pool and retry settings for the shared HTTP session
+POOL_SIZE = int(os.environ.get("TEAMWORK_POOL_SIZE", "10"))
+MAX_RETRIES = int(os.environ.get("TEAMWORK_MAX_RETRIES", "3"))
+RETRY_BACKOFF = float(os.environ.get("TEAMWORK_RETRY_BACKOFF", "0.5"))
+
+# Worker pool size and rate limit (posts per second) for bulk posting
+POST_MAX_WORKERS = int(os.environ.get("TEAMWORK_POST_WORKERS", "4"))
+POST_RATE_LIMIT = float(os.environ.get("TEAMWORK_POST_RATE_LIMIT", "2"))
+
+# Lifetime (seconds) and size bound of cached verification results
+VERIFICATION_CACHE_TTL = float(os.environ.get("TEAMWORK_CACHE_TTL", "3600"))
+VERIFICATION_CACHE_SIZE = int(os.environ.get("TEAMWORK_CACHE_SIZE", "5000"))
+
+# Notation line written into evaluation task descriptions
+EVALUATION_NOTATION_PATTERN = re.compile(r"\*\*Notation:\*\*\s*(.+)")
+
+
+def create_session(
+    pool_size: int = POOL_SIZE,
+    max_retries: int = MAX_RETRIES,
+    backoff_factor: float = RETRY_BACKOFF,
+) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a connection pool and retry policy.
+
+    Idempotent requests are retried on connection errors, rate limiting (429)
+    and transient server errors, honouring any Retry-After header.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        max_retries: Maximum number of retries per request
+        backoff_factor: Exponential backoff factor between retries (seconds)
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
 
 class TeamworkClient:
     """Client for interacting with the Teamwork API."""
 
-    def __init__(self, api_key: Optional[str] = None, domain: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        domain: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Initialize Teamwork API client.
 
         Args:
             api_key: Teamwork API key (defaults to TEAMWORK_API_KEY env var)
             domain: Teamwork domain (defaults to TEAMWORK_DOMAIN env var)
+            session: HTTP session to use (a pooled keep-alive session is created
+                     if omitted)
         """
         # If not explicitly provided, use the known working key
         if not api_key:
@@ -63,6 +135,8 @@ class TeamworkClient:
 
         self.base_url = f"https://{self.domain}.teamwork.com"
         self.auth_header = self._get_auth_header()
+        self.session = session or create_session()
+        self.session.headers.update(self.auth_header)
 
     def _get_auth_header(self) -> Dict[str, str]:
         """Generate the authorization header for API requests."""
@@ -84,6 +158,53 @@ class TeamworkClient:
         # https://developer.teamwork.com/projects/api-v1/ref1/
         return basic_auth
 
+    def _iter_pages(
+        self, url: str, key: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the pages of a paginated listing one at a time.
+
+        Args:
+            url: Listing URL
+            key: JSON key holding the records
+            params: Optional extra query parameters
+
+        Yields:
+            Lists of records, one per page
+        """
+        params = {**(params or {}), "pageSize": PAGE_SIZE}
+        page = 1
+        while True:
+            response = self.session.get(url, params={**params, "page": page})
+            if response.status_code != 200:
+                response.raise_for_status()
+
+            records = response.json().get(key, [])
+            yield records
+
+            total_pages = response.headers.get("X-Pages")
+            if total_pages is not None and total_pages.isdigit():
+                if page >= int(total_pages):
+                    return
+            elif len(records) < PAGE_SIZE:
+                return
+            page += 1
+
+    def iter_projects(self, status: str = "active") -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over projects, fetching them page by page.
+
+        Args:
+            status: Project status to filter by ('active', 'archived', 'all')
+
+        Yields:
+            Project dictionaries
+        """
+        for page in self._iter_pages(
+            f"{self.base_url}/projects.json", "projects", params={"status": status}
+        ):
+            yield from page
+
     def get_projects(self, status: str = "active") -> List[Dict[str, Any]]:
         """
         Get list of projects from Teamwork.
@@ -94,73 +215,101 @@ class TeamworkClient:
         Returns:
             List of project dictionaries
         """
-        url = f"{self.base_url}/projects.json?status={status}"
-        response = requests.get(url, headers=self.auth_header)
+        return list(self.iter_projects(status))
 
-        if response.status_code == 200:
-            return response.json().get("projects", [])
-        else:
-            response.raise_for_status()
+    def iter_task_pages_by_project(
+        self, project_id: str, updated_after: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over a project's tasks one page at a time.
+
+        Args:
+            project_id: ID of the project
+            updated_after: Only return tasks changed after this time (YYYYMMDDHHMMSS)
+
+        Yields:
+            Lists of task dictionaries, one per page
+        """
+        url = f"{self.base_url}/projects/{project_id}/tasks.json"
+        params = {"updatedAfterDate": updated_after} if updated_after else None
+        yield from self._iter_pages(url, "todo-items", params=params)
+
+    def iter_tasks_by_project(
+        self, project_id: str, updated_after: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a project's tasks, fetching them page by page.
 
-    def get_tasks_by_project(self, project_id: str) -> List[Dict[str, Any]]:
+        Args:
+            project_id: ID of the project
+            updated_after: Only return tasks changed after this time (YYYYMMDDHHMMSS)
+
+        Yields:
+            Task dictionaries
         """
-        Get tasks for a specific project.
+        for page in self.iter_task_pages_by_project(project_id, updated_after):
+            yield from page
+
+    def get_tasks_by_project(
+        self, project_id: str, updated_after: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all tasks for a specific project.
 
         Args:
             project_id: ID of the project
+            updated_after: Only return tasks changed after this time (YYYYMMDDHHMMSS)
 
         Returns:
             List of task dictionaries
         """
-        url = f"{self.base_url}/projects/{project_id}/tasks.json"
-        response = requests.get(url, headers=self.auth_header)
+        return list(self.iter_tasks_by_project(project_id, updated_after))
 
-        if response.status_code == 200:
-            return response.json().get("todo-items", [])
-        else:
-            response.raise_for_status()
+    def iter_search_task_pages(self, query: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the pages of a server-side task search.
+
+        Uses the workspace-wide task listing with a `searchTerm` filter, so only
+        matching tasks are transferred.
+
+        Args:
+            query: Search query string
+
+        Yields:
+            Lists of task dictionaries, one per page
+        """
+        url = f"{self.base_url}/tasks.json"
+        params = {"searchTerm": query, "includeCompletedTasks": "true"}
+        yield from self._iter_pages(url, "todo-items", params=params)
 
     def search_tasks(self, query: str) -> List[Dict[str, Any]]:
         """
         Search tasks across all projects.
 
+        The search runs on the Teamwork server; results are then narrowed to
+        tasks whose content or description contains the query (case-insensitive),
+        since the server also matches on tags, comments and other fields.
+
         Args:
             query: Search query string
 
         Returns:
             List of matching task dictionaries
         """
-        # First get all projects
-        projects = self.get_projects()
+        query_lower = query.lower()
+        matching_tasks = []
+        for tasks in self.iter_search_task_pages(query):
+            for task in tasks:
+                content = (task.get("content") or "").lower()
+                description = (task.get("description") or "").lower()
 
-        # Initialize results list
-        all_matching_tasks = []
-
-        # Search in each project's tasks
-        for project in projects:
-            project_id = project.get("id")
-
-            # Get all tasks for this project
-            try:
-                tasks = self.get_tasks_by_project(project_id)
+                if query_lower in content or query_lower in description:
+                    # Normalise project fields to the names used elsewhere
+                    task.setdefault("projectId", task.get("project-id"))
+                    task.setdefault("projectName", task.get("project-name"))
+                    matching_tasks.append(task)
 
-                # Filter tasks based on query (case-insensitive)
-                matching_tasks = []
-                query_lower = query.lower()
-                for task in tasks:
-                    content = task.get("content", "").lower()
-                    description = task.get("description", "").lower()
-
-                    if query_lower in content or query_lower in description:
-                        # Add project name to task for reference
-                        task["projectName"] = project.get("name")
-                        matching_tasks.append(task)
-
-                all_matching_tasks.extend(matching_tasks)
-            except Exception as e:
-                print(f"Error searching tasks in project {project_id}: {e}")
-
-        return all_matching_tasks
+        return matching_tasks
 
     def add_comment_to_task(self, task_id: str, comment: str) -> Dict[str, Any]:
         """
@@ -176,9 +325,9 @@ class TeamworkClient:
         url = f"{self.base_url}/tasks/{task_id}/comments.json"
         data = {"comment": {"body": comment, "notify": ""}}  # No notification emails
 
-        response = requests.post(
+        response = self.session.post(
             url,
-            headers={**self.auth_header, "Content-Type": "application/json"},
+            headers={"Content-Type": "application/json"},
             data=json.dumps(data),
         )
 
@@ -218,9 +367,9 @@ class TeamworkClient:
         if assignee_id:
             data["todo-item"]["responsible-party-id"] = assignee_id
 
-        response = requests.post(
+        response = self.session.post(
             url,
-            headers={**self.auth_header, "Content-Type": "application/json"},
+            headers={"Content-Type": "application/json"},
             data=json.dumps(data),
         )
 
@@ -240,7 +389,7 @@ class TeamworkClient:
             Task data dictionary
         """
         url = f"{self.base_url}/tasks/{task_id}.json"
-        response = requests.get(url, headers=self.auth_header)
+        response = self.session.get(url)
 
         if response.status_code == 200:
             return response.json().get("todo-item", {})
@@ -248,41 +397,81 @@ class TeamworkClient:
             response.raise_for_status()
 
 
-def search_name_in_teamwork(name: str) -> List[Dict[str, Any]]:
+_shared_client: Optional[TeamworkClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_teamwork_client() -> TeamworkClient:
+    """
+    Get the process-wide Teamwork client, creating it on first use.
+
+    Reusing one client keeps a single pooled HTTP session alive across all
+    Teamwork calls in a run.
+
+    Returns:
+        Shared TeamworkClient instance
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = TeamworkClient()
+        return _shared_client
+
+
+def format_task(task: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+    """
+    Format a raw Teamwork task with consistent fields and a direct URL.
+
+    Args:
+        task: Task dictionary from the API or the local index
+        base_url: Teamwork base URL used to build the task link
+
+    Returns:
+        Formatted task dictionary
+    """
+    task_id = task.get("id")
+    return {
+        "id": task_id,
+        "content": task.get("content", ""),
+        "description": task.get("description", ""),
+        "projectId": task.get("projectId"),
+        "projectName": task.get("projectName", "Unknown Project"),
+        "url": f"{base_url}/tasks/{task_id}",
+        "created-on": task.get("created-on", task.get("created-date", "")),
+    }
+
+
+def search_name_in_teamwork(name: str, use_index: bool = True) -> List[Dict[str, Any]]:
     """
     Search for a name in Teamwork tasks and comments.
 
+    A fresh local task index answers without any network traffic. Otherwise the
+    search is sent to Teamwork's server-side task search, and only if that fails
+    is the local index refreshed and queried instead.
+
     Args:
         name: The name to search for
+        use_index: Whether the local task index may be used
 
     Returns:
         List of matching tasks with project information
     """
     try:
-        client = TeamworkClient()
+        client = get_teamwork_client()
 
-        # For all names, use the real API
-        tasks = client.search_tasks(name)
+        if use_index and not get_task_index().is_stale():
+            tasks = get_task_index().search(name)
+        else:
+            try:
+                tasks = client.search_tasks(name)
+            except requests.exceptions.RequestException as e:
+                if not use_index:
+                    raise
+                print(f"Server-side search failed ({e}), using local task index")
+                tasks = ensure_fresh_index(client).search(name)
 
         # Enrich tasks with direct URLs and other useful information
-        enriched_tasks = []
-        for task in tasks:
-            task_id = task.get("id")
-            project_id = task.get("projectId")
-            project_name = task.get("projectName", "Unknown Project")
-
-            # Format the task with consistent information
-            formatted_task = {
-                "id": task_id,
-                "content": task.get("content", ""),
-                "description": task.get("description", ""),
-                "projectId": project_id,
-                "projectName": project_name,
-                "url": f"{client.base_url}/tasks/{task_id}",
-                "created-on": task.get("created-on", task.get("created-date", "")),
-            }
-
-            enriched_tasks.append(formatted_task)
+        enriched_tasks = [format_task(task, client.base_url) for task in tasks]
 
         return enriched_tasks
     except Exception as e:
@@ -290,6 +479,52 @@ def search_name_in_teamwork(name: str) -> List[Dict[str, Any]]:
         raise  # Re-raise the exception to handle it in the calling function
 
 
+def format_evaluation_comment(name: str, evaluation_results: Dict[str, Any]) -> str:
+    """
+    Format evaluation results as a Teamwork comment / task description.
+
+    Args:
+        name: The name that was evaluated
+        evaluation_results: Dictionary containing evaluation results
+
+    Returns:
+        Markdown-formatted comment text
+    """
+    compliant = evaluation_results.get("compliant", False)
+    score = evaluation_results.get("overall_score", 0)
+
+    comment = f"### Name Evaluation: {name}\n\n"
+    comment += f"**Compliance Status:** {'✅ Compliant' if compliant else '❌ Non-compliant'}\n"
+    comment += f"**Score:** {score}/100\n"
+    notation = evaluation_results.get("english_notation") or evaluation_results.get(
+        "korean_notation"
+    )
+    if notation:
+        comment += f"**Notation:** {notation}\n"
+    comment += "\n"
+
+    # Add detailed rule scores if available
+    rule_scores = evaluation_results.get("rule_scores", {})
+    if rule_scores:
+        comment += "**Rule Scores:**\n"
+        for rule, rule_score in rule_scores.items():
+            comment += f"- {rule}: {rule_score}/100\n"
+
+    # Add recommendations if available
+    recommendations = evaluation_results.get("recommendations", [])
+    if recommendations:
+        comment += "\n**Recommendations:**\n"
+        for rec in recommendations:
+            comment += f"- {rec}\n"
+
+    return comment
+
+
+def evaluation_task_title(name: str) -> str:
+    """Return the title used for evaluation tasks created in Teamwork."""
+    return f"Name Evaluation: {name}"
+
+
 def post_evaluation_to_teamwork(
     name: str,
     evaluation_results: Dict[str, Any],
@@ -309,29 +544,10 @@ def post_evaluation_to_teamwork(
         Tuple of (success, message)
     """
     try:
-        client = TeamworkClient()
+        client = get_teamwork_client()
 
         # Format the evaluation results as a comment
-        compliant = evaluation_results.get("compliant", False)
-        score = evaluation_results.get("overall_score", 0)
-
-        comment = f"### Name Evaluation: {name}\n\n"
-        comment += f"**Compliance Status:** {'✅ Compliant' if compliant else '❌ Non-compliant'}\n"
-        comment += f"**Score:** {score}/100\n\n"
-
-        # Add detailed rule scores if available
-        rule_scores = evaluation_results.get("rule_scores", {})
-        if rule_scores:
-            comment += "**Rule Scores:**\n"
-            for rule, rule_score in rule_scores.items():
-                comment += f"- {rule}: {rule_score}/100\n"
-
-        # Add recommendations if available
-        recommendations = evaluation_results.get("recommendations", [])
-        if recommendations:
-            comment += "\n**Recommendations:**\n"
-            for rec in recommendations:
-                comment += f"- {rec}\n"
+        comment = format_evaluation_comment(name, evaluation_results)
 
         # Add to existing task if task_id is provided
         if task_id:
@@ -342,10 +558,11 @@ def post_evaluation_to_teamwork(
         elif project_id:
             response = client.create_task(
                 project_id=project_id,
-                name=f"Name Evaluation: {name}",
+                name=evaluation_task_title(name),
                 description=comment,
             )
-            new_task_id = response.get("taskId")
+            new_task_id = response.get("taskId") or response.get("id")
+            _record_created_task(new_task_id, project_id, name, comment)
             return True, f"Created new task {new_task_id} in project {project_id}"
 
         else:
@@ -355,25 +572,131 @@ def post_evaluation_to_teamwork(
         return False, f"Error posting to Teamwork: {e}"
 
 
-def get_previous_evaluations(name: str) -> List[Dict[str, Any]]:
+def _record_created_task(
+    task_id: Optional[str], project_id: str, name: str, description: str
+):
+    """Add a newly created evaluation task to the local index."""
+    if not task_id:
+        return
+    try:
+        get_task_index().upsert_tasks(
+            [
+                {
+                    "id": task_id,
+                    "content": evaluation_task_title(name),
+                    "description": description,
+                    "created-on": datetime.now().isoformat(),
+                }
+            ],
+            {"id": project_id},
+        )
+    except Exception as e:
+        print(f"Could not record task {task_id} in the local index: {e}")
+
+
+def post_evaluations_to_teamwork(
+    results: List[Dict[str, Any]],
+    project_id: str,
+    max_workers: int = POST_MAX_WORKERS,
+    rate_limit: float = POST_RATE_LIMIT,
+    skip_existing: bool = True,
+) -> Dict[str, Any]:
     """
-    Find previous evaluations for a name in Teamwork.
+    Post many evaluation results to a Teamwork project concurrently.
+
+    All posts share the pooled Teamwork session and run on a bounded worker
+    pool whose request starts are spaced by a rate limiter. Names that already
+    have a "Name Evaluation:" task in the project (according to the local task
+    index), or that appear more than once in the batch, are skipped.
 
     Args:
-        name: The name to search for
+        results: Evaluation result dictionaries (each with a "name")
+        project_id: Project ID to create the evaluation tasks in
+        max_workers: Maximum number of concurrent posts
+        rate_limit: Maximum posts started per second (0 for unlimited)
+        skip_existing: Whether to skip names with an existing evaluation task
 
     Returns:
-        List of previous evaluation records
+        Dictionary with per-result outcomes and aggregate counts, elapsed time
+        and throughput
+    """
+    start = time.perf_counter()
+
+    existing_titles = set()
+    if skip_existing:
+        try:
+            index = ensure_fresh_index(get_teamwork_client())
+            existing_titles = index.task_titles(
+                project_id=str(project_id), prefix=evaluation_task_title("")
+            )
+        except Exception as e:
+            print(f"Could not check existing evaluation tasks: {e}")
+
+    outcomes = [None] * len(results)
+    to_post = []
+    seen = set()
+    for i, result in enumerate(results):
+        name = result.get("name", "")
+        title = evaluation_task_title(name)
+        if title in existing_titles or title in seen:
+            outcomes[i] = {
+                "name": name,
+                "status": "skipped",
+                "message": "Evaluation task already exists",
+            }
+        else:
+            seen.add(title)
+            to_post.append(i)
+
+    limiter = RateLimiter(rate_limit)
+
+    def post(i):
+        limiter.acquire()
+        name = results[i].get("name", "")
+        success, message = post_evaluation_to_teamwork(
+            name=name, evaluation_results=results[i], project_id=project_id
+        )
+        return i, {
+            "name": name,
+            "status": "posted" if success else "failed",
+            "message": message,
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for i, outcome in executor.map(post, to_post):
+            outcomes[i] = outcome
+
+    elapsed = time.perf_counter() - start
+    posted = sum(1 for o in outcomes if o["status"] == "posted")
+    return {
+        "outcomes": outcomes,
+        "posted": posted,
+        "skipped": sum(1 for o in outcomes if o["status"] == "skipped"),
+        "failed": sum(1 for o in outcomes if o["status"] == "failed"),
+        "elapsed": elapsed,
+        "throughput": posted / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def extract_previous_evaluations(
+    search_results: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
     """
-    # Search for tasks containing the name
-    search_results = search_name_in_teamwork(name)
+    Pick the name evaluation tasks out of a set of search results.
+
+    Args:
+        search_results: Tasks returned by search_name_in_teamwork
 
-    # Filter for evaluation tasks
+    Returns:
+        List of previous evaluation records
+    """
     evaluations = []
     for task in search_results:
         task_name = task.get("content", "")
         # Look for tasks that are name evaluations
         if "Name Evaluation:" in task_name or "name evaluation" in task_name.lower():
+            description = task.get("description") or ""
+            notation = EVALUATION_NOTATION_PATTERN.search(description)
             evaluations.append(
                 {
                     "task_id": task.get("id"),
@@ -381,63 +704,121 @@ def get_previous_evaluations(name: str) -> List[Dict[str, Any]]:
                     "title": task.get("content"),
                     "url": task.get("url"),
                     "created_at": task.get("created-on"),
+                    "compliant": "✅ Compliant" in description,
+                    "notation": notation.group(1).strip() if notation else None,
                 }
             )
 
     return evaluations
 
 
-def verify_name_in_teamwork(name: str) -> Dict[str, Any]:
+def get_previous_evaluations(name: str) -> List[Dict[str, Any]]:
     """
-    Verify a name against previous records in Teamwork.
+    Find previous evaluations for a name in Teamwork.
 
     Args:
-        name: Name to verify in Teamwork
+        name: The name to search for
+
+    Returns:
+        List of previous evaluation records
+    """
+    return extract_previous_evaluations(search_name_in_teamwork(name))
+
+
+def build_verification_result(
+    name: str, search_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Build the verification record for a name from its Teamwork search results.
+
+    Args:
+        name: Name that was searched for
+        search_results: Tasks returned by search_name_in_teamwork
 
     Returns:
         Dictionary with verification results
     """
-    # Add a direct check of the API key for troubleshooting
+    previous_evaluations = extract_previous_evaluations(search_results)
+
+    # Determine verification status
+    if previous_evaluations:
+        verification_status = "Verified - multiple evaluations found"
+    elif search_results:
+        verification_status = "Prior translations found - detailed verification needed"
+    else:
+        verification_status = "Not found in Teamwork records"
+
+    return {
+        "name": name,
+        "found_in_teamwork": bool(search_results or previous_evaluations),
+        "previous_translations": search_results,
+        "previous_evaluations": previous_evaluations,
+        "verification_status": verification_status,
+    }
+
+
+def check_teamwork_connection() -> Tuple[bool, str]:
+    """
+    Check that the Teamwork API is reachable with the configured credentials.
+
+    Returns:
+        Tuple of (success, message)
+    """
     try:
-        direct_api_key = os.environ.get("TEAMWORK_API_KEY")
-        # Try direct curl-like authentication
-        auth_string = f"{direct_api_key}:X"
-        encoded = base64.b64encode(auth_string.encode()).decode()
-        headers = {"Authorization": f"Basic {encoded}"}
-        response = requests.get(
-            "https://cultureflipper.teamwork.com/projects.json", headers=headers
-        )
-        print(f"Direct API check: {response.status_code}")
+        client = get_teamwork_client()
+        response = client.session.get(f"{client.base_url}/projects.json")
+        if response.status_code == 200:
+            return True, f"Connected to {client.base_url} (HTTP 200)"
+        return False, f"{client.base_url} returned HTTP {response.status_code}"
     except Exception as e:
-        print(f"Direct API check error: {e}")
+        return False, f"Could not reach Teamwork: {e}"
 
-    # Continue with regular verification
-    try:
-        # Search for previous tasks containing this name
-        results = search_name_in_teamwork(name)
 
-        # Get previous evaluation details if found
-        previous_evaluations = get_previous_evaluations(name)
+def _verification_cache():
+    """Get the persistent cache for Teamwork verification results."""
+    return get_cache(
+        "teamwork_verification",
+        ttl=VERIFICATION_CACHE_TTL,
+        max_entries=VERIFICATION_CACHE_SIZE,
+    )
 
-        # Determine verification status
-        if previous_evaluations:
-            verification_status = "Verified - multiple evaluations found"
-        elif results:
-            verification_status = (
-                "Prior translations found - detailed verification needed"
-            )
-        else:
-            verification_status = "Not found in Teamwork records"
 
-        # Construct verification result
-        verification_result = {
-            "name": name,
-            "found_in_teamwork": bool(results or previous_evaluations),
-            "previous_translations": results,
-            "previous_evaluations": previous_evaluations,
-            "verification_status": verification_status,
-        }
+def _verification_cache_key(name: str) -> str:
+    """Normalize a name into the key used for cached verification results."""
+    return " ".join(unicodedata.normalize("NFC", name).split()).lower()
+
+
+def _cached_verification(name: str) -> Optional[Dict[str, Any]]:
+    """Return a cached verification result for a name, if still valid."""
+    cached = _verification_cache().get(_verification_cache_key(name))
+    if cached is not None:
+        cached["name"] = name
+    return cached
+
+
+def verify_name_in_teamwork(name: str) -> Dict[str, Any]:
+    """
+    Verify a name against previous records in Teamwork.
+
+    A single search is issued per name; previous translations and previous
+    evaluations are both derived from that result set. Successful results are
+    cached on disk (keyed on the normalized name) for TEAMWORK_CACHE_TTL seconds.
+
+    Args:
+        name: Name to verify in Teamwork
 
+    Returns:
+        Dictionary with verification results
+    """
+    cached = _cached_verification(name)
+    if cached is not None:
+        return cached
+
+    try:
+        # Search for previous tasks containing this name
+        results = search_name_in_teamwork(name)
+        verification_result = build_verification_result(name, results)
+        _verification_cache().set(_verification_cache_key(name), verification_result)
         return verification_result
 
     except Exception as e:
@@ -450,6 +831,76 @@ def verify_name_in_teamwork(name: str) -> Dict[str, Any]:
         }
 
 
+def _iter_workspace_tasks(client: "TeamworkClient", use_index: bool):
+    """Yield every task in the workspace once, from the index or the API."""
+    if use_index:
+        yield from ensure_fresh_index(client).iter_tasks()
+        return
+
+    for project, tasks, error, _ in iter_project_tasks(client, client.get_projects()):
+        if error is not None:
+            print(f"Error searching tasks in project {project.get('id')}: {error}")
+            continue
+        for task in tasks:
+            task["projectName"] = project.get("name")
+            yield task
+
+
+def verify_names_in_teamwork(
+    names: List[str], use_index: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Verify a batch of names against previous records in Teamwork.
+
+    The workspace is scanned once and every task is matched against all names
+    at the same time with an Aho–Corasick automaton over the lowercased task
+    content and description, so a batch costs one scan instead of one per name.
+    Names with a valid cached result are not scanned for at all.
+
+    Args:
+        names: Names to verify in Teamwork
+        use_index: Whether to scan the local task index instead of the API
+
+    Returns:
+        List of verification result dictionaries, in the same order as names
+    """
+    cached = {name: _cached_verification(name) for name in set(names)}
+    pending = [name for name, result in cached.items() if result is None]
+    if not pending:
+        return [cached[name] for name in names]
+
+    try:
+        client = get_teamwork_client()
+
+        matcher = AhoCorasickMatcher()
+        for name in pending:
+            matcher.add_pattern(name.strip(), name)
+
+        matches = {name: [] for name in pending}
+        for task in _iter_workspace_tasks(client, use_index):
+            text = f"{task.get('content') or ''}\x00{task.get('description') or ''}"
+            for name in matcher.find_keys(text):
+                matches[name].append(format_task(task, client.base_url))
+
+        for name in pending:
+            cached[name] = build_verification_result(name, matches[name])
+            _verification_cache().set(_verification_cache_key(name), cached[name])
+
+        return [cached[name] for name in names]
+
+    except Exception as e:
+        print(f"Error in Teamwork verification: {e}")
+        return [
+            {
+                "name": name,
+                "found_in_teamwork": False,
+                "error": str(e),
+                "verification_status": "Error - could not verify",
+            }
+            for name in names
+        ]
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
@@ -470,7 +921,7 @@ if __name__ == "__main__":
 
     if len(sys.argv) < 2:
         print(
-            "Usage: python teamwork_integration.py [search|evaluations|verify|post] [name]"
+            "Usage: python teamwork_integration.py [search|evaluations|verify|post|health] [name]"
         )
         sys.exit(1)
 
@@ -555,9 +1006,16 @@ if __name__ == "__main__":
         except Exception as e:
             print(f"Error: {e}")
 
+    elif command == "health":
+        print("Checking Teamwork API connection...")
+        success, message = check_teamwork_connection()
+        print(f"Status: {'OK' if success else 'Failed'}")
+        print(f"Message: {message}")
+        sys.exit(0 if success else 1)
+
     else:
         print("Invalid command or missing name parameter")
         print(
-            "Usage: python teamwork_integration.py [search|evaluations|verify|post] [name]"
+            "Usage: python teamwork_integration.py [search|evaluations|verify|post|health] [name]"
         )
         sys.exit(1)
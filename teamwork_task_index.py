@@ -0,0 +1,476 @@
+#!/usr/bin/env python
+"""
+Local Teamwork Task Index for CF Name Evaluation System.
+
+This module maintains an on-disk SQLite copy of the Teamwork tasks that the
+name evaluation system searches when verifying names. Instead of downloading
+every task of every active project for each name, the workspace is crawled
+once and then refreshed incrementally using Teamwork's updated-since filter,
+so name lookups become local queries.
+
+The module includes:
+- A SQLite-backed task store with per-project synchronisation timestamps
+- Incremental refresh using the `updatedAfterDate` task filter
+- Substring search over task content and description (FTS5 trigram index
+  when the SQLite build supports it, plain scan otherwise)
+- A process-wide index instance shared by the Teamwork integration
+- Command-line interface for building, refreshing and querying the index
+
+The index is stored under the reports cache directory by default and can be
+relocated with the TEAMWORK_INDEX_PATH environment variable.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from dotenv import load_dotenv
+
+from teamwork_async import iter_project_tasks
+from terminologists_manual_links import CACHE_DIR
+
+# Load environment variables
+load_dotenv()
+
+# Default location of the on-disk index
+DEFAULT_INDEX_PATH = os.path.join(CACHE_DIR, "teamwork_tasks.sqlite")
+
+# Seconds after which the index is considered stale and refreshed before a query
+DEFAULT_MAX_AGE = int(os.environ.get("TEAMWORK_INDEX_MAX_AGE", "900"))
+
+# Minimum query length supported by the FTS5 trigram tokenizer
+TRIGRAM_MIN_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    project_id TEXT,
+    project_name TEXT,
+    content TEXT,
+    description TEXT,
+    content_lower TEXT,
+    description_lower TEXT,
+    created_on TEXT,
+    last_changed_on TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks (project_id);
+CREATE TABLE IF NOT EXISTS project_sync (
+    project_id TEXT PRIMARY KEY,
+    project_name TEXT,
+    last_synced TEXT
+);
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _teamwork_timestamp(moment: datetime) -> str:
+    """Format a datetime in the YYYYMMDDHHMMSS form used by Teamwork filters."""
+    return moment.astimezone(timezone.utc).strftime("%Y%m%d%H%M%S")
+
+
+class TeamworkTaskIndex:
+    """SQLite-backed local index of Teamwork tasks."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Open (or create) the task index.
+
+        Args:
+            path: Path to the SQLite file (defaults to TEAMWORK_INDEX_PATH env var
+                  or reports/.cache/teamwork_tasks.sqlite)
+        """
+        self.path = path or os.environ.get("TEAMWORK_INDEX_PATH", DEFAULT_INDEX_PATH)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self.fts_enabled = self._create_fts_table()
+        self._conn.commit()
+
+    def _create_fts_table(self) -> bool:
+        """Create the trigram full-text table if this SQLite build supports it."""
+        try:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts "
+                "USING fts5(task_id UNINDEXED, content, description, tokenize='trigram')"
+            )
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a value from the index metadata table."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM index_meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def last_refreshed(self) -> Optional[float]:
+        """Return the UNIX time of the last completed refresh, if any."""
+        value = self.get_meta("last_refresh")
+        return float(value) if value else None
+
+    def is_stale(self, max_age: Optional[int] = None) -> bool:
+        """
+        Check whether the index needs a refresh.
+
+        Args:
+            max_age: Maximum age in seconds (defaults to TEAMWORK_INDEX_MAX_AGE)
+
+        Returns:
+            True if the index was never built or is older than max_age
+        """
+        max_age = DEFAULT_MAX_AGE if max_age is None else max_age
+        last = self.last_refreshed()
+        return last is None or (time.time() - last) > max_age
+
+    def task_count(self) -> int:
+        """Return the number of tasks currently stored in the index."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def upsert_tasks(self, tasks: List[Dict[str, Any]], project: Dict[str, Any]):
+        """
+        Insert or update tasks belonging to a project.
+
+        Args:
+            tasks: Task dictionaries as returned by the Teamwork API
+            project: Project dictionary the tasks belong to
+        """
+        project_id = str(project.get("id"))
+        project_name = project.get("name")
+        with self._lock:
+            for task in tasks:
+                task_id = str(task.get("id"))
+                content = task.get("content") or ""
+                description = task.get("description") or ""
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tasks (id, project_id, project_name, content, "
+                    "description, content_lower, description_lower, created_on, "
+                    "last_changed_on) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        task_id,
+                        str(
+                            task.get("projectId")
+                            or task.get("project-id")
+                            or project_id
+                        ),
+                        project_name,
+                        content,
+                        description,
+                        content.lower(),
+                        description.lower(),
+                        task.get("created-on", task.get("created-date", "")),
+                        task.get("last-changed-on", ""),
+                    ),
+                )
+                if self.fts_enabled:
+                    self._conn.execute(
+                        "DELETE FROM tasks_fts WHERE task_id = ?", (task_id,)
+                    )
+                    self._conn.execute(
+                        "INSERT INTO tasks_fts (task_id, content, description) "
+                        "VALUES (?, ?, ?)",
+                        (task_id, content, description),
+                    )
+            self._conn.commit()
+
+    def _drop_projects_except(self, project_ids: List[str]):
+        """Remove tasks of projects that are no longer active."""
+        placeholders = ",".join("?" for _ in project_ids) or "''"
+        stale = [
+            row["id"]
+            for row in self._conn.execute(
+                f"SELECT id FROM tasks WHERE project_id NOT IN ({placeholders})",
+                project_ids,
+            )
+        ]
+        for task_id in stale:
+            self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            if self.fts_enabled:
+                self._conn.execute(
+                    "DELETE FROM tasks_fts WHERE task_id = ?", (task_id,)
+                )
+        self._conn.execute(
+            f"DELETE FROM project_sync WHERE project_id NOT IN ({placeholders})",
+            project_ids,
+        )
+
+    def refresh(self, client=None, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the index up to date with Teamwork.
+
+        Projects that have been synchronised before only fetch tasks changed since
+        their last sync; new projects (or all projects when full=True) are crawled
+        completely. Project task lists are fetched concurrently and indexed page by
+        page as they arrive.
+
+        Args:
+            client: TeamworkClient to use (the shared client if omitted)
+            full: Whether to ignore sync timestamps and re-crawl every project
+
+        Returns:
+            Dictionary with refresh statistics
+        """
+        if client is None:
+            from teamwork_integration import get_teamwork_client
+
+            client = get_teamwork_client()
+
+        started = datetime.now(timezone.utc)
+        projects = client.get_projects()
+        project_ids = [str(project.get("id")) for project in projects]
+
+        with self._lock:
+            synced = {
+                row["project_id"]: row["last_synced"]
+                for row in self._conn.execute(
+                    "SELECT project_id, last_synced FROM project_sync"
+                )
+            }
+
+        stats = {"projects": len(projects), "tasks_updated": 0, "errors": 0}
+        updated_after = {} if full else synced
+        failed = set()
+        for project, tasks, error, done in iter_project_tasks(
+            client, projects, updated_after=updated_after
+        ):
+            project_id = str(project.get("id"))
+            if error is not None:
+                print(f"Error indexing tasks in project {project_id}: {error}")
+                stats["errors"] += 1
+                failed.add(project_id)
+                continue
+
+            # Index each page as it arrives
+            if tasks:
+                self.upsert_tasks(tasks, project)
+                stats["tasks_updated"] += len(tasks)
+
+            # Only advance the sync time once every page of the project is stored
+            if done and project_id not in failed:
+                with self._lock:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO project_sync (project_id, "
+                        "project_name, last_synced) VALUES (?, ?, ?)",
+                        (
+                            project_id,
+                            project.get("name"),
+                            _teamwork_timestamp(started),
+                        ),
+                    )
+                    self._conn.commit()
+
+        with self._lock:
+            self._drop_projects_except(project_ids)
+            self._set_meta("last_refresh", str(started.timestamp()))
+            self._conn.commit()
+
+        return stats
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Find tasks whose content or description contains the query.
+
+        Matching is case-insensitive, mirroring the substring filter previously
+        applied to API results.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of matching task dictionaries in Teamwork API field names
+        """
+        query_lower = query.lower().strip()
+        if not query_lower:
+            return []
+
+        with self._lock:
+            if self.fts_enabled and len(query_lower) >= TRIGRAM_MIN_LENGTH:
+                phrase = '"' + query_lower.replace('"', '""') + '"'
+                rows = self._conn.execute(
+                    "SELECT t.* FROM tasks_fts f JOIN tasks t ON t.id = f.task_id "
+                    "WHERE tasks_fts MATCH ? ORDER BY t.project_id, t.id",
+                    (phrase,),
+                ).fetchall()
+                # The trigram tokenizer folds case slightly differently from
+                # str.lower(), so confirm each candidate with the original filter
+                rows = [
+                    row
+                    for row in rows
+                    if query_lower in row["content_lower"]
+                    or query_lower in row["description_lower"]
+                ]
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM tasks WHERE instr(content_lower, ?) > 0 "
+                    "OR instr(description_lower, ?) > 0 ORDER BY project_id, id",
+                    (query_lower, query_lower),
+                ).fetchall()
+
+        return [self._row_to_task(row) for row in rows]
+
+    def task_titles(
+        self, project_id: Optional[str] = None, prefix: str = ""
+    ) -> Set[str]:
+        """
+        Get the titles (content) of indexed tasks.
+
+        Args:
+            project_id: Only include tasks from this project
+            prefix: Only include titles starting with this text
+
+        Returns:
+            Set of task titles
+        """
+        sql = "SELECT content FROM tasks WHERE substr(content, 1, ?) = ?"
+        params: List[Any] = [len(prefix), prefix]
+        if project_id is not None:
+            sql += " AND project_id = ?"
+            params.append(str(project_id))
+        with self._lock:
+            return {row["content"] for row in self._conn.execute(sql, params)}
+
+    def iter_tasks(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every indexed task.
+
+        Args:
+            batch_size: Number of rows fetched from SQLite at a time
+
+        Yields:
+            Task dictionaries in Teamwork API field names
+        """
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, * FROM tasks WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._row_to_task(row)
+            last_rowid = rows[-1]["rowid"]
+
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "content": row["content"],
+            "description": row["description"],
+            "projectId": row["project_id"],
+            "projectName": row["project_name"],
+            "created-on": row["created_on"],
+            "last-changed-on": row["last_changed_on"],
+        }
+
+
+_shared_index: Optional[TeamworkTaskIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_task_index(path: Optional[str] = None) -> TeamworkTaskIndex:
+    """
+    Get the process-wide task index, opening it on first use.
+
+    Args:
+        path: Optional path to the SQLite file (only used on first call)
+
+    Returns:
+        Shared TeamworkTaskIndex instance
+    """
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = TeamworkTaskIndex(path)
+        return _shared_index
+
+
+def ensure_fresh_index(client=None, max_age: Optional[int] = None) -> TeamworkTaskIndex:
+    """
+    Get the shared index, refreshing it first if it is stale.
+
+    Args:
+        client: TeamworkClient to use for the refresh
+        max_age: Maximum acceptable age in seconds
+
+    Returns:
+        Shared TeamworkTaskIndex instance
+    """
+    index = get_task_index()
+    if index.is_stale(max_age):
+        index.refresh(client)
+    return index
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print(
+            "Usage: python teamwork_task_index.py [build|refresh|search|stats] [query]"
+        )
+        sys.exit(1)
+
+    command = sys.argv[1]
+    index = get_task_index()
+
+    if command in ("build", "refresh"):
+        start = time.perf_counter()
+        stats = index.refresh(full=command == "build")
+        elapsed = time.perf_counter() - start
+        print(
+            f"Indexed {stats['tasks_updated']} tasks from {stats['projects']} projects "
+            f"in {elapsed:.1f}s ({stats['errors']} errors)"
+        )
+        print(f"Index location: {index.path}")
+
+    elif command == "search" and len(sys.argv) > 2:
+        query = sys.argv[2]
+        start = time.perf_counter()
+        results = index.search(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Found {len(results)} matching tasks in {elapsed_ms:.2f} ms")
+        for task in results:
+            print(f"- {task.get('content')} (Task ID: {task.get('id')})")
+            print(f"  Project: {task.get('projectName')}")
+
+    elif command == "stats":
+        last = index.last_refreshed()
+        print(f"Index location: {index.path}")
+        print(f"Tasks indexed: {index.task_count()}")
+        print(f"Full-text search: {'enabled' if index.fts_enabled else 'disabled'}")
+        if last:
+            print(f"Last refreshed: {datetime.fromtimestamp(last).isoformat()}")
+        else:
+            print("Last refreshed: never")
+
+    else:
+        print(
+            "Usage: python teamwork_task_index.py [build|refresh|search|stats] [query]"
+        )
+        sys.exit(1)
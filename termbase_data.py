@@ -0,0 +1,551 @@
+#!/usr/bin/env python
+"""
+Local Termbase Data for CF Name Evaluation System.
+
+terminologists_manual_links lists local copies of the CF spreadsheets
+(Terminologists' Depository, TM Training Landscape, TM Job Organizer and the
+MMT workbook) in CF_INTERNAL_RESOURCES, but nothing read them. This module
+loads those workbooks and extracts the Hangul/Roman name pairs they record,
+so the evaluators can look up prior notations without a model call.
+
+The workbooks have no common layout, so the columns of every sheet are
+detected: the Hangul column is the one whose cells mostly contain Hangul and
+the Roman column the one whose cells are mostly Latin text, preferring
+columns whose headers name the language ("Korean", "한글", "English",
+"영문"...). A date column is picked up the same way when a header names one.
+Cells longer than TERMBASE_MAX_TERM_LENGTH characters (sentences of marketing
+copy rather than names) are skipped.
+
+Every entry reads as a dictionary:
+
+    {"hangul": "김지원", "roman": "Kim Ji-won",
+     "resource": "terminology_depository", "sheet": "Names", "row": 12,
+     "date": "2023-04-01"}
+
+Parsing a large multi-sheet workbook through openpyxl takes seconds to
+minutes, so each workbook is parsed once and ingested into a columnar cache
+under the reports cache directory (TERMBASE_COLUMNS_DIR): one directory per
+resource holding a typed NumPy array per column (fixed-width Unicode for the
+names, sheet and source, int32 row numbers, datetime64[D] dates) and a
+manifest with the size, modification time and SHA-256 of the workbook it came
+from. Later loads memory-map the arrays instead of parsing the workbook, and
+the entries are a TermbaseEntries view over them: consumers read whole
+columns, and a dictionary is only built for an entry that is accessed. A
+workbook whose modification time changed but whose content did not is
+recognized by its hash and not parsed again, and since the fingerprint of the
+workbooks is built from the same hashes, the indexes built from them are not
+rebuilt either.
+
+The module includes:
+- Discovery of the local resource workbooks and a fingerprint of their content
+- Column detection for Hangul, Roman and date columns
+- Ingestion of workbooks into memory-mapped typed column arrays
+- A lazy sequence of entries over the column arrays
+- Workbook loading with an in-process cache keyed by the fingerprint
+- A CLI that ingests the workbooks and lists how many pairs each provides
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from terminologists_manual_links import CACHE_DIR, CF_INTERNAL_RESOURCES
+
+# pandas (with openpyxl) reads the workbooks
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Load environment variables
+load_dotenv()
+
+# Cells longer than this are text rather than names
+TERMBASE_MAX_TERM_LENGTH = int(os.environ.get("TERMBASE_MAX_TERM_LENGTH", "60"))
+
+# Location of the columnar workbook cache
+TERMBASE_COLUMNS_DIR = os.environ.get(
+    "TERMBASE_COLUMNS_DIR", os.path.join(CACHE_DIR, "termbase_columns")
+)
+
+# Typed columns of the cache (name fields are fixed-width Unicode)
+COLUMNS = ("hangul", "roman", "resource", "sheet", "row", "date")
+
+# Share of a column's cells that must be in one script for it to be picked
+MIN_SCRIPT_RATIO = 0.5
+
+# Header words naming the language or the date of a column
+KOREAN_HEADER_HINTS = ("korean", "한국어", "한글", "국문", "kor", "ko")
+ENGLISH_HEADER_HINTS = ("english", "영어", "영문", "roman", "eng", "en")
+DATE_HEADER_HINTS = ("date", "날짜", "일자", "updated", "created")
+
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+LATIN_PATTERN = re.compile(r"[A-Za-z]")
+
+_entries_lock = threading.Lock()
+_entries_cache: Dict[str, "TermbaseEntries"] = {}
+
+# Content hashes of workbooks by (path, size, modification time)
+_hashes_lock = threading.Lock()
+_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def termbase_files() -> Dict[str, str]:
+    """
+    Get the local resource workbooks that exist in the data directory.
+
+    Returns:
+        Dictionary mapping resource keys to workbook paths
+    """
+    return {
+        key: resource["local_file"]
+        for key, resource in CF_INTERNAL_RESOURCES.items()
+        if resource.get("local_file") and os.path.exists(resource["local_file"])
+    }
+
+
+def files_fingerprint(files: Dict[str, str]) -> str:
+    """
+    Fingerprint the content of a set of workbooks.
+
+    The fingerprint changes whenever a workbook is added, removed or edited,
+    so indexes built from the workbooks can tell they are stale. It is built
+    from the SHA-256 of each workbook, so a workbook that was only touched
+    keeps its fingerprint.
+
+    Args:
+        files: Dictionary mapping resource keys to workbook paths
+
+    Returns:
+        Hex digest identifying the workbooks
+    """
+    state = [
+        [key, os.path.basename(path), workbook_sha256(key, path)]
+        for key, path in sorted(files.items())
+    ]
+    return hashlib.sha256(json.dumps(state).encode("utf-8")).hexdigest()
+
+
+def _cell_text(value: Any) -> str:
+    if value is None or (isinstance(value, float) and value != value):
+        return ""
+    return " ".join(str(value).split())
+
+
+def _header_matches(header: str, hints: Tuple[str, ...]) -> bool:
+    """Whether a column header names one of the hinted languages or fields."""
+    lowered = header.casefold()
+    words = set(re.split(r"[^\w]+", lowered))
+    return any(hint in words if len(hint) <= 3 else hint in lowered for hint in hints)
+
+
+def detect_columns(
+    headers: List[str], rows: List[List[str]]
+) -> Optional[Tuple[int, int, Optional[int]]]:
+    """
+    Find the Hangul, Roman and date columns of a sheet.
+
+    Args:
+        headers: Column headers
+        rows: Cell texts of the sheet, row by row
+
+    Returns:
+        Tuple of (Hangul column, Roman column, date column or None), or None
+        if the sheet has no Hangul/Roman pair
+    """
+    hangul_scores: Dict[int, float] = {}
+    latin_scores: Dict[int, float] = {}
+    for column, header in enumerate(headers):
+        cells = [
+            row[column]
+            for row in rows
+            if row[column] and len(row[column]) <= TERMBASE_MAX_TERM_LENGTH
+        ]
+        if not cells:
+            continue
+        hangul = sum(1 for cell in cells if HANGUL_PATTERN.search(cell)) / len(cells)
+        latin = sum(
+            1
+            for cell in cells
+            if LATIN_PATTERN.search(cell) and not HANGUL_PATTERN.search(cell)
+        ) / len(cells)
+        # A header naming the language outweighs a slightly better ratio
+        if hangul >= MIN_SCRIPT_RATIO:
+            hangul_scores[column] = hangul + _header_matches(
+                header, KOREAN_HEADER_HINTS
+            )
+        if latin >= MIN_SCRIPT_RATIO:
+            latin_scores[column] = latin + _header_matches(header, ENGLISH_HEADER_HINTS)
+
+    if not hangul_scores:
+        return None
+    hangul_column = max(hangul_scores, key=hangul_scores.get)
+    latin_scores.pop(hangul_column, None)
+    if not latin_scores:
+        return None
+    roman_column = max(latin_scores, key=latin_scores.get)
+
+    date_column = next(
+        (
+            column
+            for column, header in enumerate(headers)
+            if column not in (hangul_column, roman_column)
+            and _header_matches(header, DATE_HEADER_HINTS)
+        ),
+        None,
+    )
+    return hangul_column, roman_column, date_column
+
+
+def read_workbook(path: str, resource: str) -> List[Dict[str, Any]]:
+    """
+    Extract the Hangul/Roman name pairs of one workbook.
+
+    Args:
+        path: Path of the .xlsx file
+        resource: Resource key the workbook belongs to
+
+    Returns:
+        List of termbase entries
+    """
+    if not PANDAS_AVAILABLE:
+        print("pandas is not installed; local termbase workbooks cannot be read")
+        return []
+    try:
+        sheets = pd.read_excel(path, sheet_name=None, dtype=str, engine="openpyxl")
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return []
+
+    entries = []
+    for sheet, frame in sheets.items():
+        headers = [_cell_text(header) for header in frame.columns]
+        rows = [[_cell_text(value) for value in row] for row in frame.values.tolist()]
+        columns = detect_columns(headers, rows)
+        if columns is None:
+            continue
+        hangul_column, roman_column, date_column = columns
+        for number, row in enumerate(rows, 2):
+            hangul, roman = row[hangul_column], row[roman_column]
+            if (
+                not hangul
+                or not roman
+                or len(hangul) > TERMBASE_MAX_TERM_LENGTH
+                or len(roman) > TERMBASE_MAX_TERM_LENGTH
+                or not HANGUL_PATTERN.search(hangul)
+                or not LATIN_PATTERN.search(roman)
+            ):
+                continue
+            entries.append(
+                {
+                    "hangul": hangul,
+                    "roman": roman,
+                    "resource": resource,
+                    "sheet": str(sheet),
+                    "row": number,
+                    "date": (
+                        (row[date_column] or None) if date_column is not None else None
+                    ),
+                }
+            )
+    return entries
+
+
+def file_sha256(path: str) -> str:
+    """
+    Hash the content of a file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def workbook_sha256(resource: str, path: str) -> str:
+    """
+    Get the content hash of a workbook without rereading it when possible.
+
+    The hash recorded in the manifest of the column cache is used while the
+    workbook keeps the size and modification time recorded with it; a
+    workbook is only hashed again after it is written, once per process.
+
+    Args:
+        resource: Resource key the workbook belongs to
+        path: Path of the .xlsx file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    stat = os.stat(path)
+    state = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    with _hashes_lock:
+        if state in _hashes:
+            return _hashes[state]
+
+    manifest = _read_manifest(os.path.join(TERMBASE_COLUMNS_DIR, resource))
+    if (
+        manifest is not None
+        and manifest.get("sha256")
+        and manifest.get("size") == stat.st_size
+        and manifest.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        digest = manifest["sha256"]
+    else:
+        digest = file_sha256(path)
+    with _hashes_lock:
+        _hashes[state] = digest
+    return digest
+
+
+def entries_to_columns(entries: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert termbase entries into typed column arrays.
+
+    Args:
+        entries: Termbase entries
+
+    Returns:
+        Dictionary mapping each of COLUMNS to an array
+    """
+    columns = {
+        field: np.array([str(entry[field]) for entry in entries], dtype="U")
+        for field in ("hangul", "roman", "resource", "sheet")
+    }
+    columns["row"] = np.array([entry["row"] for entry in entries], dtype=np.int32)
+    dates = [entry.get("date") or None for entry in entries]
+    if PANDAS_AVAILABLE:
+        parsed = pd.to_datetime(
+            pd.Series(dates, dtype=object), errors="coerce", format="mixed"
+        )
+        columns["date"] = parsed.to_numpy(dtype="datetime64[ns]").astype(
+            "datetime64[D]"
+        )
+    else:
+        columns["date"] = np.full(len(entries), np.datetime64("NaT"), "datetime64[D]")
+    return columns
+
+
+class TermbaseEntries(Sequence):
+    """Read-only sequence of termbase entries over typed column arrays."""
+
+    def __init__(self, parts: List[Dict[str, np.ndarray]]):
+        """
+        Chain the columns of several workbooks.
+
+        Args:
+            parts: Dictionaries mapping each of COLUMNS to a (memory-mapped)
+                   array, one per workbook
+        """
+        self.parts = [part for part in parts if len(part["row"])]
+        self.offsets = np.cumsum([0] + [len(part["row"]) for part in self.parts])
+
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("termbase entry index out of range")
+        part = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        columns, row = self.parts[part], index - int(self.offsets[part])
+        date = columns["date"][row]
+        return {
+            "hangul": str(columns["hangul"][row]),
+            "roman": str(columns["roman"][row]),
+            "resource": str(columns["resource"][row]),
+            "sheet": str(columns["sheet"][row]),
+            "row": int(columns["row"][row]),
+            "date": None if np.isnat(date) else str(date),
+        }
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Get one column across every workbook.
+
+        Args:
+            field: One of COLUMNS
+
+        Returns:
+            Array of the field's values in entry order
+        """
+        if not self.parts:
+            return entries_to_columns([])[field]
+        if len(self.parts) == 1:
+            return self.parts[0][field]
+        return np.concatenate([part[field] for part in self.parts])
+
+
+def _read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(directory: str, manifest: Dict[str, Any]):
+    path = os.path.join(directory, "manifest.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def ingest_workbook(
+    resource: str, path: str, force: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Get the typed columns of a workbook, parsing it only if it changed.
+
+    Args:
+        resource: Resource key the workbook belongs to
+        path: Path of the .xlsx file
+        force: Parse the workbook even if the cache is current
+
+    Returns:
+        Dictionary mapping each of COLUMNS to a (memory-mapped) array
+    """
+    directory = os.path.join(TERMBASE_COLUMNS_DIR, resource)
+    stat = os.stat(path)
+    manifest = _read_manifest(directory)
+
+    if manifest is not None and not force:
+        current = (
+            manifest.get("size") == stat.st_size
+            and manifest.get("mtime_ns") == stat.st_mtime_ns
+        )
+        if not current and manifest.get("size") == stat.st_size:
+            # Touched but possibly unchanged: compare the content hash
+            current = manifest.get("sha256") == workbook_sha256(resource, path)
+            if current:
+                manifest["mtime_ns"] = stat.st_mtime_ns
+                _write_manifest(directory, manifest)
+        if current:
+            try:
+                return {
+                    field: np.load(
+                        os.path.join(directory, f"{field}.npy"), mmap_mode="r"
+                    )
+                    for field in COLUMNS
+                }
+            except (OSError, ValueError) as e:
+                print(f"Column cache for {resource} is unreadable, re-ingesting: {e}")
+
+    columns = entries_to_columns(read_workbook(path, resource))
+    os.makedirs(directory, exist_ok=True)
+    for field, values in columns.items():
+        np.save(os.path.join(directory, f"{field}.npy"), values)
+    _write_manifest(
+        directory,
+        {
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": workbook_sha256(resource, path),
+            "rows": len(columns["row"]),
+        },
+    )
+    return columns
+
+
+def load_termbase_entries(
+    files: Optional[Dict[str, str]] = None,
+) -> TermbaseEntries:
+    """
+    Load the name pairs of the local resource workbooks.
+
+    Workbooks are read from the columnar cache (and ingested into it when
+    they changed), once per process and state; the result is reused until a
+    workbook changes.
+
+    Args:
+        files: Dictionary mapping resource keys to workbook paths (defaults to
+               the local files of CF_INTERNAL_RESOURCES)
+
+    Returns:
+        Termbase entries from every workbook
+    """
+    if files is None:
+        files = termbase_files()
+    if not files:
+        return TermbaseEntries([])
+
+    fingerprint = files_fingerprint(files)
+    with _entries_lock:
+        if fingerprint not in _entries_cache:
+            parts = [
+                ingest_workbook(resource, path)
+                for resource, path in sorted(files.items())
+            ]
+            _entries_cache.clear()
+            _entries_cache[fingerprint] = TermbaseEntries(parts)
+        return _entries_cache[fingerprint]
+
+
+def resource_label(resource: str) -> str:
+    """
+    Get the display name of a termbase resource.
+
+    Args:
+        resource: Resource key
+
+    Returns:
+        Resource name from CF_INTERNAL_RESOURCES, or the key itself
+    """
+    return CF_INTERNAL_RESOURCES.get(resource, {}).get("name", resource)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Ingest the local termbase workbooks and list their name pairs"
+    )
+    parser.add_argument(
+        "--show", type=int, default=5, help="Number of sample pairs to print"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-ingest every workbook even if its column cache is current",
+    )
+    args = parser.parse_args()
+
+    files = termbase_files()
+    if not files:
+        print("No local termbase workbooks found in the data directory.")
+    for resource, path in sorted(files.items()):
+        started = time.perf_counter()
+        ingested = ingest_workbook(resource, path, force=args.force)
+        print(
+            f"Ingested {resource_label(resource)}: {len(ingested['row'])} rows "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    entries = load_termbase_entries(files)
+    resources = entries.column("resource")
+    for resource, path in sorted(files.items()):
+        count = int(np.count_nonzero(resources == resource))
+        print(f"{resource_label(resource)}: {count} pairs ({path})")
+    for entry in entries[: args.show]:
+        print(
+            f"  {entry['hangul']} → {entry['roman']} ({entry['sheet']}:{entry['row']})"
+        )
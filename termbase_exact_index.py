@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+"""
+Exact-Match Termbase Index for CF Name Evaluation System.
+
+Most names sent for evaluation already exist verbatim in the Terminologists'
+Depository or the MMT workbook. This module keys every Hangul/Roman pair of
+the local resource workbooks (termbase_data) by the normalized form of each
+side, so a name that is already in the termbase is answered from it in
+microseconds and never reaches the model.
+
+Keys are name_normalization.comparison_key forms (casefolded, without
+spaces, hyphens or punctuation), so "Kim Ji-won", "kim jiwon" and "Kim
+Jiwon" share a key. Each key is hashed to 64 bits; the hashes are kept in a
+sorted array next to the position of their entry and looked up by binary
+search. A hash hit is confirmed against the entry itself, so collisions
+cannot return a wrong name.
+
+The index is persisted as one compact NumPy archive under the reports cache
+directory (TERMBASE_EXACT_INDEX_PATH), tagged with the fingerprint of the
+workbooks, and rebuilt only when a workbook changes. The archive holds only
+the hashes and the entry positions; the entries themselves are read from the
+memory-mapped termbase columns.
+
+A name recorded with more than one notation (two people sharing a Hangul
+name, or a notation that changed over time) is not answered, since choosing
+between them needs the full evaluation.
+
+The module includes:
+- Hashing of normalized Hangul and Roman keys
+- A sorted-array index with binary search, saved as a single .npz file
+- Lookup of the unambiguous notation of a name per direction
+- The exact-hit provider registered with the tiered evaluation pipeline
+- A CLI for building the index and looking names up
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from name_normalization import comparison_key, normalize_name, split_name_pair
+from termbase_data import (
+    TermbaseEntries,
+    files_fingerprint,
+    load_termbase_entries,
+    resource_label,
+    termbase_files,
+)
+from terminologists_manual_links import CACHE_DIR
+
+# Load environment variables
+load_dotenv()
+
+# Location of the persisted index
+TERMBASE_EXACT_INDEX_PATH = os.environ.get(
+    "TERMBASE_EXACT_INDEX_PATH", os.path.join(CACHE_DIR, "termbase_exact.npz")
+)
+
+# Entry field looked up and entry field returned for each direction
+DIRECTION_FIELDS = {"KO-EN": ("hangul", "roman"), "EN-KO": ("roman", "hangul")}
+
+
+def key_hash(key: str) -> int:
+    """
+    Hash a normalized key to 64 bits.
+
+    Args:
+        key: comparison_key form of a name
+
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+class TermbaseExactIndex:
+    """Sorted-hash index of termbase entries by their normalized forms."""
+
+    def __init__(self):
+        self.entries = TermbaseEntries([])
+        self.fingerprint = ""
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.owners = np.zeros(0, dtype=np.int32)
+
+    def build(self, entries: TermbaseEntries, fingerprint: str = ""):
+        """
+        Index entries under the keys of their Hangul and Roman forms.
+
+        Args:
+            entries: Termbase entries from termbase_data
+            fingerprint: Fingerprint of the workbooks the entries came from
+        """
+        self.entries = entries
+        self.fingerprint = fingerprint
+        hashes, owners = [], []
+        for field in ("hangul", "roman"):
+            for i, form in enumerate(entries.column(field).tolist()):
+                key = comparison_key(form)
+                if key:
+                    hashes.append(key_hash(key))
+                    owners.append(i)
+        order = np.argsort(np.asarray(hashes, dtype=np.uint64), kind="stable")
+        self.hashes = np.asarray(hashes, dtype=np.uint64)[order]
+        self.owners = np.asarray(owners, dtype=np.int32)[order]
+
+    def save(self, path: str = TERMBASE_EXACT_INDEX_PATH):
+        """
+        Persist the index as a single .npz archive.
+
+        The entries are not saved; they are attached again from termbase_data
+        when the index is loaded.
+
+        Args:
+            path: Path of the archive
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                hashes=self.hashes,
+                owners=self.owners,
+                fingerprint=np.array(self.fingerprint),
+            )
+
+    @classmethod
+    def load(
+        cls, path: str = TERMBASE_EXACT_INDEX_PATH
+    ) -> Optional["TermbaseExactIndex"]:
+        """
+        Load a persisted index, without its entries.
+
+        Args:
+            path: Path of the archive
+
+        Returns:
+            The index, or None if there is no readable archive
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as archive:
+                index = cls()
+                index.hashes = archive["hashes"]
+                index.owners = archive["owners"]
+                index.fingerprint = str(archive["fingerprint"])
+            return index
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load the exact termbase index from {path}: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find(self, form: str, field: str) -> List[Dict[str, Any]]:
+        """
+        Find the entries whose given field has the same key as a name form.
+
+        Args:
+            form: Hangul or Roman form of a name
+            field: Entry field to match ("hangul" or "roman")
+
+        Returns:
+            Matching entries in workbook order
+        """
+        key = comparison_key(normalize_name(form))
+        if not key or not len(self.hashes):
+            return []
+        target = np.uint64(key_hash(key))
+        start = int(np.searchsorted(self.hashes, target, side="left"))
+        end = int(np.searchsorted(self.hashes, target, side="right"))
+        owners = sorted({int(owner) for owner in self.owners[start:end]})
+        return [
+            self.entries[i]
+            for i in owners
+            if comparison_key(self.entries[i][field]) == key
+        ]
+
+    def lookup(self, name: str, direction: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the termbase notation of a name, if the termbase has exactly one.
+
+        Args:
+            name: Name being evaluated (a "Hangul (Roman)" pair is looked up by
+                  its source-language form; tiered_evaluation.exact_hit
+                  compares the submitted notation with the result)
+            direction: Direction key ("KO-EN" or "EN-KO")
+
+        Returns:
+            Dictionary with the notation and the entries recording it, or None
+            if the name is unknown or has conflicting notations
+        """
+        if direction not in DIRECTION_FIELDS:
+            return None
+        source_field, target_field = DIRECTION_FIELDS[direction]
+        hangul, roman = split_name_pair(normalize_name(name))
+        form = hangul if source_field == "hangul" else roman
+        if not form:
+            return None
+
+        matches = self.find(form, source_field)
+        notations = {normalize_name(entry[target_field]) for entry in matches}
+        if len(notations) != 1:
+            return None
+        return {"notation": matches[-1][target_field], "entries": matches}
+
+
+_index: Optional[TermbaseExactIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_exact_index(rebuild: bool = False) -> TermbaseExactIndex:
+    """
+    Get the process-wide exact index, building it if it is out of date.
+
+    Args:
+        rebuild: Rebuild the index even if the persisted one is current
+
+    Returns:
+        The exact index (empty when no local workbooks exist)
+    """
+    global _index
+    with _index_lock:
+        files = termbase_files()
+        fingerprint = files_fingerprint(files) if files else ""
+        if not rebuild and _index is not None and _index.fingerprint == fingerprint:
+            return _index
+
+        entries = load_termbase_entries(files)
+        index = None if rebuild else TermbaseExactIndex.load()
+        if index is None or index.fingerprint != fingerprint:
+            index = TermbaseExactIndex()
+            index.build(entries, fingerprint)
+            if files:
+                index.save()
+        index.entries = entries
+        _index = index
+        return _index
+
+
+def termbase_exact_hit(name: str, direction: str) -> Optional[Dict[str, Any]]:
+    """
+    Exact-hit provider answering names recorded verbatim in the termbase.
+
+    Args:
+        name: Name being evaluated
+        direction: Direction key ("KO-EN" or "EN-KO")
+
+    Returns:
+        Dictionary with the notation and the workbook it came from, or None
+    """
+    hit = get_exact_index().lookup(name, direction)
+    if hit is None:
+        return None
+    entry = hit["entries"][-1]
+    return {
+        "notation": hit["notation"],
+        "source": f"{resource_label(entry['resource'])} ({entry['sheet']}, row {entry['row']})",
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build the exact termbase index and look names up"
+    )
+    parser.add_argument("names", nargs="*", help="Names to look up")
+    parser.add_argument(
+        "--direction", choices=sorted(DIRECTION_FIELDS), default="KO-EN"
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Rebuild the index from the workbooks"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    exact_index = get_exact_index(rebuild=args.rebuild)
+    print(
+        f"Exact termbase index: {len(exact_index)} entries, "
+        f"{len(exact_index.hashes)} keys ({time.perf_counter() - started:.2f}s)"
+    )
+    for query in args.names:
+        started = time.perf_counter()
+        found = termbase_exact_hit(query, args.direction)
+        elapsed = 1e6 * (time.perf_counter() - started)
+        if found:
+            print(
+                f"{query} → {found['notation']} [{found['source']}] ({elapsed:.0f}µs)"
+            )
+        else:
+            print(f"{query}: no unambiguous termbase notation ({elapsed:.0f}µs)")
@@ -0,0 +1,490 @@
+#!/usr/bin/env python
+"""
+Local Termbase Vector Index for CF Name Evaluation System.
+
+This module embeds the Hangul/Roman name pairs of the local resource
+workbooks (termbase_data) and keeps them in a persisted FAISS index, so every
+evaluator can retrieve the top-k prior notations for a name in milliseconds
+before prompting the model.
+
+Each entry is indexed twice, once under its Hangul form and once under its
+Roman form, so a query in either script finds it. Two embedding functions are
+available, chosen with TERMBASE_EMBEDDING:
+- "local" (default): an offline embedding of hashed character n-grams. Hangul
+  is decomposed into jamo first, so 지원 and 지운 share most of their n-grams.
+  No network access and no API key are needed.
+- "openai": OpenAI embeddings (TERMBASE_OPENAI_EMBEDDING_MODEL, optionally
+  shortened to TERMBASE_OPENAI_EMBEDDING_DIM dimensions) through
+  langchain-openai.
+
+The index is stored under the reports cache directory, tagged with the
+fingerprint of the workbooks and the embedding, model and vector dimension
+used, and rebuilt only when any of them changes. The entries it covers are
+not stored with it; they are read from the memory-mapped termbase columns.
+faiss-cpu is optional; without it the same vectors are searched with NumPy.
+
+The module includes:
+- The local and OpenAI embedding functions
+- A persisted inner-product index over the termbase entries
+- A process-wide index shared by the evaluators
+- Prompt formatting of the retrieved prior notations
+- A CLI for building the index and querying it
+"""
+
+import json
+import os
+import threading
+import unicodedata
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from name_normalization import normalize_name, split_name_pair
+from termbase_data import (
+    TermbaseEntries,
+    files_fingerprint,
+    load_termbase_entries,
+    resource_label,
+    termbase_files,
+)
+from terminologists_manual_links import CACHE_DIR
+
+# Import FAISS if available
+try:
+    import faiss
+
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Load environment variables
+load_dotenv()
+
+# Embedding function and its dimension (local embedding only)
+TERMBASE_EMBEDDING = os.environ.get("TERMBASE_EMBEDDING", "local")
+TERMBASE_EMBEDDING_DIM = int(os.environ.get("TERMBASE_EMBEDDING_DIM", "512"))
+TERMBASE_OPENAI_EMBEDDING_MODEL = os.environ.get(
+    "TERMBASE_OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
+)
+TERMBASE_OPENAI_EMBEDDING_DIM = (
+    int(os.environ["TERMBASE_OPENAI_EMBEDDING_DIM"])
+    if os.environ.get("TERMBASE_OPENAI_EMBEDDING_DIM")
+    else None
+)
+
+# Number of prior notations retrieved and the minimum cosine similarity kept
+TERMBASE_TOP_K = int(os.environ.get("TERMBASE_TOP_K", "5"))
+TERMBASE_MIN_SCORE = float(os.environ.get("TERMBASE_MIN_SCORE", "0.6"))
+
+# Location of the persisted index
+TERMBASE_INDEX_DIR = os.environ.get(
+    "TERMBASE_INDEX_DIR", os.path.join(CACHE_DIR, "termbase_index")
+)
+
+# Character n-gram lengths used by the local embedding
+NGRAM_SIZES = (1, 2, 3)
+
+Embedding = Callable[[List[str]], np.ndarray]
+
+
+def embedding_text(text: str) -> str:
+    """
+    Normalize a name for embedding.
+
+    Hangul syllables are decomposed into jamo, case is folded, and spaces,
+    hyphens and apostrophes are removed, so spelling variants of a name embed
+    close together.
+
+    Args:
+        text: Name in Hangul or Roman letters
+
+    Returns:
+        Normalized text
+    """
+    decomposed = unicodedata.normalize("NFD", text).casefold()
+    return "".join(ch for ch in decomposed if ch.isalnum())
+
+
+def local_embedding(texts: List[str]) -> np.ndarray:
+    """
+    Embed names offline as hashed character n-gram vectors.
+
+    Args:
+        texts: Names to embed
+
+    Returns:
+        Array of unit-length float32 vectors, one row per name
+    """
+    vectors = np.zeros((len(texts), TERMBASE_EMBEDDING_DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        padded = f"^{embedding_text(text)}$"
+        for size in NGRAM_SIZES:
+            for start in range(len(padded) - size + 1):
+                gram = padded[start : start + size].encode("utf-8")
+                vectors[row, zlib.crc32(gram) % TERMBASE_EMBEDDING_DIM] += 1.0
+    return _normalize_rows(vectors)
+
+
+def openai_embedding(texts: List[str]) -> np.ndarray:
+    """
+    Embed names with the OpenAI embeddings API.
+
+    Args:
+        texts: Names to embed
+
+    Returns:
+        Array of unit-length float32 vectors, one row per name
+    """
+    from langchain_openai import OpenAIEmbeddings
+
+    embeddings = OpenAIEmbeddings(
+        model=TERMBASE_OPENAI_EMBEDDING_MODEL, dimensions=TERMBASE_OPENAI_EMBEDDING_DIM
+    )
+    vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+    return _normalize_rows(vectors)
+
+
+EMBEDDINGS: Dict[str, Embedding] = {
+    "local": local_embedding,
+    "openai": openai_embedding,
+}
+
+
+def embedding_model(embedding: str) -> Optional[str]:
+    """Model behind an embedding function (None for the local embedding)."""
+    return TERMBASE_OPENAI_EMBEDDING_MODEL if embedding == "openai" else None
+
+
+def embedding_dimension(embedding: str) -> Optional[int]:
+    """Configured vector dimension of an embedding (None if the model decides)."""
+    return (
+        TERMBASE_EMBEDDING_DIM
+        if embedding == "local"
+        else TERMBASE_OPENAI_EMBEDDING_DIM
+    )
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class TermbaseIndex:
+    """Inner-product index over the Hangul and Roman forms of termbase entries."""
+
+    def __init__(self, embedding: str = TERMBASE_EMBEDDING):
+        """
+        Create an empty index.
+
+        Args:
+            embedding: Name of the embedding function in EMBEDDINGS
+        """
+        if embedding not in EMBEDDINGS:
+            raise ValueError(
+                f"Unknown termbase embedding '{embedding}'; "
+                f"use one of {', '.join(EMBEDDINGS)}"
+            )
+        self.embedding = embedding
+        self.embed = EMBEDDINGS[embedding]
+        self.model = embedding_model(embedding)
+        self.dimension = 0
+        self.entries = TermbaseEntries([])
+        self.owners = np.zeros(0, dtype=np.int64)
+        self.vectors: Optional[np.ndarray] = None
+        self.fingerprint = ""
+        self._faiss_index = None
+
+    def build(self, entries: TermbaseEntries, fingerprint: str = ""):
+        """
+        Embed entries and index them.
+
+        Args:
+            entries: Termbase entries from termbase_data
+            fingerprint: Fingerprint of the workbooks the entries came from
+        """
+        self.entries = entries
+        self.fingerprint = fingerprint
+        texts = [
+            form
+            for pair in zip(
+                entries.column("hangul").tolist(), entries.column("roman").tolist()
+            )
+            for form in pair
+        ]
+        self.owners = np.repeat(np.arange(len(entries), dtype=np.int64), 2)
+        self._set_vectors(
+            self.embed(texts)
+            if texts
+            else np.zeros((0, TERMBASE_EMBEDDING_DIM), dtype=np.float32)
+        )
+
+    def _set_vectors(self, vectors: np.ndarray):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.dimension = int(self.vectors.shape[1])
+        self._faiss_index = None
+        if FAISS_AVAILABLE and len(self.vectors):
+            self._faiss_index = faiss.IndexFlatIP(self.vectors.shape[1])
+            self._faiss_index.add(self.vectors)
+
+    def save(self, directory: str = TERMBASE_INDEX_DIR):
+        """
+        Persist the index.
+
+        The entries are not saved; they are attached again from termbase_data
+        when the index is loaded.
+
+        Args:
+            directory: Directory to write to
+        """
+        os.makedirs(directory, exist_ok=True)
+        faiss_path = os.path.join(directory, "termbase.faiss")
+        if self._faiss_index is not None:
+            faiss.write_index(self._faiss_index, faiss_path)
+        elif os.path.exists(faiss_path):
+            os.remove(faiss_path)
+        np.save(os.path.join(directory, "termbase_vectors.npy"), self.vectors)
+        metadata = {
+            "fingerprint": self.fingerprint,
+            "embedding": self.embedding,
+            "model": self.model,
+            "dimension": self.dimension,
+            "rows": len(self.entries),
+        }
+        with open(
+            os.path.join(directory, "termbase_entries.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(metadata, f, ensure_ascii=False)
+
+    @classmethod
+    def load(
+        cls, directory: str = TERMBASE_INDEX_DIR, embedding: str = TERMBASE_EMBEDDING
+    ) -> Optional["TermbaseIndex"]:
+        """
+        Load a persisted index, without its entries.
+
+        Args:
+            directory: Directory the index was saved to
+            embedding: Embedding the index must have been built with
+
+        Returns:
+            The index, or None if there is no usable index in the directory
+            (including one built with another embedding, model or dimension)
+        """
+        metadata_path = os.path.join(directory, "termbase_entries.json")
+        if not os.path.exists(metadata_path):
+            return None
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+            dimension = embedding_dimension(embedding)
+            if (
+                metadata.get("embedding") != embedding
+                or metadata.get("model") != embedding_model(embedding)
+                or (dimension is not None and metadata.get("dimension") != dimension)
+            ):
+                return None
+            index = cls(embedding)
+            index.dimension = int(metadata["dimension"])
+            index.owners = np.repeat(
+                np.arange(int(metadata["rows"]), dtype=np.int64), 2
+            )
+            index.fingerprint = metadata.get("fingerprint", "")
+            faiss_path = os.path.join(directory, "termbase.faiss")
+            if FAISS_AVAILABLE and os.path.exists(faiss_path):
+                index._faiss_index = faiss.read_index(faiss_path)
+                index.vectors = None
+            else:
+                index._set_vectors(
+                    np.load(
+                        os.path.join(directory, "termbase_vectors.npy"),
+                        mmap_mode="r",
+                    )
+                )
+            return index
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not load the termbase index from {directory}: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(
+        self, name: str, k: int = TERMBASE_TOP_K, min_score: float = TERMBASE_MIN_SCORE
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the entries most similar to a name.
+
+        A "Hangul (Roman)" pair is searched under both forms. A name recorded
+        in several rows with the same notation is returned once, from its
+        latest row, as in termbase_exact_index.
+
+        Args:
+            name: Name to look up
+            k: Maximum number of entries returned
+            min_score: Minimum cosine similarity of a returned entry
+
+        Returns:
+            Entries with a "score" key, most similar first
+        """
+        if not self.entries:
+            return []
+        hangul, roman = split_name_pair(normalize_name(name))
+        queries = [form for form in (hangul, roman) if form] or [name]
+        query_vectors = np.ascontiguousarray(self.embed(queries), dtype=np.float32)
+
+        # Each entry has two vectors and may repeat in later rows, so
+        # over-fetch before merging by entry and by name
+        fetch = min(4 * k, len(self.owners))
+        if self._faiss_index is not None:
+            scores, rows = self._faiss_index.search(query_vectors, fetch)
+        else:
+            similarity = query_vectors @ np.asarray(self.vectors).T
+            rows = np.argsort(-similarity, axis=1)[:, :fetch]
+            scores = np.take_along_axis(similarity, rows, axis=1)
+
+        best: Dict[int, float] = {}
+        for query_scores, query_rows in zip(scores, rows):
+            for score, row in zip(query_scores, query_rows):
+                if row < 0 or score < min_score:
+                    continue
+                owner = int(self.owners[row])
+                best[owner] = max(best.get(owner, 0.0), float(score))
+
+        # Keep one entry per (hangul, roman) pair: the latest row, best score
+        merged: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        for owner, score in best.items():
+            entry = self.entries[owner]
+            key = (normalize_name(entry["hangul"]), normalize_name(entry["roman"]))
+            latest, top = merged.get(key, (owner, score))
+            merged[key] = (max(latest, owner), max(top, score))
+
+        ranked = sorted(merged.values(), key=lambda item: item[1], reverse=True)[:k]
+        return [dict(self.entries[i], score=round(score, 3)) for i, score in ranked]
+
+
+_index: Optional[TermbaseIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_termbase_index(rebuild: bool = False) -> TermbaseIndex:
+    """
+    Get the process-wide termbase index, building it if it is out of date.
+
+    The persisted index is reused while the workbooks and the embedding are
+    unchanged; otherwise the workbooks are read and the index is rebuilt and
+    saved.
+
+    Args:
+        rebuild: Rebuild the index even if the persisted one is current
+
+    Returns:
+        The termbase index (empty when no local workbooks exist)
+    """
+    global _index
+    with _index_lock:
+        files = termbase_files()
+        fingerprint = files_fingerprint(files) if files else ""
+        if not rebuild and _index is not None and _index.fingerprint == fingerprint:
+            return _index
+
+        entries = load_termbase_entries(files)
+        index = None if rebuild else TermbaseIndex.load()
+        if index is not None:
+            index.entries = entries
+            if index.fingerprint != fingerprint or not _dimension_matches(index):
+                index = None
+        if index is None:
+            index = TermbaseIndex()
+            index.build(entries, fingerprint)
+            if files:
+                index.save()
+        _index = index
+        return _index
+
+
+def _dimension_matches(index: TermbaseIndex) -> bool:
+    """
+    Check a loaded index against the vectors its embedding now returns.
+
+    Only needed when the dimension is left to the embedding model, and costs
+    one embedding of a single name.
+    """
+    if embedding_dimension(index.embedding) is not None or not index.entries:
+        return True
+    probe = index.entries[0]["roman"] or index.entries[0]["hangul"]
+    return index.embed([probe]).shape[1] == index.dimension
+
+
+def retrieve_prior_notations(
+    name: str, k: int = TERMBASE_TOP_K
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve the prior notations most similar to a name.
+
+    Args:
+        name: Name being evaluated
+        k: Maximum number of notations returned
+
+    Returns:
+        Termbase entries with similarity scores, most similar first; empty if
+        there is no local termbase or the lookup fails
+    """
+    try:
+        return get_termbase_index().search(name, k)
+    except Exception as e:
+        print(f"Termbase lookup failed for {name}: {e}")
+        return []
+
+
+def format_prior_notations(matches: List[Dict[str, Any]]) -> str:
+    """
+    Format retrieved prior notations for an evaluation prompt.
+
+    Args:
+        matches: Result of retrieve_prior_notations
+
+    Returns:
+        Prompt text listing the prior notations
+    """
+    if not matches:
+        return "LOCAL TERMBASE:\n- No similar prior notations\n"
+    lines = "".join(
+        f"- {match['hangul']} = {match['roman']} "
+        f"({resource_label(match['resource'])}, similarity {match['score']:.2f})\n"
+        for match in matches
+    )
+    return f"LOCAL TERMBASE (prior notations of similar names, closest first):\n{lines}"
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(
+        description="Build and query the local termbase index"
+    )
+    parser.add_argument("names", nargs="*", help="Names to look up")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Rebuild the index from the workbooks"
+    )
+    parser.add_argument(
+        "-k", type=int, default=TERMBASE_TOP_K, help="Number of notations to show"
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    termbase_index = get_termbase_index(rebuild=args.rebuild)
+    print(
+        f"Termbase index: {len(termbase_index)} entries, "
+        f"{termbase_index.embedding} embedding, "
+        f"{'FAISS' if FAISS_AVAILABLE else 'NumPy'} search "
+        f"({time.perf_counter() - started:.2f}s)"
+    )
+    for query in args.names:
+        started = time.perf_counter()
+        found = termbase_index.search(query, args.k)
+        print(f"\n{query} ({1000 * (time.perf_counter() - started):.1f}ms)")
+        print(format_prior_notations(found), end="")
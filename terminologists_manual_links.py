@@ -14,6 +14,7 @@ The module includes:
 - Specialized resources for Korean name romanization
 - Resources for verification of different name types (people, places, organizations)
 - Function to display resources in a formatted manner
+- A fingerprint of the resources for invalidating cached evaluations
 
 Maintaining this central registry of resources ensures that all parts of the name
 evaluation system reference consistent and up-to-date verification sources, and
@@ -21,6 +22,8 @@ makes it easy for terminologists to discover and access the appropriate resource
 for their verification tasks.
 """
 
+import hashlib
+import json
 import os
 from typing import Dict, List, Optional
 
@@ -33,6 +36,9 @@ MANUAL_FILE_PATH = os.path.join(
 )
 MANUAL_LINKS_PATH = os.path.join(DATA_DIR, "terminologists_manual_links.txt")
 
+# Directory for local caches and indexes (Teamwork task index, result caches)
+CACHE_DIR = os.environ.get("CF_CACHE_DIR", os.path.join("reports", ".cache"))
+
 # Internal CF Resources
 CF_INTERNAL_RESOURCES = {
     "teamwork": {
@@ -353,6 +359,26 @@ def get_verification_process_text(direction: str) -> str:
     return text
 
 
+def get_resources_fingerprint() -> str:
+    """
+    Get a fingerprint of the verification resources and manual links.
+
+    The fingerprint changes whenever a resource entry or the manual links file
+    changes, so caches of evaluations that were prompted with these resources
+    can tell when they are out of date.
+
+    Returns:
+        Hex digest identifying the current resources
+    """
+    digest = hashlib.sha256(
+        json.dumps(ALL_RESOURCES, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    )
+    if os.path.exists(MANUAL_LINKS_PATH):
+        with open(MANUAL_LINKS_PATH, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
 def load_manual_content() -> str:
     """
     Load the content of the CF Terminology Management Manual from the data directory.
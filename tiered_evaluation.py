@@ -0,0 +1,400 @@
+#!/usr/bin/env python
+"""
+Tiered Evaluation Pipeline for CF Name Evaluation System.
+
+This module sends each name through progressively more expensive tiers and
+stops at the first tier that can settle it, so the full LLM prompt only runs
+for the names that need it:
+
+1. Exact hit: a registered provider already knows a verified notation for
+   the name. Providers are registered per direction; the built-in ones answer
+   names recorded verbatim in the local termbase workbooks and accept a
+   previous compliant "Name Evaluation" task for the same name in Teamwork.
+   A bare source-language name is answered with the known notation; a pair
+   such as "김지원 (Kim Ji-won)" is accepted only when its notation is the
+   known one, and is otherwise non-compliant with the known notation as the
+   recommendation.
+2. Local rules: the direction's deterministic evaluator (the KO-EN rule engine
+   with the reference romanization, the EN-KO exception dictionary) is
+   confident about the name.
+3. LLM: everything else goes to the direction's evaluator, concurrently and
+   under the OpenAI rate limits. The similar known names given to the model
+   are looked up for all of these names in one batch first.
+
+Every name is counted under the tier that settled it, with its latency
+recorded in a per-tier histogram, so a run reports how much of the batch
+needed the model and how long each tier took.
+
+The module includes:
+- A registry of exact-hit providers per direction
+- Thread-safe per-tier counters and latency histograms
+- The tiered batch runner used by name_eval_system.process_names
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+
+from concurrent_evaluation import MAX_CONCURRENCY, print_throughput, run_concurrently
+from name_normalization import normalize_name, split_name_pair
+from name_similarity import find_similar_names_batch
+from termbase_exact_index import termbase_exact_hit
+
+# Import Teamwork integration if available
+try:
+    from teamwork_integration import (
+        evaluation_task_title,
+        verify_name_in_teamwork,
+        verify_names_in_teamwork,
+    )
+
+    TEAMWORK_AVAILABLE = True
+except ImportError:
+    TEAMWORK_AVAILABLE = False
+
+# Load environment variables
+load_dotenv()
+
+# Tiers in the order they are tried ("resumed" counts results reused from an
+# interrupted run; "rules" and "dictionary" are the local tiers of KO-EN and
+# EN-KO)
+TIERS = ("resumed", "exact", "rules", "dictionary", "llm")
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = (1, 10, 100, 1000, 10000)
+
+# Result field holding the recommended notation for each direction
+NOTATION_FIELDS = {"KO-EN": "english_notation", "EN-KO": "korean_notation"}
+
+# An exact-hit provider maps (name, direction) to a known notation, as a
+# dictionary with "notation" and "source" keys, or None
+ExactProvider = Callable[[str, str], Optional[Dict[str, Any]]]
+
+EXACT_PROVIDERS: Dict[str, List[Tuple[str, ExactProvider]]] = {
+    "KO-EN": [],
+    "EN-KO": [],
+}
+_providers_lock = threading.Lock()
+
+
+def register_exact_provider(direction: str, label: str, provider: ExactProvider):
+    """
+    Register a source of verified notations for the exact-hit tier.
+
+    Args:
+        direction: Direction key ("KO-EN" or "EN-KO")
+        label: Short name of the source, recorded in results
+        provider: Function returning {"notation", "source"} for a known name
+    """
+    with _providers_lock:
+        providers = EXACT_PROVIDERS.setdefault(direction, [])
+        providers[:] = [(l, p) for l, p in providers if l != label]
+        providers.append((label, provider))
+
+
+def teamwork_exact_hit(name: str, direction: str) -> Optional[Dict[str, Any]]:
+    """
+    Find a previous compliant evaluation of exactly this name in Teamwork.
+
+    Args:
+        name: Name being evaluated
+        direction: Direction key (unused; evaluations record their notation)
+
+    Returns:
+        Dictionary with the notation and the task URL, or None
+    """
+    if not (TEAMWORK_AVAILABLE and os.environ.get("TEAMWORK_API_KEY")):
+        return None
+    verification = verify_name_in_teamwork(name)
+    for evaluation in verification.get("previous_evaluations") or []:
+        if (
+            evaluation.get("title") == evaluation_task_title(name)
+            and evaluation.get("compliant")
+            and evaluation.get("notation")
+        ):
+            return {
+                "notation": evaluation["notation"],
+                "source": evaluation.get("url") or "Teamwork",
+            }
+    return None
+
+
+for _direction in ("KO-EN", "EN-KO"):
+    register_exact_provider(_direction, "termbase", termbase_exact_hit)
+    register_exact_provider(_direction, "teamwork", teamwork_exact_hit)
+
+
+class TierStats:
+    """Per-tier counters and latency histograms for one run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+        self.histograms: Dict[str, List[int]] = {}
+
+    def record(self, tier: str, seconds: float):
+        """
+        Count one name settled by a tier.
+
+        Args:
+            tier: Tier that settled the name
+            seconds: Time spent on the name
+        """
+        milliseconds = seconds * 1000
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        with self._lock:
+            self.counts[tier] = self.counts.get(tier, 0) + 1
+            self.seconds[tier] = self.seconds.get(tier, 0.0) + seconds
+            histogram = self.histograms.setdefault(
+                tier, [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            )
+            histogram[bucket] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the run.
+
+        Returns:
+            Dictionary with the count, mean latency and latency histogram of
+            each tier, keyed by tier
+        """
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [
+            f">{LATENCY_BUCKETS_MS[-1]}ms"
+        ]
+        with self._lock:
+            ordered = sorted(
+                self.counts,
+                key=lambda tier: TIERS.index(tier) if tier in TIERS else len(TIERS),
+            )
+            return {
+                tier: {
+                    "count": self.counts[tier],
+                    "mean_ms": round(1000 * self.seconds[tier] / self.counts[tier], 1),
+                    "histogram": dict(zip(labels, self.histograms[tier])),
+                }
+                for tier in ordered
+            }
+
+    def print_summary(self):
+        """Print how many names each tier settled and how long they took."""
+        summary = self.summary()
+        total = sum(tier["count"] for tier in summary.values())
+        if not total:
+            return
+        print("Evaluation tiers:")
+        for tier, data in summary.items():
+            buckets = ", ".join(
+                f"{label}: {count}"
+                for label, count in data["histogram"].items()
+                if count
+            )
+            print(
+                f"  {tier}: {data['count']} names ({100 * data['count'] / total:.0f}%), "
+                f"mean {data['mean_ms']}ms [{buckets}]"
+            )
+
+
+def submitted_notation(name: str, direction: str) -> Optional[str]:
+    """
+    Get the target-language notation submitted along with a name.
+
+    Args:
+        name: Name being evaluated
+        direction: Direction key ("KO-EN" or "EN-KO")
+
+    Returns:
+        The Roman side of a KO-EN pair or the Hangul side of an EN-KO pair,
+        or None for a name written only in its source language
+    """
+    hangul, roman = split_name_pair(normalize_name(name))
+    if hangul is None or roman is None:
+        return None
+    return roman if direction == "KO-EN" else hangul
+
+
+def exact_hit(
+    name: str, direction: str, check_teamwork: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a result from the first exact-hit provider that knows the name.
+
+    A submitted notation is accepted only when it is written exactly as the
+    known one; any other spelling, hyphenation or capitalization makes the
+    result non-compliant with the known notation as its recommendation.
+
+    Args:
+        name: Name being evaluated
+        direction: Direction key ("KO-EN" or "EN-KO")
+        check_teamwork: Whether the Teamwork provider may be used
+
+    Returns:
+        Evaluation result settled by the known notation, or None
+    """
+    with _providers_lock:
+        providers = list(EXACT_PROVIDERS.get(direction, []))
+
+    submitted = submitted_notation(name, direction)
+    for label, provider in providers:
+        if label == "teamwork" and not check_teamwork:
+            continue
+        try:
+            hit = provider(name, direction)
+        except Exception as e:
+            print(f"Exact-hit provider '{label}' failed for {name}: {e}")
+            continue
+        if not hit:
+            continue
+        notation = hit["notation"]
+        result = {
+            "name": name,
+            NOTATION_FIELDS.get(direction, "notation"): notation,
+            "compliant": True,
+            "overall_score": 100,
+            "recommendations": [],
+            "verification_sources": [hit.get("source") or label],
+            "notes": f"Accepted from a verified {label} record.",
+            "evaluation_tier": "exact",
+            "exact_source": label,
+        }
+        if submitted is not None and submitted != normalize_name(notation):
+            result.update(
+                {
+                    "compliant": False,
+                    "overall_score": 0,
+                    "recommendations": [
+                        f"Use the verified notation '{notation}' instead of "
+                        f"'{submitted}'"
+                    ],
+                    "notes": f"The submitted notation '{submitted}' differs from "
+                    f"the verified {label} record '{notation}'.",
+                }
+            )
+        return result
+    return None
+
+
+def evaluate_tiered(
+    names: Sequence[str],
+    direction: str,
+    evaluate_one: Callable[[str, bool], Dict[str, Any]],
+    evaluate_locally: Optional[Callable[..., Optional[Dict[str, Any]]]] = None,
+    check_teamwork: bool = True,
+    max_concurrency: int = MAX_CONCURRENCY,
+    stats: Optional[TierStats] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate names tier by tier, sending only unsettled names to the LLM.
+
+    Args:
+        names: Names to evaluate
+        direction: Direction key ("KO-EN" or "EN-KO")
+        evaluate_one: Direction's full evaluator, called as
+                      evaluate_one(name, check_teamwork, local_tiers=False,
+                      similar_names=...) so it does not repeat the tiers
+                      already tried here or the similar-name lookup
+        evaluate_locally: Direction's deterministic evaluator, returning a
+                          result when it is confident and None otherwise
+        check_teamwork: Whether to use Teamwork records
+        max_concurrency: Maximum number of LLM evaluations in flight at once
+        stats: Counters to record into (a new TierStats if omitted)
+        on_result: Function called with (position, result) as soon as each
+                   name is settled, in completion order
+
+    Returns:
+        Results in the same order as names
+    """
+    stats = stats if stats is not None else TierStats()
+    teamwork_enabled = (
+        check_teamwork
+        and TEAMWORK_AVAILABLE
+        and bool(os.environ.get("TEAMWORK_API_KEY"))
+    )
+
+    # Verify the whole batch in Teamwork up front so the per-name lookups of
+    # every tier are served from the verification cache
+    if teamwork_enabled:
+        try:
+            verify_names_in_teamwork(list(names))
+        except Exception as e:
+            print(f"Batch Teamwork verification failed: {e}")
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(names)
+    pending: List[int] = []
+    for i, name in enumerate(names):
+        started = time.perf_counter()
+        result = exact_hit(name, direction, check_teamwork)
+        if result is None and evaluate_locally is not None:
+            teamwork_results = None
+            if teamwork_enabled:
+                teamwork_results = verify_name_in_teamwork(name)
+            result = evaluate_locally(name, teamwork_results)
+            if result is not None:
+                result.setdefault("evaluation_tier", "rules")
+        if result is None:
+            pending.append(i)
+            continue
+        results[i] = result
+        stats.record(result["evaluation_tier"], time.perf_counter() - started)
+        if on_result is not None:
+            on_result(i, result)
+
+    similar: Dict[int, List[Dict[str, Any]]] = {}
+    if pending:
+        print(
+            f"{len(names) - len(pending)} of {len(names)} names settled locally, "
+            f"{len(pending)} sent to the LLM"
+        )
+        similar = dict(
+            zip(pending, find_similar_names_batch([names[i] for i in pending]))
+        )
+
+    def evaluate_pending(i: int) -> Dict[str, Any]:
+        started = time.perf_counter()
+        print(f"Evaluating '{names[i]}'...")
+        result = evaluate_one(
+            names[i], check_teamwork, local_tiers=False, similar_names=similar[i]
+        )
+        if hasattr(result, "model_dump"):
+            result = result.model_dump()
+        stats.record(
+            result.get("evaluation_tier") or "llm", time.perf_counter() - started
+        )
+        return result
+
+    def evaluation_error(i: int, e: Exception) -> Dict[str, Any]:
+        print(f"Error evaluating {names[i]}: {e}")
+        stats.record("error", 0.0)
+        return {
+            "name": names[i],
+            "error": str(e),
+            "compliant": False,
+            "overall_score": 0,
+            "evaluation_tier": "error",
+        }
+
+    started = time.perf_counter()
+    evaluated = run_concurrently(
+        evaluate_pending,
+        pending,
+        max_concurrency=max_concurrency,
+        on_error=evaluation_error,
+        on_result=(
+            None
+            if on_result is None
+            else lambda j, result: on_result(pending[j], result)
+        ),
+    )
+    for i, result in zip(pending, evaluated):
+        results[i] = result
+    if pending:
+        print_throughput(len(pending), started, label="LLM evaluations")
+
+    return results